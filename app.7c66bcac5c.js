@@ -0,0 +1,3146 @@
+
+        // Question content and structure: the build's data file, loaded by
+        // the page before this script runs
+        const ccseData = window.ccseData;
+
+        let revealedCount = 0;
+        const totalQuestions = ccseData.allQuestionNumbers.length;
+
+        // All question numbers for quiz mode
+        const allQuestionNumbers = ccseData.allQuestionNumbers;
+
+        // Question numbers of each section, and the section of each question
+        const sectionQuestions = ccseData.sectionQuestions;
+        const questionSection = {};
+        Object.entries(sectionQuestions).forEach(([section, nums]) => {
+            nums.forEach(qNum => { questionSection[qNum] = parseInt(section); });
+        });
+
+        // Spanish and Russian title of each section
+        const sectionTitles = ccseData.sectionTitles;
+
+        // ==========================================
+        // CARD RENDERING
+        // ==========================================
+
+        // Question content by number; cards are built from it on demand
+        const questionData = ccseData.questionData;
+
+        // Question data is plain text: escape it wherever it goes into markup
+        const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+        function escapeHtml(text) {
+            return String(text).replace(/[&<>"']/g, ch => HTML_ESCAPES[ch]);
+        }
+
+        // Inner markup of one question card
+        function renderCard(qNum) {
+            const data = questionData[qNum];
+            const correctClass = opt => opt.label === data.correct ? 'correct' : '';
+            const printOptions = data.options.map(opt =>
+                `<div class="print-option ${correctClass(opt)}">${escapeHtml(opt.label)}) ${escapeHtml(opt.text)}</div>`).join('');
+            const ruOptions = data.ruOptions.map(opt =>
+                `<div class="ru-option ${correctClass(opt)}">${escapeHtml(opt.label)}) ${escapeHtml(opt.text)}</div>`).join('');
+            const options = data.options.map(opt => `
+                    <button class="option" data-action="select" data-label="${escapeHtml(opt.label)}">
+                        ${escapeHtml(opt.label)}) ${escapeHtml(opt.text)}
+                    </button>`).join('');
+
+            return `
+            <div class="score-indicator not-attempted" id="indicator${qNum}" title="Sin responder">
+                <span class="score-tooltip">Sin responder</span>
+            </div>
+            <div class="print-columns">
+                <div class="print-spanish">
+                    <div class="q-number">#${qNum}</div>
+                    <div class="question">${escapeHtml(data.q)}</div>
+                    <div class="print-options">${printOptions}</div>
+                </div>
+                <div class="print-russian">
+                    <div class="q-number-ru">#${qNum}</div>
+                    <div class="question-ru">${escapeHtml(data.ruQ)}</div>
+                    <div class="ru-options">${ruOptions}</div>
+                </div>
+            </div>
+            <div class="screen-only">
+                <div class="q-number">#${qNum}</div>
+                <div class="question">${escapeHtml(data.q)}</div>
+                <div class="options-container">
+                    ${options}
+                    <div class="result" id="result${qNum}"></div>
+                </div>
+                <div class="buttons">
+                    <button class="btn translate" data-action="translate">Перевод</button>
+                    <button class="btn explain" data-action="explain">Объяснение</button>
+                </div>
+                <div class="translation" id="trans${qNum}"></div>
+                <div class="explanation" id="expl${qNum}"></div>
+            </div>`;
+        }
+
+        // Card buttons name what they do in data-action; one listener on the
+        // list handles them all, whichever cards are mounted
+        const CARD_ACTIONS = {
+            select: (button, qNum, card) => selectOption(button, qNum, button.dataset.label, card.dataset.correct),
+            translate: (button, qNum) => toggleTranslate(qNum),
+            explain: (button, qNum) => toggleExplain(qNum),
+        };
+
+        document.getElementById('questionList').addEventListener('click', event => {
+            const button = event.target.closest('[data-action]');
+            const card = button && button.closest('.question-card');
+            if (!card) return;
+            CARD_ACTIONS[button.dataset.action](button, Number(card.dataset.q), card);
+        });
+
+        // Questions whose translation / explanation panel is open, so recycled cards reopen them
+        const openPanels = { translation: new Set(), explanation: new Set() };
+
+        // Bring a freshly rendered card up to date with the current mode
+        function restoreCardState(card, qNum) {
+            progress.shownAt.set(qNum, Date.now());
+            if (quizMode.active) {
+                const answer = quizMode.session.answers[qNum];
+                card.querySelectorAll('.option').forEach(opt => {
+                    if (opt.dataset.label === answer) opt.classList.add('selected-quiz');
+                });
+            } else {
+                applyStudyState(qNum);
+            }
+            if (practiceMode.active) card.classList.add('practice-visible');
+            if (openPanels.translation.has(qNum)) showTranslation(qNum);
+            if (openPanels.explanation.has(qNum)) showExplanation(qNum);
+            highlightMatches(card.querySelector('.screen-only'));
+            updateScoreIndicator(qNum);
+        }
+
+        // The card element of a question, or null while it is outside the rendered window
+        function getCard(qNum) {
+            return document.getElementById('q' + qNum);
+        }
+
+        // ==========================================
+        // VIRTUAL QUESTION LIST
+        // ==========================================
+
+        // The list is a sequence of logical entries (section headers and questions).
+        // Only the entries within `overscan` px of the viewport are in the DOM; the
+        // rest are stood in for by the list's padding, computed from each entry's
+        // measured height (or an estimate until it has been on screen). Elements
+        // that leave the window are pooled and reused for the next entries.
+        const ESTIMATED_HEIGHTS = { section: 150, question: 360 };
+        const measuredHeights = new Map(); // 's1' / 'q1001' -> px, kept across list changes
+        const studyList = {
+            entries: [],            // {type: 'section', section} | {type: 'question', qNum, position, header}
+            questions: [],          // question numbers in list order
+            positions: new Map(),   // qNum -> entry index
+            offsets: [0],           // offsets[i] = top of entry i, offsets[n] = total height
+            mounted: new Map(),     // entry index -> element
+            pool: { section: [], question: [] },
+            gap: document.createElement('div'),
+            overscan: 800,
+            printing: false,
+            frame: null,
+            settle: null,
+        };
+
+        function entryHeight(entry) {
+            const key = entry.type === 'section' ? 's' + entry.section : 'q' + entry.qNum;
+            return measuredHeights.get(key) || ESTIMATED_HEIGHTS[entry.type];
+        }
+
+        function computeOffsets() {
+            const offsets = [0];
+            studyList.entries.forEach((entry, i) => offsets.push(offsets[i] + entryHeight(entry)));
+            studyList.offsets = offsets;
+        }
+
+        // Index of the entry at list offset y
+        function findEntry(y) {
+            const offsets = studyList.offsets;
+            let lo = 0;
+            let hi = studyList.entries.length - 1;
+            while (lo < hi) {
+                const mid = (lo + hi + 1) >> 1;
+                if (offsets[mid] <= y) lo = mid;
+                else hi = mid - 1;
+            }
+            return lo;
+        }
+
+        // Show these questions in this order, grouped under section headers unless withSections is false
+        function setStudyList(qNums, withSections = true) {
+            const entries = [];
+            const positions = new Map();
+            let header;
+            qNums.forEach((qNum, position) => {
+                const section = questionSection[qNum];
+                if (withSections && (header === undefined || entries[header].section !== section)) {
+                    header = entries.length;
+                    entries.push({ type: 'section', section });
+                }
+                positions.set(qNum, entries.length);
+                entries.push({ type: 'question', qNum, position, header });
+            });
+
+            Array.from(studyList.mounted.keys()).forEach(unmountEntry);
+            studyList.entries = entries;
+            studyList.questions = qNums.slice();
+            studyList.positions = positions;
+            computeOffsets();
+            renderStudyList();
+        }
+
+        function mountEntry(entry) {
+            const el = studyList.pool[entry.type].pop() || document.createElement('div');
+            el.removeAttribute('style');
+            if (entry.type === 'section') {
+                const [esTitle, ruTitle] = sectionTitles[entry.section];
+                el.className = 'section-header';
+                el.innerHTML = `
+            <h2>${escapeHtml(esTitle)}</h2>
+            <p class="section-ru">${escapeHtml(ruTitle)}</p>`;
+            } else {
+                el.className = 'question-card';
+                el.id = 'q' + entry.qNum;
+                el.dataset.q = entry.qNum;
+                el.dataset.correct = questionData[entry.qNum].correct;
+                el.innerHTML = renderCard(entry.qNum);
+            }
+            return el;
+        }
+
+        function unmountEntry(index) {
+            const el = studyList.mounted.get(index);
+            studyList.mounted.delete(index);
+            el.remove();
+            el.removeAttribute('id');
+            studyList.pool[el.classList.contains('section-header') ? 'section' : 'question'].push(el);
+        }
+
+        function marginTop(el) {
+            return parseFloat(getComputedStyle(el).marginTop) || 0;
+        }
+
+        // Record the real heights of the mounted entries; returns how much the
+        // entries above the viewport grew, so the caller can keep the view still
+        function measureMounted(list, first, last, header) {
+            const anchor = findEntry(-list.getBoundingClientRect().top);
+            const measure = (index, height) => {
+                const entry = studyList.entries[index];
+                const delta = height - entryHeight(entry);
+                if (height <= 0 || Math.abs(delta) < 1) return 0;
+                measuredHeights.set(entry.type === 'section' ? 's' + entry.section : 'q' + entry.qNum, height);
+                return index < anchor ? delta : 0;
+            };
+
+            // Distance between consecutive tops counts collapsed margins exactly once
+            let shift = 0;
+            if (header !== null) {
+                shift += measure(header, studyList.gap.getBoundingClientRect().top -
+                    studyList.mounted.get(header).getBoundingClientRect().top);
+            }
+            const tops = [];
+            for (let i = first; i <= last; i++) tops.push(studyList.mounted.get(i).getBoundingClientRect().top);
+            for (let i = first; i < last; i++) shift += measure(i, tops[i - first + 1] - tops[i - first]);
+            const lastEl = studyList.mounted.get(last);
+            shift += measure(last, lastEl.getBoundingClientRect().height +
+                (parseFloat(getComputedStyle(lastEl).marginBottom) || 0));
+
+            computeOffsets();
+            return shift;
+        }
+
+        // Mount the entries near the viewport and recycle the rest
+        function renderStudyList() {
+            studyList.frame = null;
+            const list = document.getElementById('questionList');
+            const entries = studyList.entries;
+            const mounted = studyList.mounted;
+
+            let first = 0;
+            let last = entries.length - 1;
+            if (!studyList.printing && entries.length > 0) {
+                const top = -list.getBoundingClientRect().top;
+                first = findEntry(top - studyList.overscan);
+                last = findEntry(top + window.innerHeight + studyList.overscan);
+            }
+
+            // The header of the topmost section stays mounted so it can stick to the top
+            let header = entries.length > 0 && entries[first].header !== undefined ? entries[first].header : null;
+            if (header === first - 1) first = header;
+            if (header !== null && header >= first) header = null;
+
+            Array.from(mounted.keys()).forEach(index => {
+                if (index !== header && (index < first || index > last)) unmountEntry(index);
+            });
+            if (header === null) studyList.gap.remove();
+
+            const fresh = [];
+            const mount = index => {
+                if (!mounted.has(index)) {
+                    mounted.set(index, mountEntry(entries[index]));
+                    fresh.push(index);
+                }
+                return mounted.get(index);
+            };
+            const children = header !== null ? [mount(header), studyList.gap] : [];
+            for (let i = first; i <= last; i++) children.push(mount(i));
+
+            // Insert new elements in place, keeping DOM order = list order
+            let prev = null;
+            children.forEach(el => {
+                const next = prev ? prev.nextSibling : list.firstChild;
+                if (el !== next) list.insertBefore(el, next);
+                prev = el;
+            });
+            fresh.forEach(index => {
+                const entry = entries[index];
+                if (entry.type === 'question') restoreCardState(mounted.get(index), entry.qNum);
+            });
+
+            if (studyList.printing || entries.length === 0) {
+                list.style.paddingTop = '0px';
+                list.style.paddingBottom = '0px';
+                studyList.gap.style.height = '0px';
+                return;
+            }
+
+            const shift = measureMounted(list, first, last, header);
+            const offsets = studyList.offsets;
+            const start = header !== null ? header : first;
+            list.style.paddingTop = Math.max(0, offsets[start] - marginTop(mounted.get(start))) + 'px';
+            if (header !== null) studyList.gap.style.height = (offsets[first] - offsets[header + 1]) + 'px';
+            list.style.paddingBottom = (offsets[entries.length] - offsets[last + 1]) + 'px';
+            if (shift) window.scrollBy(0, shift);
+        }
+
+        function scheduleStudyListRender() {
+            if (!studyList.frame) studyList.frame = requestAnimationFrame(renderStudyList);
+        }
+
+        window.addEventListener('scroll', scheduleStudyListRender, { passive: true });
+        window.addEventListener('resize', scheduleStudyListRender);
+
+        // Scroll a question of the list to the middle of the viewport
+        function scrollToQuestion(qNum, behavior = 'smooth') {
+            const index = studyList.positions.get(qNum);
+            if (index === undefined) return;
+            const list = document.getElementById('questionList');
+            const height = studyList.offsets[index + 1] - studyList.offsets[index];
+            const top = list.getBoundingClientRect().top + window.scrollY + studyList.offsets[index];
+            window.scrollTo({ top: top - (window.innerHeight - height) / 2, behavior });
+
+            // Cards on the way may be taller or shorter than estimated; settle on the real one
+            clearTimeout(studyList.settle);
+            studyList.settle = setTimeout(() => {
+                const card = getCard(qNum);
+                if (card) card.scrollIntoView({ behavior: 'smooth', block: 'center' });
+            }, behavior === 'smooth' ? 600 : 50);
+        }
+
+        // Printing lays out every entry
+        function mountAllForPrint() {
+            studyList.printing = true;
+            renderStudyList();
+        }
+
+        window.addEventListener('beforeprint', mountAllForPrint);
+        window.addEventListener('afterprint', () => {
+            studyList.printing = false;
+            renderStudyList();
+        });
+
+        // Quiz toggle button update
+        function updateQuizToggleButton() {
+            const toggleBtn = document.getElementById('quizToggleBtn');
+            const toggleText = document.getElementById('quizToggleText');
+
+            if (!toggleBtn || !toggleText) return;
+
+            // Check if quizMode is defined and active
+            const isQuizActive = typeof quizMode !== 'undefined' && (quizMode.active || document.body.classList.contains('quiz-mode'));
+
+            if (isQuizActive) {
+                // In quiz mode - show "Study Mode" button
+                toggleText.textContent = t('studyMode');
+                toggleBtn.onclick = exitQuiz;
+            } else {
+                // In study mode - show "Quiz Mode" button
+                toggleText.textContent = t('quizMode');
+                toggleBtn.onclick = openQuizConfig;
+            }
+        }
+
+        function toggleQuizMode() {
+            if (typeof quizMode !== 'undefined' && (quizMode.active || document.body.classList.contains('quiz-mode'))) {
+                exitQuiz();
+            } else {
+                openQuizConfig();
+            }
+        }
+
+        // Language translations
+        const translations = {
+            es: {
+                // Header
+                title: 'CCSE 2026',
+                subtitle: 'Preguntas de Ciudadanía Española',
+                questionsAnswered: 'preguntas respondidas',
+                searchPlaceholder: 'Buscar pregunta...',
+
+                // Buttons
+                quizMode: 'Modo Examen',
+                printAll: 'Imprimir todo',
+                printUnanswered: 'Imprimir sin responder',
+                darkMode: 'Modo oscuro',
+                lightMode: 'Modo claro',
+                translate: 'Перевод',
+                explain: 'Объяснение',
+
+                // Quiz config modal
+                configureExam: 'Configurar Examen',
+                questionSelection: 'Selección de preguntas:',
+                fullExam: 'Examen completo (%d preguntas)',
+                bySection: 'Por sección:',
+                quickPractice: 'Práctica rápida:',
+                questions: 'preguntas',
+                randomOrder: 'Orden aleatorio',
+                timer: 'Temporizador:',
+                noTimer: 'Sin temporizador',
+                fullTimer: '45 minutos (examen completo)',
+                proportionalTimer: 'Proporcional al número de preguntas',
+                cancel: 'Cancelar',
+                startExam: 'Iniciar Examen',
+
+                // Quiz interface
+                question: 'Pregunta',
+                answered: 'respondidas',
+                previous: 'Anterior',
+                next: 'Siguiente',
+                finishExam: 'Terminar Examen',
+                exit: 'Salir',
+
+                // Results
+                passed: 'APROBADO',
+                failed: 'NO APROBADO',
+                correctAnswers: 'respuestas correctas',
+                time: 'Tiempo:',
+                sectionPerformance: 'Rendimiento por sección',
+                reviewQuestions: 'Revisar Preguntas',
+                newExam: 'Nuevo Examen',
+                studyMode: 'Modo Estudio',
+                detailedReview: 'Revisión Detallada',
+                correct: 'Correcta',
+                incorrect: 'Incorrecta',
+                yourAnswer: 'Tu respuesta:',
+                correctAnswer: 'Respuesta correcta:',
+                notAnswered: 'No respondida',
+
+                // Navigation
+                index: 'Índice',
+                home: 'Inicio',
+                nextUnanswered: 'Próxima',
+
+                // Alerts
+                confirmFinish: '¿Estás seguro de que quieres terminar el examen?',
+                unansweredQuestions: 'Tienes',
+                questionsUnanswered: 'pregunta(s) sin responder.',
+                confirmExit: '¿Seguro que quieres salir del examen? Se perderá tu progreso.',
+                timeExpired: '¡Tiempo agotado! El examen se enviará automáticamente.',
+                continueExam: '¿Quieres continuar el examen anterior?',
+                continueButton: 'Continuar',
+                startNewButton: 'Empezar nuevo',
+                examTimeExpired: 'El tiempo del examen ha expirado.',
+                confirmLeave: '¿Seguro que quieres salir? Se guardará tu progreso.',
+
+                // Practice mode
+                practiceMode: 'Práctica de errores',
+                practiceTitle: 'Práctica de errores',
+                practiceRemaining: 'Quedan',
+                practiceQuestions: 'preguntas',
+                practiceSkip: 'Saltar',
+                practiceExit: 'Salir',
+                practiceCongrats: '¡Felicidades!',
+                practiceCongratsText: 'Has dominado todas las preguntas difíciles.',
+                practiceNoQuestions: 'No hay preguntas para practicar.',
+                practiceNoQuestionsText: 'Responde algunas preguntas primero para ver cuáles necesitas practicar.',
+                practiceBackToStudy: 'Volver a estudiar',
+
+                // Stats panel
+                statsTitle: 'Estadísticas',
+                needsPractice: 'Necesita práctica',
+                mastered: 'Dominadas',
+                notAttempted: 'Sin intentar',
+                resetStats: 'Reiniciar estadísticas',
+                confirmReset: '¿Estás seguro de que quieres reiniciar todas las estadísticas? Esta acción no se puede deshacer.',
+
+                // Score indicators
+                scoreStruggling: 'Difícil',
+                scoreNeedsWork: 'Necesita práctica',
+                scoreLearning: 'Aprendiendo',
+                scoreMastered: 'Dominada',
+                scoreNotAttempted: 'Sin responder',
+
+                // Offline
+                offlineMode: 'Modo sin conexión'
+            },
+            en: {
+                // Header
+                title: 'CCSE 2026',
+                subtitle: 'Spanish Citizenship Questions',
+                questionsAnswered: 'questions answered',
+                searchPlaceholder: 'Search question...',
+
+                // Buttons
+                quizMode: 'Exam Mode',
+                printAll: 'Print all',
+                printUnanswered: 'Print unanswered',
+                darkMode: 'Dark mode',
+                lightMode: 'Light mode',
+                translate: 'Перевод',
+                explain: 'Объяснение',
+
+                // Quiz config modal
+                configureExam: 'Configure Exam',
+                questionSelection: 'Question selection:',
+                fullExam: 'Full exam (%d questions)',
+                bySection: 'By section:',
+                quickPractice: 'Quick practice:',
+                questions: 'questions',
+                randomOrder: 'Random order',
+                timer: 'Timer:',
+                noTimer: 'No timer',
+                fullTimer: '45 minutes (full exam)',
+                proportionalTimer: 'Proportional to number of questions',
+                cancel: 'Cancel',
+                startExam: 'Start Exam',
+
+                // Quiz interface
+                question: 'Question',
+                answered: 'answered',
+                previous: 'Previous',
+                next: 'Next',
+                finishExam: 'Finish Exam',
+                exit: 'Exit',
+
+                // Results
+                passed: 'PASSED',
+                failed: 'FAILED',
+                correctAnswers: 'correct answers',
+                time: 'Time:',
+                sectionPerformance: 'Performance by section',
+                reviewQuestions: 'Review Questions',
+                newExam: 'New Exam',
+                studyMode: 'Study Mode',
+                detailedReview: 'Detailed Review',
+                correct: 'Correct',
+                incorrect: 'Incorrect',
+                yourAnswer: 'Your answer:',
+                correctAnswer: 'Correct answer:',
+                notAnswered: 'Not answered',
+
+                // Navigation
+                index: 'Index',
+                home: 'Home',
+                nextUnanswered: 'Next',
+
+                // Alerts
+                confirmFinish: 'Are you sure you want to finish the exam?',
+                unansweredQuestions: 'You have',
+                questionsUnanswered: 'unanswered question(s).',
+                confirmExit: 'Are you sure you want to exit the exam? Your progress will be lost.',
+                timeExpired: 'Time expired! The exam will be submitted automatically.',
+                continueExam: 'Do you want to continue the previous exam?',
+                continueButton: 'Continue',
+                startNewButton: 'Start New',
+                examTimeExpired: 'The exam time has expired.',
+                confirmLeave: 'Are you sure you want to leave? Your progress will be saved.',
+
+                // Practice mode
+                practiceMode: 'Practice Mistakes',
+                practiceTitle: 'Practice Mistakes',
+                practiceRemaining: 'Remaining',
+                practiceQuestions: 'questions',
+                practiceSkip: 'Skip',
+                practiceExit: 'Exit',
+                practiceCongrats: 'Congratulations!',
+                practiceCongratsText: 'You have mastered all the difficult questions.',
+                practiceNoQuestions: 'No questions to practice.',
+                practiceNoQuestionsText: 'Answer some questions first to see which ones you need to practice.',
+                practiceBackToStudy: 'Back to study',
+
+                // Stats panel
+                statsTitle: 'Statistics',
+                needsPractice: 'Needs practice',
+                mastered: 'Mastered',
+                notAttempted: 'Not attempted',
+                resetStats: 'Reset statistics',
+                confirmReset: 'Are you sure you want to reset all statistics? This action cannot be undone.',
+
+                // Score indicators
+                scoreStruggling: 'Struggling',
+                scoreNeedsWork: 'Needs work',
+                scoreLearning: 'Learning',
+                scoreMastered: 'Mastered',
+                scoreNotAttempted: 'Not answered',
+
+                // Offline
+                offlineMode: 'Offline mode'
+            },
+            ru: {
+                // Header
+                title: 'CCSE 2026',
+                subtitle: 'Вопросы для гражданства Испании',
+                questionsAnswered: 'вопросов отвечено',
+                searchPlaceholder: 'Поиск вопроса...',
+
+                // Buttons
+                quizMode: 'Режим Экзамена',
+                printAll: 'Печать всех',
+                printUnanswered: 'Печать неотвеченных',
+                darkMode: 'Темный режим',
+                lightMode: 'Светлый режим',
+                translate: 'Перевод',
+                explain: 'Объяснение',
+
+                // Quiz config modal
+                configureExam: 'Настроить Экзамен',
+                questionSelection: 'Выбор вопросов:',
+                fullExam: 'Полный экзамен (%d вопросов)',
+                bySection: 'По разделу:',
+                quickPractice: 'Быстрая практика:',
+                questions: 'вопросов',
+                randomOrder: 'Случайный порядок',
+                timer: 'Таймер:',
+                noTimer: 'Без таймера',
+                fullTimer: '45 минут (полный экзамен)',
+                proportionalTimer: 'Пропорционально количеству вопросов',
+                cancel: 'Отмена',
+                startExam: 'Начать Экзамен',
+
+                // Quiz interface
+                question: 'Вопрос',
+                answered: 'отвечено',
+                previous: 'Назад',
+                next: 'Далее',
+                finishExam: 'Завершить Экзамен',
+                exit: 'Выход',
+
+                // Results
+                passed: 'СДАЛ',
+                failed: 'НЕ СДАЛ',
+                correctAnswers: 'правильных ответов',
+                time: 'Время:',
+                sectionPerformance: 'Результаты по разделам',
+                reviewQuestions: 'Просмотреть Вопросы',
+                newExam: 'Новый Экзамен',
+                studyMode: 'Режим Обучения',
+                detailedReview: 'Подробный Обзор',
+                correct: 'Правильно',
+                incorrect: 'Неправильно',
+                yourAnswer: 'Ваш ответ:',
+                correctAnswer: 'Правильный ответ:',
+                notAnswered: 'Не отвечено',
+
+                // Navigation
+                index: 'Оглавление',
+                home: 'Главная',
+                nextUnanswered: 'Следующий',
+
+                // Alerts
+                confirmFinish: 'Вы уверены, что хотите завершить экзамен?',
+                unansweredQuestions: 'У вас',
+                questionsUnanswered: 'неотвеченных вопроса(ов).',
+                confirmExit: 'Вы уверены, что хотите выйти из экзамена? Ваш прогресс будет потерян.',
+                timeExpired: 'Время истекло! Экзамен будет отправлен автоматически.',
+                continueExam: 'Хотите продолжить предыдущий экзамен?',
+                continueButton: 'Продолжить',
+                startNewButton: 'Начать новый',
+                examTimeExpired: 'Время экзамена истекло.',
+                confirmLeave: 'Вы уверены, что хотите выйти? Ваш прогресс будет сохранен.',
+
+                // Practice mode
+                practiceMode: 'Практика ошибок',
+                practiceTitle: 'Практика ошибок',
+                practiceRemaining: 'Осталось',
+                practiceQuestions: 'вопросов',
+                practiceSkip: 'Пропустить',
+                practiceExit: 'Выход',
+                practiceCongrats: 'Поздравляем!',
+                practiceCongratsText: 'Вы освоили все сложные вопросы.',
+                practiceNoQuestions: 'Нет вопросов для практики.',
+                practiceNoQuestionsText: 'Сначала ответьте на несколько вопросов, чтобы увидеть, какие нужно практиковать.',
+                practiceBackToStudy: 'Вернуться к учебе',
+
+                // Stats panel
+                statsTitle: 'Статистика',
+                needsPractice: 'Нужна практика',
+                mastered: 'Освоено',
+                notAttempted: 'Без ответа',
+                resetStats: 'Сбросить статистику',
+                confirmReset: 'Вы уверены, что хотите сбросить всю статистику? Это действие нельзя отменить.',
+
+                // Score indicators
+                scoreStruggling: 'Сложный',
+                scoreNeedsWork: 'Нужна практика',
+                scoreLearning: 'Изучается',
+                scoreMastered: 'Освоен',
+                scoreNotAttempted: 'Без ответа',
+
+                // Offline
+                offlineMode: 'Автономный режим'
+            }
+        };
+
+        let currentLanguage = localStorage.getItem('language') || 'ru';
+
+        function t(key) {
+            return translations[currentLanguage][key] || key;
+        }
+
+        // ==========================================
+        // PROGRESS STORAGE
+        // ==========================================
+
+        // Learner progress lives in IndexedDB:
+        //   questions - one record per question: {qNum, score, study}
+        //   attempts  - append-only answer log: {id, qNum, timestamp, selected, correct, mode, latency}
+        //   meta      - small keyed values ('quizSession', 'migrated')
+        // It is read into memory once at startup (scoreStore, studySession,
+        // progress.meta). Changes are queued and written in a single transaction
+        // when the browser is idle or the page is hidden. The old localStorage
+        // keys are migrated on first run; without IndexedDB (some private modes)
+        // progress stays in localStorage as before, minus the attempt log.
+        const PROGRESS_DB = 'ccse-progress';
+        const LEGACY_KEYS = ['questionScores', 'studySession', 'quizSession'];
+
+        const progress = {
+            db: null,
+            meta: new Map(),
+            dirtyQuestions: new Set(),
+            pendingAttempts: [],
+            pendingMeta: new Set(),
+            clearAttempts: false,
+            flushHandle: null,
+            shownAt: new Map(),  // qNum -> when its card was last rendered, for answer latency
+            quizLatency: new Map(),  // qNum -> latency of the current quiz answer, logged when graded
+        };
+
+        function readLocalJSON(key) {
+            try {
+                const stored = localStorage.getItem(key);
+                return stored ? JSON.parse(stored) : null;
+            } catch (e) {
+                console.error('Error parsing ' + key + ':', e);
+                localStorage.removeItem(key);
+                return null;
+            }
+        }
+
+        function requestResult(request) {
+            return new Promise((resolve, reject) => {
+                request.onsuccess = () => resolve(request.result);
+                request.onerror = () => reject(request.error);
+            });
+        }
+
+        function openProgressDB() {
+            if (!('indexedDB' in window)) return Promise.reject(new Error('IndexedDB is not available'));
+            const request = indexedDB.open(PROGRESS_DB, 1);
+            request.onupgradeneeded = () => {
+                const db = request.result;
+                db.createObjectStore('questions', { keyPath: 'qNum' });
+                db.createObjectStore('attempts', { keyPath: 'id', autoIncrement: true }).createIndex('qNum', 'qNum');
+                db.createObjectStore('meta');
+            };
+            return requestResult(request);
+        }
+
+        // Fill the in-memory state from the database (or localStorage), migrating old data
+        async function loadProgress() {
+            const scores = {};
+            const study = {};
+            try {
+                progress.db = await openProgressDB();
+                const tx = progress.db.transaction(['questions', 'attempts', 'meta'], 'readonly');
+                const [records, attempts, quizSession, migrated] = await Promise.all([
+                    requestResult(tx.objectStore('questions').getAll()),
+                    requestResult(tx.objectStore('attempts').getAll()),
+                    requestResult(tx.objectStore('meta').get('quizSession')),
+                    requestResult(tx.objectStore('meta').get('migrated')),
+                ]);
+                attempts.forEach(attempt => srsReview(attempt.qNum, attempt.correct, attempt.timestamp));
+                records.forEach(record => {
+                    if (record.score) scores[record.qNum] = record.score;
+                    if (record.study) study[record.qNum] = record.study;
+                });
+                if (quizSession) progress.meta.set('quizSession', quizSession);
+
+                if (!migrated) {
+                    const legacyScores = readLocalJSON('questionScores') || {};
+                    const legacyStudy = readLocalJSON('studySession') || {};
+                    Object.assign(scores, legacyScores);
+                    Object.assign(study, legacyStudy);
+                    Object.keys(legacyScores).concat(Object.keys(legacyStudy))
+                        .forEach(qNum => progress.dirtyQuestions.add(parseInt(qNum)));
+                    const legacyQuiz = readLocalJSON('quizSession');
+                    if (legacyQuiz) setProgressMeta('quizSession', legacyQuiz);
+                    setProgressMeta('migrated', true);
+                }
+            } catch (e) {
+                console.warn('Keeping progress in localStorage:', e);
+                progress.db = null;
+                Object.assign(scores, readLocalJSON('questionScores'));
+                Object.assign(study, readLocalJSON('studySession'));
+                const quizSession = readLocalJSON('quizSession');
+                if (quizSession) progress.meta.set('quizSession', quizSession);
+            }
+
+            // Anything answered while loading wins over the stored state
+            scoreStore.scores = Object.assign(scores, scoreStore.scores);
+            studySession = Object.assign(study, studySession);
+            recountScores();
+
+            // Drop the old keys once their contents are safely in the database
+            if (progress.db && progress.pendingMeta.has('migrated') && await flushProgress()) {
+                LEGACY_KEYS.forEach(key => localStorage.removeItem(key));
+            }
+        }
+
+        function scheduleProgressFlush() {
+            if (progress.flushHandle !== null) return;
+            progress.flushHandle = 'requestIdleCallback' in window
+                ? requestIdleCallback(flushProgress, { timeout: 2000 })
+                : setTimeout(flushProgress, 1000);
+        }
+
+        function markQuestionDirty(qNum) {
+            progress.dirtyQuestions.add(qNum);
+            scheduleProgressFlush();
+        }
+
+        // Set (or, with undefined, delete) a meta value
+        function setProgressMeta(key, value) {
+            if (value === undefined) progress.meta.delete(key);
+            else progress.meta.set(key, value);
+            progress.pendingMeta.add(key);
+            scheduleProgressFlush();
+        }
+
+        // Milliseconds since the card of a question was rendered
+        function answerLatency(qNum) {
+            const shownAt = progress.shownAt.get(qNum);
+            return shownAt ? Date.now() - shownAt : null;
+        }
+
+        // Append a graded answer to the attempt log and the spaced repetition model
+        function logAttempt(qNum, selected, correct, mode, latency = answerLatency(qNum)) {
+            const timestamp = Date.now();
+            progress.pendingAttempts.push({ qNum, timestamp, selected, correct, mode, latency });
+            srsReview(qNum, correct, timestamp);
+            scheduleProgressFlush();
+        }
+
+        // Write all queued changes; resolves to whether they were saved
+        function flushProgress() {
+            if (progress.flushHandle !== null) {
+                if ('cancelIdleCallback' in window) cancelIdleCallback(progress.flushHandle);
+                else clearTimeout(progress.flushHandle);
+                progress.flushHandle = null;
+            }
+            const dirty = Array.from(progress.dirtyQuestions);
+            const attempts = progress.pendingAttempts;
+            const metaKeys = Array.from(progress.pendingMeta);
+            const clearAttempts = progress.clearAttempts;
+            if (!dirty.length && !attempts.length && !metaKeys.length && !clearAttempts) return Promise.resolve(true);
+            progress.dirtyQuestions = new Set();
+            progress.pendingAttempts = [];
+            progress.pendingMeta = new Set();
+            progress.clearAttempts = false;
+
+            if (!progress.db) {
+                try {
+                    localStorage.setItem('questionScores', JSON.stringify(scoreStore.scores));
+                    localStorage.setItem('studySession', JSON.stringify(studySession));
+                    const quizSession = progress.meta.get('quizSession');
+                    if (quizSession) localStorage.setItem('quizSession', JSON.stringify(quizSession));
+                    else localStorage.removeItem('quizSession');
+                } catch (e) {
+                    console.error('Error saving progress:', e);
+                    return Promise.resolve(false);
+                }
+                return Promise.resolve(true);
+            }
+
+            return new Promise(resolve => {
+                const tx = progress.db.transaction(['questions', 'attempts', 'meta'], 'readwrite');
+                const questionStore = tx.objectStore('questions');
+                dirty.forEach(qNum => {
+                    const score = scoreStore.scores[qNum] || null;
+                    const study = studySession[qNum] || null;
+                    if (score || study) questionStore.put({ qNum, score, study });
+                    else questionStore.delete(qNum);
+                });
+                const attemptStore = tx.objectStore('attempts');
+                if (clearAttempts) attemptStore.clear();
+                attempts.forEach(attempt => attemptStore.add(attempt));
+                const metaStore = tx.objectStore('meta');
+                metaKeys.forEach(key => {
+                    if (progress.meta.has(key)) metaStore.put(progress.meta.get(key), key);
+                    else metaStore.delete(key);
+                });
+                tx.oncomplete = () => resolve(true);
+                tx.onerror = () => {
+                    console.error('Error saving progress:', tx.error);
+                    resolve(false);
+                };
+            });
+        }
+
+        // The page may never become idle again once it is hidden or closed
+        document.addEventListener('visibilitychange', () => {
+            if (document.visibilityState === 'hidden') flushProgress();
+        });
+        window.addEventListener('pagehide', flushProgress);
+
+        // ==========================================
+        // RANDOM SAMPLING
+        // ==========================================
+
+        // Random source for picking questions: Math.random, or a seeded
+        // generator (?seed=N in the URL, or seedRandom(N) from the console)
+        // so that a practice or quiz run can be reproduced
+        let rng = Math.random;
+
+        // mulberry32: small 32-bit PRNG returning floats in [0, 1)
+        function mulberry32(seed) {
+            let state = seed >>> 0;
+            return function() {
+                state = (state + 0x6D2B79F5) >>> 0;
+                let t = state;
+                t = Math.imul(t ^ (t >>> 15), t | 1);
+                t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+                return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+            };
+        }
+
+        function seedRandom(seed) {
+            rng = seed === null || seed === undefined ? Math.random : mulberry32(seed);
+        }
+
+        const seedParam = new URLSearchParams(window.location.search).get('seed');
+        if (seedParam !== null && !isNaN(Number(seedParam))) seedRandom(Number(seedParam));
+
+        // Weighted sampler over keys (Vose's alias method): every draw is O(1).
+        // Changing a weight is O(1) too; the alias table is rebuilt by the
+        // first draw after a change.
+        function makeSampler() {
+            return { weights: new Map(), keys: [], prob: null, alias: null, total: 0, stale: true };
+        }
+
+        // Set the weight of a key; 0 removes it
+        function samplerSet(sampler, key, weight) {
+            if ((sampler.weights.get(key) || 0) === weight) return;
+            if (weight > 0) sampler.weights.set(key, weight);
+            else sampler.weights.delete(key);
+            sampler.stale = true;
+        }
+
+        function samplerClear(sampler) {
+            sampler.weights.clear();
+            sampler.stale = true;
+        }
+
+        function buildAliasTable(sampler) {
+            const keys = Array.from(sampler.weights.keys());
+            const n = keys.length;
+            const prob = new Float64Array(n);
+            const alias = new Uint32Array(n);
+            let total = 0;
+            sampler.weights.forEach(weight => { total += weight; });
+
+            // Split the slots into those under and over the average weight, then
+            // top up each light slot with the excess of a heavy one
+            const small = [];
+            const large = [];
+            keys.forEach((key, i) => {
+                prob[i] = sampler.weights.get(key) * n / total;
+                (prob[i] < 1 ? small : large).push(i);
+            });
+            while (small.length > 0 && large.length > 0) {
+                const light = small.pop();
+                const heavy = large[large.length - 1];
+                alias[light] = heavy;
+                prob[heavy] -= 1 - prob[light];
+                if (prob[heavy] < 1) {
+                    large.pop();
+                    small.push(heavy);
+                }
+            }
+            // Whatever is left is full, up to rounding error
+            large.forEach(i => { prob[i] = 1; });
+            small.forEach(i => { prob[i] = 1; });
+
+            Object.assign(sampler, { keys, prob, alias, total, stale: false });
+        }
+
+        // Draw a key with probability proportional to its weight, avoiding the
+        // keys in exclude (a Set) unless nothing else is left; null if empty
+        function samplerDraw(sampler, exclude) {
+            if (sampler.weights.size === 0) return null;
+            if (sampler.stale) buildAliasTable(sampler);
+
+            let excludedWeight = 0;
+            exclude.forEach(key => { excludedWeight += sampler.weights.get(key) || 0; });
+            const avoid = excludedWeight < sampler.total ? exclude : new Set();
+
+            while (true) {
+                const u = rng() * sampler.keys.length;
+                const slot = Math.floor(u);
+                const key = u - slot < sampler.prob[slot] ? sampler.keys[slot] : sampler.keys[sampler.alias[slot]];
+                if (!avoid.has(key)) return key;
+            }
+        }
+
+        // Uniformly random sample of count items, in random order: a partial
+        // Fisher-Yates shuffle that only touches the first count slots
+        function sampleWithoutReplacement(items, count) {
+            const pool = items.slice();
+            const size = Math.min(count, pool.length);
+            for (let i = 0; i < size; i++) {
+                const j = i + Math.floor(rng() * (pool.length - i));
+                [pool[i], pool[j]] = [pool[j], pool[i]];
+            }
+            pool.length = size;
+            return pool;
+        }
+
+        // ==========================================
+        // QUESTION SCORING SYSTEM
+        // ==========================================
+
+        // Scores live in memory (filled by loadProgress) with running
+        // per-category counts, so answering never re-reads stored state
+        const scoreStore = {
+            scores: {},  // qNum -> {score, consecutiveWrong}
+            counts: { mastered: 0, needsPractice: 0, notAttempted: 0 },
+        };
+
+        // Questions that need practice (score < 2), weighted so that lower
+        // scores are picked more often
+        const practicePool = makeSampler();
+
+        function practiceWeight(scoreData) {
+            if (!scoreData || scoreData.score >= 2) return 0;
+            return Math.max(1, Math.abs(scoreData.score));
+        }
+
+        // Stats category of a question's score data
+        function scoreCategory(scoreData) {
+            if (!scoreData) return 'notAttempted';
+            return scoreData.score >= 2 ? 'mastered' : 'needsPractice';
+        }
+
+        function recountScores() {
+            const counts = { mastered: 0, needsPractice: 0, notAttempted: 0 };
+            samplerClear(practicePool);
+            allQuestionNumbers.forEach(qNum => {
+                const scoreData = scoreStore.scores[String(qNum)];
+                counts[scoreCategory(scoreData)]++;
+                samplerSet(practicePool, qNum, practiceWeight(scoreData));
+            });
+            scoreStore.counts = counts;
+        }
+
+        recountScores();
+
+        // Current question scores (the live object; change them through setQuestionScore)
+        function getQuestionScores() {
+            return scoreStore.scores;
+        }
+
+        function setQuestionScore(qNum, scoreData) {
+            const qKey = String(qNum);
+            scoreStore.counts[scoreCategory(scoreStore.scores[qKey])]--;
+            scoreStore.counts[scoreCategory(scoreData)]++;
+            scoreStore.scores[qKey] = scoreData;
+            samplerSet(practicePool, Number(qNum), practiceWeight(scoreData));
+            markQuestionDirty(qNum);
+        }
+
+        // Update score for a specific question
+        function updateQuestionScore(qNum, isCorrect) {
+            const previous = scoreStore.scores[String(qNum)] || { score: 0, consecutiveWrong: 0 };
+            const scoreData = { score: previous.score, consecutiveWrong: previous.consecutiveWrong };
+
+            if (isCorrect) {
+                scoreData.score += 1;
+                scoreData.consecutiveWrong = 0;
+            } else {
+                // Escalating penalty based on consecutive wrong answers
+                const consecutive = scoreData.consecutiveWrong + 1;
+                let penalty;
+                if (consecutive === 1) penalty = -2;
+                else if (consecutive === 2) penalty = -3;
+                else penalty = -4;
+
+                scoreData.score += penalty;
+                scoreData.consecutiveWrong = consecutive;
+            }
+
+            setQuestionScore(qNum, scoreData);
+            updateScoreIndicator(qNum);
+            updateStatsPanel();
+            updatePracticeBadge();
+        }
+
+        // Get score indicator class based on score
+        function getScoreIndicatorClass(score) {
+            if (score === null || score === undefined) return 'not-attempted';
+            if (score < -4) return 'struggling';
+            if (score >= -4 && score <= -1) return 'needs-work';
+            if (score >= 0 && score <= 1) return 'learning';
+            return 'mastered';
+        }
+
+        // Get score indicator tooltip text
+        function getScoreTooltip(score) {
+            if (score === null || score === undefined) return t('scoreNotAttempted');
+            if (score < -4) return t('scoreStruggling') + ': ' + score;
+            if (score >= -4 && score <= -1) return t('scoreNeedsWork') + ': ' + score;
+            if (score >= 0 && score <= 1) return t('scoreLearning') + ': ' + score;
+            return t('scoreMastered') + ': ' + score;
+        }
+
+        // Update score indicator for a specific question
+        function updateScoreIndicator(qNum) {
+            const scoreData = scoreStore.scores[String(qNum)];
+            const score = scoreData ? scoreData.score : null;
+
+            const indicator = document.getElementById('indicator' + qNum);
+            if (indicator) {
+                // Remove all score classes
+                indicator.classList.remove('struggling', 'needs-work', 'learning', 'mastered', 'not-attempted');
+                // Add the appropriate class
+                indicator.classList.add(getScoreIndicatorClass(score));
+                // Update tooltip
+                const tooltip = indicator.querySelector('.score-tooltip');
+                if (tooltip) {
+                    tooltip.textContent = getScoreTooltip(score);
+                }
+                indicator.title = getScoreTooltip(score);
+            }
+        }
+
+        // Render all score indicators on page load
+        function renderAllIndicators() {
+            studyList.questions.forEach(qNum => {
+                if (getCard(qNum)) updateScoreIndicator(qNum);
+            });
+        }
+
+        // Update stats panel with current counts
+        function updateStatsPanel() {
+            const { needsPractice, mastered, notAttempted } = scoreStore.counts;
+
+            const needsPracticeEl = document.getElementById('statsNeedsPractice');
+            const masteredEl = document.getElementById('statsMastered');
+            const notAttemptedEl = document.getElementById('statsNotAttempted');
+
+            if (needsPracticeEl) needsPracticeEl.textContent = needsPractice;
+            if (masteredEl) masteredEl.textContent = mastered;
+            if (notAttemptedEl) notAttemptedEl.textContent = notAttempted;
+        }
+
+        // Update practice button badge
+        function updatePracticeBadge() {
+            const count = scoreStore.counts.needsPractice;
+
+            const badge = document.getElementById('practiceBadge');
+            if (badge) {
+                badge.textContent = count;
+                badge.classList.toggle('empty', count === 0);
+            }
+        }
+
+        // Toggle stats panel collapse
+        function toggleStatsPanel() {
+            const panel = document.getElementById('statsPanel');
+            if (panel) {
+                panel.classList.toggle('collapsed');
+            }
+        }
+
+        // Reset all scores with confirmation
+        function resetAllScores() {
+            if (confirm(t('confirmReset'))) {
+                // Clear scores and the answer history
+                Object.keys(scoreStore.scores).forEach(qNum => markQuestionDirty(parseInt(qNum)));
+                scoreStore.scores = {};
+                recountScores();
+                progress.clearAttempts = true;
+                resetSpacedRepetition();
+
+                // Clear study session and reset visual state
+                clearStudySession();
+                revealedCount = 0;
+                document.getElementById('revealed').textContent = '0';
+
+                // Reset all question cards to unanswered state
+                allQuestionNumbers.forEach(qNum => {
+                    const card = document.getElementById('q' + qNum);
+                    if (card) {
+                        const options = card.querySelectorAll('.option');
+                        options.forEach(opt => {
+                            opt.classList.remove('correct', 'incorrect', 'disabled');
+                        });
+                        const result = card.querySelector('.result');
+                        if (result) {
+                            result.innerHTML = '';
+                            result.classList.remove('correct', 'incorrect');
+                        }
+                    }
+                });
+
+                // Update UI
+                renderAllIndicators();
+                updateStatsPanel();
+                updatePracticeBadge();
+            }
+        }
+
+        // ==========================================
+        // SPACED REPETITION
+        // ==========================================
+
+        // FSRS-style memory model of each answered question: stability is the
+        // number of days until the chance of recalling it drops to 90%, and
+        // difficulty runs from 1 to 10. Every graded answer (replayed from the
+        // attempt log at startup, then live) updates both and sets the question
+        // due when recall falls to 90%. Due times sit in a binary min-heap, so
+        // the most overdue question is found in O(log n); entries superseded by
+        // a later answer are skipped when they reach the top.
+        const DAY_MS = 24 * 60 * 60 * 1000;
+        const TARGET_RETENTION = 0.9;
+        const MIN_STABILITY = 0.1;   // days
+        const MAX_STABILITY = 365;   // days
+
+        const srs = {
+            cards: new Map(),  // qNum -> {stability, difficulty, reps, lapses, lastReview, due, version}
+            heap: [],          // {due, qNum, version}
+        };
+
+        function heapPush(item) {
+            const heap = srs.heap;
+            heap.push(item);
+            let i = heap.length - 1;
+            while (i > 0) {
+                const parent = (i - 1) >> 1;
+                if (heap[parent].due <= heap[i].due) break;
+                [heap[parent], heap[i]] = [heap[i], heap[parent]];
+                i = parent;
+            }
+        }
+
+        function heapPop() {
+            const heap = srs.heap;
+            const top = heap[0];
+            const last = heap.pop();
+            if (heap.length > 0) {
+                heap[0] = last;
+                let i = 0;
+                while (true) {
+                    const left = 2 * i + 1;
+                    const right = left + 1;
+                    let smallest = i;
+                    if (left < heap.length && heap[left].due < heap[smallest].due) smallest = left;
+                    if (right < heap.length && heap[right].due < heap[smallest].due) smallest = right;
+                    if (smallest === i) break;
+                    [heap[smallest], heap[i]] = [heap[i], heap[smallest]];
+                    i = smallest;
+                }
+            }
+            return top;
+        }
+
+        // Probability of recalling a question at time now
+        function retrievability(card, now) {
+            return Math.pow(TARGET_RETENTION, (now - card.lastReview) / DAY_MS / card.stability);
+        }
+
+        // Update the memory model of a question with a graded answer
+        function srsReview(qNum, correct, timestamp) {
+            let card = srs.cards.get(qNum);
+            if (!card) {
+                card = {
+                    stability: correct ? 2 : MIN_STABILITY,
+                    difficulty: correct ? 4 : 6,
+                    reps: 0, lapses: 0, lastReview: timestamp, due: timestamp, version: 0,
+                };
+                srs.cards.set(qNum, card);
+            } else if (correct) {
+                // Recalling it when it was nearly forgotten strengthens it most;
+                // answering it again right away barely does
+                const r = retrievability(card, timestamp);
+                const growth = Math.exp(1.5) * (11 - card.difficulty) * Math.pow(card.stability, -0.1) * (Math.exp(1 - r) - 1);
+                card.stability = Math.min(MAX_STABILITY, card.stability * (1 + growth));
+                card.difficulty = Math.max(1, card.difficulty - 0.3);
+            } else {
+                card.stability = Math.max(MIN_STABILITY, card.stability * 0.2);
+                card.difficulty = Math.min(10, card.difficulty + 1);
+            }
+            if (!correct) card.lapses++;
+            card.reps++;
+            card.lastReview = timestamp;
+            card.due = timestamp + card.stability * DAY_MS;
+            card.version++;
+
+            // Drop superseded entries once they outnumber the live ones
+            if (srs.heap.length > 4 * srs.cards.size) {
+                srs.heap = [];
+                srs.cards.forEach((c, q) => { if (q !== qNum) heapPush({ due: c.due, qNum: q, version: c.version }); });
+            }
+            heapPush({ due: card.due, qNum, version: card.version });
+        }
+
+        // The most overdue question not in exclude (a Set), or null if none is due
+        function nextDueQuestion(now, exclude) {
+            const skipped = [];
+            let found = null;
+            while (srs.heap.length > 0) {
+                const top = srs.heap[0];
+                if (top.version !== srs.cards.get(top.qNum).version) {
+                    heapPop();
+                } else if (top.due > now) {
+                    break;
+                } else if (exclude.has(top.qNum)) {
+                    skipped.push(heapPop());
+                } else {
+                    found = top.qNum;
+                    break;
+                }
+            }
+            skipped.forEach(heapPush);
+            return found;
+        }
+
+        function resetSpacedRepetition() {
+            srs.cards.clear();
+            srs.heap = [];
+        }
+
+        // ==========================================
+        // FOCUSED PRACTICE MODE
+        // ==========================================
+
+        let practiceMode = {
+            active: false,
+            questions: [],
+            currentIndex: 0,
+            recentQuestions: new Set() // Recently shown questions, oldest first, to avoid repeats
+        };
+
+        const RECENT_BUFFER_SIZE = 5; // Number of recent questions to exclude from selection
+
+        // Add a question to the recent buffer
+        function rememberPracticeQuestion(qNum) {
+            const recent = practiceMode.recentQuestions;
+            recent.delete(qNum);
+            recent.add(qNum);
+            if (recent.size > RECENT_BUFFER_SIZE) {
+                recent.delete(recent.values().next().value);
+            }
+        }
+
+        // Start focused practice mode
+        function startFocusedPractice() {
+            // Prevent starting practice mode while quiz is active
+            if (quizMode.active) {
+                console.warn('Cannot start practice mode while quiz is active');
+                return;
+            }
+
+            if (practicePool.weights.size === 0 && nextDueQuestion(Date.now(), new Set()) === null) {
+                // Check if there are any attempted questions
+                const scores = getQuestionScores();
+                const hasAttempted = Object.keys(scores).length > 0;
+
+                showPracticeMessage(
+                    hasAttempted ? t('practiceCongrats') : t('practiceNoQuestions'),
+                    hasAttempted ? t('practiceCongratsText') : t('practiceNoQuestionsText')
+                );
+                return;
+            }
+
+            practiceMode.active = true;
+            practiceMode.questions = Array.from(practicePool.weights.keys());
+            practiceMode.currentIndex = 0;
+            practiceMode.recentQuestions = new Set(); // Clear recent buffer
+
+            document.body.classList.add('practice-mode');
+
+            // Hide all cards first
+            setStudyList([], false);
+
+            // Show first question (answeredQuestions is reset per-question in showNextPracticeQuestion)
+            showNextPracticeQuestion();
+            updatePracticeHeader();
+        }
+
+        // Show the next practice question
+        function showNextPracticeQuestion() {
+            // Questions whose recall has decayed come first, most overdue first;
+            // then low-scoring questions, picked by weighted random
+            let nextQNum = nextDueQuestion(Date.now(), practiceMode.recentQuestions);
+            if (nextQNum === null) {
+                nextQNum = samplerDraw(practicePool, practiceMode.recentQuestions);
+            }
+            if (nextQNum === null) {
+                // Nothing due and nothing weak: the recent questions can wait
+                nextQNum = nextDueQuestion(Date.now(), new Set());
+            }
+            if (nextQNum === null) {
+                // All questions mastered!
+                exitFocusedPractice();
+                showPracticeMessage(t('practiceCongrats'), t('practiceCongratsText'));
+                return;
+            }
+            rememberPracticeQuestion(nextQNum);
+
+            // Allow this question to be re-answered in practice mode
+            delete studySession[nextQNum];
+            markQuestionDirty(nextQNum);
+
+            // Show only the selected card, rendered without its previous answer
+            setStudyList([nextQNum], false);
+            const card = getCard(nextQNum);
+            if (card) {
+                card.scrollIntoView({ behavior: 'smooth', block: 'center' });
+            }
+
+            updatePracticeHeader();
+        }
+
+        // Skip current practice question
+        function skipPracticeQuestion() {
+            showNextPracticeQuestion();
+        }
+
+        // Questions left to practice: the low-scoring ones plus those due for
+        // review, each counted once
+        function practiceRemaining(now) {
+            const remaining = new Set(practicePool.weights.keys());
+            srs.heap.forEach(entry => {
+                if (entry.due <= now && entry.version === srs.cards.get(entry.qNum).version) {
+                    remaining.add(Number(entry.qNum));
+                }
+            });
+            return remaining.size;
+        }
+
+        // Update practice header with remaining count
+        function updatePracticeHeader() {
+            const remaining = practiceRemaining(Date.now());
+            const progressText = document.getElementById('practiceProgressText');
+            if (progressText) {
+                progressText.textContent = t('practiceRemaining') + ': ' + remaining + ' ' + t('practiceQuestions');
+            }
+        }
+
+        // Exit focused practice mode
+        function exitFocusedPractice() {
+            practiceMode.active = false;
+            practiceMode.questions = [];
+            practiceMode.currentIndex = 0;
+            practiceMode.recentQuestions = new Set();
+
+            document.body.classList.remove('practice-mode');
+
+            // Show all cards and section headers again
+            showSearchResults();
+        }
+
+        // Show a practice message (congrats or no questions)
+        function showPracticeMessage(title, text) {
+            // Create overlay for message using DOM methods to prevent XSS
+            const overlay = document.createElement('div');
+            overlay.className = 'modal-overlay';
+            overlay.style.display = 'flex';
+
+            const content = document.createElement('div');
+            content.className = 'modal-content';
+            content.style.cssText = 'text-align: center; padding: 40px;';
+
+            const h2 = document.createElement('h2');
+            h2.style.cssText = 'color: var(--success); margin-bottom: 16px;';
+            h2.textContent = title;
+
+            const p = document.createElement('p');
+            p.style.cssText = 'margin-bottom: 24px; color: var(--text-secondary);';
+            p.textContent = text;
+
+            const btn = document.createElement('button');
+            btn.className = 'btn-primary';
+            btn.textContent = t('practiceBackToStudy');
+            btn.onclick = () => overlay.remove();
+
+            content.appendChild(h2);
+            content.appendChild(p);
+            content.appendChild(btn);
+            overlay.appendChild(content);
+
+            // Close on overlay click (outside modal)
+            overlay.onclick = (e) => {
+                if (e.target === overlay) overlay.remove();
+            };
+
+            document.body.appendChild(overlay);
+        }
+
+        // Update practice mode UI translations
+        function updatePracticeUI() {
+            const practiceBtn = document.getElementById('practiceBtnText');
+            if (practiceBtn) practiceBtn.textContent = t('practiceMode');
+
+            const practiceTitle = document.getElementById('practiceTitle');
+            if (practiceTitle) practiceTitle.textContent = t('practiceTitle');
+
+            const practiceSkipBtn = document.getElementById('practiceSkipBtn');
+            if (practiceSkipBtn) practiceSkipBtn.textContent = t('practiceSkip');
+
+            const practiceExitBtn = document.getElementById('practiceExitBtn');
+            if (practiceExitBtn) practiceExitBtn.textContent = t('practiceExit');
+
+            // Stats panel translations
+            const statsPanelTitle = document.getElementById('statsPanelTitle');
+            if (statsPanelTitle) statsPanelTitle.textContent = t('statsTitle');
+
+            const statsNeedsPracticeLabel = document.getElementById('statsNeedsPracticeLabel');
+            if (statsNeedsPracticeLabel) statsNeedsPracticeLabel.textContent = t('needsPractice');
+
+            const statsMasteredLabel = document.getElementById('statsMasteredLabel');
+            if (statsMasteredLabel) statsMasteredLabel.textContent = t('mastered');
+
+            const statsNotAttemptedLabel = document.getElementById('statsNotAttemptedLabel');
+            if (statsNotAttemptedLabel) statsNotAttemptedLabel.textContent = t('notAttempted');
+
+            const statsResetBtn = document.getElementById('statsResetBtn');
+            if (statsResetBtn) statsResetBtn.textContent = t('resetStats');
+
+            updatePracticeHeader();
+
+            // Update all score indicator tooltips for language change
+            allQuestionNumbers.forEach(qNum => {
+                updateScoreIndicator(qNum);
+            });
+        }
+
+        function updateInterfaceLanguage() {
+            // Header
+            const subtitle = document.querySelector('.subtitle');
+            if (subtitle) subtitle.textContent = t('subtitle');
+
+            const searchBox = document.querySelector('.search-box');
+            if (searchBox) searchBox.placeholder = t('searchPlaceholder');
+
+            // Sidebar buttons - update quiz toggle based on mode
+            try {
+                updateQuizToggleButton();
+            } catch (error) {
+                console.error('Error updating quiz toggle button:', error);
+            }
+
+            const printBtn = document.querySelector('.print-btn');
+            if (printBtn) printBtn.title = t('printAll');
+
+            const themeBtn = document.querySelector('.theme-toggle');
+            const isDark = document.documentElement.getAttribute('data-theme') === 'dark';
+            if (themeBtn) themeBtn.title = isDark ? t('lightMode') : t('darkMode');
+
+            // Stats
+            const statsText = document.querySelector('.stats');
+            if (statsText) {
+                const count = document.getElementById('revealed').textContent;
+                statsText.innerHTML = `<span id="revealed">${count}</span> / ${totalQuestions} ${t('questionsAnswered')}`;
+            }
+
+            // Quiz modal - use specific IDs
+            const quizModalTitle = document.getElementById('quizModalTitle');
+            if (quizModalTitle) quizModalTitle.textContent = t('configureExam');
+
+            const questionSelectionLabel = document.getElementById('questionSelectionLabel');
+            if (questionSelectionLabel) questionSelectionLabel.textContent = t('questionSelection');
+
+            const fullExamLabel = document.getElementById('fullExamLabel');
+            if (fullExamLabel) fullExamLabel.textContent = t('fullExam').replace('%d', totalQuestions);
+
+            const bySectionLabel = document.getElementById('bySectionLabel');
+            if (bySectionLabel) bySectionLabel.textContent = t('bySection');
+
+            const quickPracticeLabel = document.getElementById('quickPracticeLabel');
+            if (quickPracticeLabel) quickPracticeLabel.textContent = t('quickPractice');
+
+            const questionsLabel = document.getElementById('questionsLabel');
+            if (questionsLabel) questionsLabel.textContent = t('questions');
+
+            const randomOrderLabel = document.getElementById('randomOrderLabel');
+            if (randomOrderLabel) randomOrderLabel.textContent = t('randomOrder');
+
+            const timerLabel = document.getElementById('timerLabel');
+            if (timerLabel) timerLabel.textContent = t('timer');
+
+            const noTimerLabel = document.getElementById('noTimerLabel');
+            if (noTimerLabel) noTimerLabel.textContent = t('noTimer');
+
+            const fullTimerLabel = document.getElementById('fullTimerLabel');
+            if (fullTimerLabel) fullTimerLabel.textContent = t('fullTimer');
+
+            const proportionalTimerLabel = document.getElementById('proportionalTimerLabel');
+            if (proportionalTimerLabel) proportionalTimerLabel.textContent = t('proportionalTimer');
+
+            const quizCancelBtn = document.getElementById('quizCancelBtn');
+            if (quizCancelBtn) quizCancelBtn.textContent = t('cancel');
+
+            const quizStartBtn = document.getElementById('quizStartBtn');
+            if (quizStartBtn) quizStartBtn.textContent = t('startExam');
+
+            // Quiz header - use specific IDs
+            const quizPrevBtn = document.getElementById('quizPrevBtn');
+            if (quizPrevBtn) quizPrevBtn.textContent = '← ' + t('previous');
+
+            const quizNextBtn = document.getElementById('quizNextBtn');
+            if (quizNextBtn) quizNextBtn.textContent = t('next') + ' →';
+
+            const quizFinishBtn = document.getElementById('quizFinishBtn');
+            if (quizFinishBtn) quizFinishBtn.textContent = t('finishExam');
+
+            const quizExitBtn = document.getElementById('quizExitBtn');
+            if (quizExitBtn) quizExitBtn.textContent = t('exit');
+
+            // Index
+            const indexTitle = document.querySelector('.index-title');
+            if (indexTitle) indexTitle.textContent = t('index');
+
+            // Bottom nav
+            const navBtns = document.querySelectorAll('.nav-btn span');
+            if (navBtns.length >= 4) {
+                navBtns[0].textContent = t('home');
+                navBtns[1].textContent = t('previous');
+                navBtns[2].textContent = t('nextUnanswered');
+                navBtns[3].textContent = t('next');
+            }
+
+            // Practice mode UI
+            updatePracticeUI();
+
+            // Offline indicator
+            const offlineText = document.getElementById('offlineText');
+            if (offlineText) offlineText.textContent = t('offlineMode');
+        }
+
+        // Network status management
+        function updateOnlineStatus() {
+            const indicator = document.getElementById('offlineIndicator');
+            if (indicator) {
+                if (navigator.onLine) {
+                    indicator.classList.remove('visible');
+                } else {
+                    indicator.classList.add('visible');
+                }
+            }
+        }
+
+        window.addEventListener('online', updateOnlineStatus);
+        window.addEventListener('offline', updateOnlineStatus);
+        updateOnlineStatus();
+
+        // Theme management with system preference detection
+        const themeToggleBtn = document.querySelector('.theme-toggle');
+
+        (function() {
+            const storedTheme = localStorage.getItem('theme');
+            const systemPrefersDark = window.matchMedia('(prefers-color-scheme: dark)').matches;
+
+            if (storedTheme === 'dark' || (!storedTheme && systemPrefersDark)) {
+                document.documentElement.setAttribute('data-theme', 'dark');
+                themeToggleBtn.textContent = '☀️';
+                themeToggleBtn.title = t('lightMode');
+            } else {
+                themeToggleBtn.textContent = '🌙';
+                themeToggleBtn.title = t('darkMode');
+            }
+
+            // Set language button to current language
+            const flags = {'ru': '🇷🇺', 'es': '🇪🇸', 'en': '🇬🇧'};
+            const titles = {'ru': 'Язык', 'es': 'Idioma', 'en': 'Language'};
+            const langBtn = document.querySelector('.language-btn');
+            if (langBtn) {
+                langBtn.textContent = flags[currentLanguage];
+                langBtn.title = titles[currentLanguage];
+            }
+
+            // Update interface with current language
+            try {
+                updateInterfaceLanguage();
+            } catch (error) {
+                console.error('Error in updateInterfaceLanguage:', error);
+            }
+        })();
+
+        function changeLanguage(lang) {
+            currentLanguage = lang;
+            localStorage.setItem('language', lang);
+            updateInterfaceLanguage();
+        }
+
+        function cycleLanguage() {
+            const languages = ['ru', 'es', 'en'];
+            const flags = {'ru': '🇷🇺', 'es': '🇪🇸', 'en': '🇬🇧'};
+            const titles = {'ru': 'Язык', 'es': 'Idioma', 'en': 'Language'};
+
+            const currentIndex = languages.indexOf(currentLanguage);
+            const nextIndex = (currentIndex + 1) % languages.length;
+            const nextLang = languages[nextIndex];
+
+            currentLanguage = nextLang;
+            localStorage.setItem('language', nextLang);
+
+            const langBtn = document.querySelector('.language-btn');
+            if (langBtn) {
+                langBtn.textContent = flags[nextLang];
+                langBtn.title = titles[nextLang];
+            }
+
+            updateInterfaceLanguage();
+        }
+
+        function toggleTheme() {
+            const html = document.documentElement;
+            const currentTheme = html.getAttribute('data-theme');
+            const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
+
+            html.setAttribute('data-theme', newTheme);
+            localStorage.setItem('theme', newTheme);
+
+            if (newTheme === 'dark') {
+                themeToggleBtn.textContent = '☀️';
+                themeToggleBtn.title = t('lightMode');
+            } else {
+                themeToggleBtn.textContent = '🌙';
+                themeToggleBtn.title = t('darkMode');
+            }
+        }
+
+        function createEmojiExplosion(x, y) {
+            // Fun emoji mix - happy faces, hearts, party stuff
+            const emojis = ['😄', '😊', '🥳', '🎉', '❤️', '💚', '💙', '🌟', '✨', '🎊', '💯', '🔥', '😎', '🤩', '💕', '🎈', '🏆', '👏', '🙌', '💪'];
+            const emojiCount = 15; // Number of emojis to spawn
+
+            for (let i = 0; i < emojiCount; i++) {
+                const emoji = document.createElement('div');
+                emoji.className = 'emoji-particle';
+                emoji.textContent = emojis[Math.floor(Math.random() * emojis.length)];
+
+                // Random direction and distance
+                const angle = (Math.random() * Math.PI * 2);
+                const distance = 50 + Math.random() * 100;
+                const tx = Math.cos(angle) * distance;
+                const ty = Math.sin(angle) * distance;
+                const rotation = Math.random() * 720 - 360; // Random rotation
+
+                emoji.style.left = x + 'px';
+                emoji.style.top = y + 'px';
+                emoji.style.setProperty('--tx', tx + 'px');
+                emoji.style.setProperty('--ty', ty + 'px');
+                emoji.style.setProperty('--rot', rotation + 'deg');
+
+                document.body.appendChild(emoji);
+
+                // Remove emoji after animation
+                setTimeout(() => emoji.remove(), 2000);
+            }
+        }
+
+        // Study mode answers (qNum -> {selected, correctLabel, correct, timestamp}), filled by loadProgress
+        let studySession = {};
+
+        // Show the saved study answer of a question on its card, if the card is rendered
+        function applyStudyState(qNum) {
+            const data = studySession[qNum];
+            const card = document.getElementById('q' + qNum);
+            if (!data || !card) return;
+
+            const options = card.querySelectorAll('.option');
+            const resultDiv = document.getElementById('result' + qNum);
+
+            // Disable all options
+            options.forEach(opt => opt.classList.add('disabled'));
+
+            // Restore visual state
+            options.forEach(opt => {
+                if (opt.dataset.label === data.selected) {
+                    if (data.correct) {
+                        opt.classList.add('correct');
+                    } else {
+                        opt.classList.add('incorrect');
+                    }
+                } else if (!data.correct && opt.dataset.label === data.correctLabel) {
+                    opt.classList.add('correct');
+                }
+            });
+
+            // Restore result message only if resultDiv exists
+            if (resultDiv) {
+                if (data.correct) {
+                    resultDiv.innerHTML = '✓ Correcto';
+                    resultDiv.classList.add('correct');
+                } else {
+                    resultDiv.innerHTML = '✗ Incorrecto';
+                }
+            }
+        }
+
+        function restoreStudyState() {
+            let correctCount = 0;
+
+            console.log('Restoring', Object.keys(studySession).length, 'answered questions');
+
+            for (const [qNumStr, data] of Object.entries(studySession)) {
+                const qNum = parseInt(qNumStr);
+                // Cards mounted later pick up their state in restoreCardState
+                applyStudyState(qNum);
+                if (data.correct) correctCount++;
+            }
+
+            // Update revealed count
+            revealedCount = correctCount;
+            document.getElementById('revealed').textContent = revealedCount;
+
+            // Always scroll to first unanswered question on page load
+            scrollToFirstUnanswered();
+        }
+
+        function scrollToFirstUnanswered() {
+            // Find the first unanswered question in list order
+            const position = studyList.questions.findIndex(qNum => !studySession[qNum]);
+            if (position >= 0) {
+                currentQuestionIndex = position;
+                // Small delay to ensure DOM is ready
+                setTimeout(() => scrollToQuestion(studyList.questions[position]), 100);
+            }
+        }
+
+        function clearStudySession() {
+            Object.keys(studySession).forEach(qNum => markQuestionDirty(parseInt(qNum)));
+            studySession = {};
+        }
+
+        function selectOption(button, qNum, selectedLabel, correctLabel) {
+            // Check if in quiz mode
+            if (quizMode.active) {
+                selectQuizAnswer(qNum, selectedLabel);
+                return;
+            }
+
+            // Prevent multiple answers in study mode
+            if (studySession[qNum]) {
+                return;
+            }
+
+            // Get all option buttons for this question
+            const card = getCard(qNum);
+            const options = card.querySelectorAll('.option');
+            const resultDiv = document.getElementById('result' + qNum);
+
+            // Disable all options
+            options.forEach(opt => opt.classList.add('disabled'));
+
+            // Mark selected option
+            const isCorrect = selectedLabel === correctLabel;
+
+            // Save to study session
+            studySession[qNum] = {
+                selected: selectedLabel,
+                correctLabel: correctLabel,
+                correct: isCorrect,
+                timestamp: Date.now()
+            };
+            markQuestionDirty(qNum);
+            logAttempt(qNum, selectedLabel, isCorrect, practiceMode.active ? 'practice' : 'study');
+
+            if (isCorrect) {
+                button.classList.add('correct');
+                resultDiv.innerHTML = '✓ Correcto';
+                resultDiv.classList.add('correct');
+                revealedCount++;
+                document.getElementById('revealed').textContent = revealedCount;
+
+                // Create emoji explosion at click position
+                const rect = button.getBoundingClientRect();
+                const x = rect.left + rect.width / 2;
+                const y = rect.top + rect.height / 2;
+                createEmojiExplosion(x, y);
+            } else {
+                button.classList.add('incorrect');
+                // Also highlight the correct option
+                options.forEach(opt => {
+                    if (opt.dataset.label === correctLabel) {
+                        opt.classList.add('correct');
+                    }
+                });
+                resultDiv.innerHTML = '✗ Incorrecto';
+            }
+
+            // Update question score
+            updateQuestionScore(qNum, isCorrect);
+
+            // In practice mode, automatically show next question after a delay
+            if (practiceMode.active) {
+                setTimeout(() => {
+                    showNextPracticeQuestion();
+                }, 1500);
+            }
+        }
+
+        function toggleTranslate(qNum) {
+            // Disable in quiz mode until results
+            if (quizMode.active && !quizMode.results) return;
+
+            const el = document.getElementById('trans' + qNum);
+            if (el.classList.contains('show')) {
+                el.classList.remove('show');
+                el.innerHTML = '';
+                openPanels.translation.delete(qNum);
+            } else {
+                showTranslation(qNum);
+                openPanels.translation.add(qNum);
+            }
+            scheduleStudyListRender();
+        }
+
+        function showTranslation(qNum) {
+            const el = document.getElementById('trans' + qNum);
+            const data = questionData[qNum];
+            const ruQ = data.ruQ;
+            const ruOptions = data.ruOptions;
+            const esOptions = data.options;
+            const correctLabel = data.correct;
+
+            // Create a map of Spanish options by label
+            const esMap = {};
+            esOptions.forEach(opt => {
+                esMap[opt.label] = opt.text;
+            });
+
+            let html = '<strong>Вопрос:</strong> ' + escapeHtml(ruQ) + '<br><br>';
+
+            if (ruOptions.length > 0) {
+                html += '<strong>Варианты:</strong><br>';
+                ruOptions.forEach(opt => {
+                    const isCorrect = opt.label === correctLabel;
+                    const checkmark = isCorrect ? ' ✓' : '';
+                    const spanishText = isCorrect && esMap[opt.label] ? ' <span style="color: var(--text-secondary); font-weight: 400; font-size: 0.95em;">(' + escapeHtml(esMap[opt.label]) + ')</span>' : '';
+                    const style = isCorrect ? ' style="color: var(--success); font-weight: 600;"' : '';
+                    html += escapeHtml(opt.label) + ') ' + '<span' + style + '>' + escapeHtml(opt.text) + checkmark + '</span>' + spanishText + '<br>';
+                });
+            } else {
+                html += '<em style="color: var(--text-tertiary);">Перевод вариантов пока недоступен</em>';
+            }
+
+            el.innerHTML = html;
+            el.classList.add('show');
+            highlightMatches(el);
+        }
+
+        function toggleExplain(qNum) {
+            // Disable in quiz mode until results
+            if (quizMode.active && !quizMode.results) return;
+
+            const el = document.getElementById('expl' + qNum);
+            if (el.classList.contains('show')) {
+                el.classList.remove('show');
+                el.innerHTML = '';
+                openPanels.explanation.delete(qNum);
+            } else {
+                showExplanation(qNum);
+                openPanels.explanation.add(qNum);
+            }
+            scheduleStudyListRender();
+        }
+
+        function showExplanation(qNum) {
+            const el = document.getElementById('expl' + qNum);
+            el.textContent = questionData[qNum].explanation || 'Объяснение недоступно';
+            el.classList.add('show');
+            highlightMatches(el);
+        }
+
+        // ==========================================
+        // SEARCH
+        // ==========================================
+
+        // Inverted index built by the generator (see build_search_index): sorted
+        // folded terms and, per term, postings of position * 8 + field weight,
+        // where position indexes allQuestionNumbers.
+        const searchIndex = ccseData.searchIndex;
+        let trigramTable = null;  // trigram -> term indexes, decoded when the page is idle
+        const searchState = { terms: [], words: new Set(), timer: null };
+
+        // Lowercase without diacritics, like fold_text in the generator
+        // ("Constitución" -> "constitucion", "ё" -> "е")
+        function foldText(text) {
+            return text.toLowerCase().normalize('NFD').replace(/\p{Mn}/gu, '');
+        }
+
+        function searchTerms(query) {
+            return foldText(query).match(/[\p{L}\p{N}]+/gu) || [];
+        }
+
+        // Index of the first vocabulary term >= term
+        function lowerBound(vocabulary, term) {
+            let lo = 0;
+            let hi = vocabulary.length;
+            while (lo < hi) {
+                const mid = (lo + hi) >> 1;
+                if (vocabulary[mid] < term) lo = mid + 1;
+                else hi = mid;
+            }
+            return lo;
+        }
+
+        function termTrigrams(term) {
+            const padded = '^' + term;
+            const grams = new Set();
+            for (let i = 0; i + 3 <= padded.length; i++) grams.add(padded.slice(i, i + 3));
+            return grams;
+        }
+
+        // Edit distance between a and the closest prefix of b, or max + 1 once it exceeds max
+        function prefixDistance(a, b, max) {
+            const n = Math.min(b.length, a.length + max);
+            let prev = [];
+            for (let j = 0; j <= n; j++) prev.push(j);
+            for (let i = 1; i <= a.length; i++) {
+                const row = [i];
+                let rowMin = i;
+                for (let j = 1; j <= n; j++) {
+                    const cost = a[i - 1] === b[j - 1] ? 0 : 1;
+                    row.push(Math.min(prev[j] + 1, row[j - 1] + 1, prev[j - 1] + cost));
+                    if (row[j] < rowMin) rowMin = row[j];
+                }
+                if (rowMin > max) return max + 1;
+                prev = row;
+            }
+            return Math.min(...prev);
+        }
+
+        function decodeTrigramTable() {
+            if (trigramTable) return;
+            trigramTable = new Map();
+            for (const gram in searchIndex.trigrams) {
+                const deltas = searchIndex.trigrams[gram];
+                const ids = new Int32Array(deltas.length);
+                let idx = 0;
+                for (let i = 0; i < deltas.length; i++) ids[i] = (idx += deltas[i]);
+                trigramTable.set(gram, ids);
+            }
+        }
+
+        // Decode the table before the first search needs it, while the page is idle
+        if ('requestIdleCallback' in window) requestIdleCallback(decodeTrigramTable, { timeout: 3000 });
+        else setTimeout(decodeTrigramTable, 1000);
+
+        // Vocabulary indexes of the words a term could be a misspelling of (or of the start of)
+        function fuzzyMatches(term) {
+            if (term.length < 4 || /^\d+$/.test(term)) return [];
+            decodeTrigramTable();
+
+            // Every edit destroys at most three trigrams, so candidates must share the rest
+            const maxDistance = term.length >= 7 ? 2 : 1;
+            const grams = termTrigrams(term);
+            const needed = Math.max(1, grams.size - 3 * maxDistance);
+            const shared = new Map();
+            grams.forEach(gram => {
+                (trigramTable.get(gram) || []).forEach(i => shared.set(i, (shared.get(i) || 0) + 1));
+            });
+
+            const matches = [];
+            shared.forEach((count, i) => {
+                if (count >= needed && prefixDistance(term, searchIndex.terms[i], maxDistance) <= maxDistance) {
+                    matches.push(i);
+                }
+            });
+            return matches;
+        }
+
+        // Questions matching every term, most relevant first. A term matches the
+        // words it starts, or, if there are none, the words within one or two
+        // typos of it. A question scores the weight of the best field matching
+        // each term, doubled when the word is exactly the term.
+        function searchQuestions(terms) {
+            const vocabulary = searchIndex.terms;
+            const words = new Set();
+            let scores = null;
+
+            for (const term of terms) {
+                let matches = [];
+                for (let i = lowerBound(vocabulary, term); i < vocabulary.length && vocabulary[i].startsWith(term); i++) {
+                    matches.push(i);
+                }
+                if (matches.length === 0) matches = fuzzyMatches(term);
+
+                const termScores = new Map();
+                for (const i of matches) {
+                    words.add(vocabulary[i]);
+                    const factor = vocabulary[i] === term ? 2 : 1;
+                    for (const code of searchIndex.postings[i]) {
+                        const position = code >> 3;
+                        const score = (code & 7) * factor;
+                        if (score > (termScores.get(position) || 0)) termScores.set(position, score);
+                    }
+                }
+
+                if (scores === null) {
+                    scores = termScores;
+                } else {
+                    const both = new Map();
+                    scores.forEach((score, position) => {
+                        if (termScores.has(position)) both.set(position, score + termScores.get(position));
+                    });
+                    scores = both;
+                }
+                if (scores.size === 0) break;
+            }
+
+            searchState.words = words;
+            return Array.from(scores.entries())
+                .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+                .map(([position]) => allQuestionNumbers[position]);
+        }
+
+        // Wrap the words under el that matched the search in <mark>
+        function highlightMatches(el) {
+            if (!el || searchState.words.size === 0) return;
+            const textNodes = [];
+            const collect = node => node.childNodes.forEach(child => {
+                if (child.nodeType === 1 && child.tagName !== 'MARK') collect(child);
+                else if (child.nodeType === 3) textNodes.push(child);
+            });
+            collect(el);
+
+            textNodes.forEach(node => {
+                const text = node.textContent;
+                const pieces = [];
+                let last = 0;
+                for (const match of text.matchAll(/[\p{L}\p{N}]+/gu)) {
+                    if (!searchState.words.has(foldText(match[0]))) continue;
+                    if (match.index > last) pieces.push(document.createTextNode(text.slice(last, match.index)));
+                    const mark = document.createElement('mark');
+                    mark.className = 'search-hit';
+                    mark.textContent = match[0];
+                    pieces.push(mark);
+                    last = match.index + match[0].length;
+                }
+                if (pieces.length === 0) return;
+                if (last < text.length) pieces.push(document.createTextNode(text.slice(last)));
+                pieces.forEach(piece => node.parentNode.insertBefore(piece, node));
+                node.remove();
+            });
+        }
+
+        // Fill the study list with the results of the search box (all questions if it is empty)
+        function showSearchResults() {
+            searchState.terms = searchTerms(document.querySelector('.search-box').value);
+            if (searchState.terms.length === 0) {
+                searchState.words = new Set();
+                setStudyList(allQuestionNumbers);
+            } else {
+                // Ranked results, without section headers
+                setStudyList(searchQuestions(searchState.terms), false);
+            }
+        }
+
+        function runSearch() {
+            showSearchResults();
+            currentQuestionIndex = 0;
+            updateNavButtons();
+
+            // Bring the top of the results into view if the list starts above the viewport
+            const listTop = document.getElementById('questionList').getBoundingClientRect().top;
+            if (listTop < 0) window.scrollBy(0, listTop - 80);
+        }
+
+        // Search box input; waits for a pause in typing
+        function filterQuestions() {
+            clearTimeout(searchState.timer);
+            searchState.timer = setTimeout(runSearch, 150);
+        }
+
+        // Print unanswered questions only
+        function printUnanswered() {
+            mountAllForPrint();
+            const cards = document.querySelectorAll('.question-card');
+            cards.forEach(card => {
+                const answer = card.querySelector('.answer');
+                if (answer && answer.classList.contains('revealed')) {
+                    card.classList.add('print-hide');
+                } else {
+                    card.classList.remove('print-hide');
+                }
+            });
+            window.print();
+            // Remove print-hide class after printing
+            setTimeout(() => {
+                cards.forEach(card => card.classList.remove('print-hide'));
+            }, 1000);
+        }
+
+        // Navigation functions; positions are indexes into the current list of questions
+        let currentQuestionIndex = 0;
+
+        function navigateQuestion(direction) {
+            const visible = studyList.questions;
+            if (visible.length === 0) return;
+
+            currentQuestionIndex += direction;
+            if (currentQuestionIndex < 0) currentQuestionIndex = 0;
+            if (currentQuestionIndex >= visible.length) currentQuestionIndex = visible.length - 1;
+
+            scrollToQuestion(visible[currentQuestionIndex]);
+            updateNavButtons();
+        }
+
+        function updateNavButtons() {
+            const prevBtn = document.getElementById('prevBtn');
+            const nextBtn = document.getElementById('nextBtn');
+
+            if (prevBtn) prevBtn.disabled = currentQuestionIndex === 0;
+            if (nextBtn) nextBtn.disabled = currentQuestionIndex >= studyList.questions.length - 1;
+        }
+
+        function scrollToTop() {
+            window.scrollTo({ top: 0, behavior: 'smooth' });
+        }
+
+        function scrollToNextUnanswered() {
+            const visible = studyList.questions;
+            let position = visible.findIndex((qNum, index) => index > currentQuestionIndex && !studySession[qNum]);
+            if (position < 0) {
+                // Wrap around to first unanswered
+                position = visible.findIndex(qNum => !studySession[qNum]);
+            }
+            if (position >= 0) {
+                currentQuestionIndex = position;
+                scrollToQuestion(visible[position]);
+                updateNavButtons();
+            }
+        }
+
+        // Swipe gesture support for mobile
+        let touchStartX = 0;
+        let touchStartY = 0;
+        let touchEndX = 0;
+        let touchEndY = 0;
+
+        document.addEventListener('touchstart', e => {
+            touchStartX = e.changedTouches[0].screenX;
+            touchStartY = e.changedTouches[0].screenY;
+        }, { passive: true });
+
+        document.addEventListener('touchend', e => {
+            touchEndX = e.changedTouches[0].screenX;
+            touchEndY = e.changedTouches[0].screenY;
+            handleSwipe();
+        }, { passive: true });
+
+        function handleSwipe() {
+            const swipeThreshold = 50;
+            const deltaX = touchEndX - touchStartX;
+            const deltaY = touchEndY - touchStartY;
+
+            // Only trigger swipe if horizontal movement is greater than vertical
+            if (Math.abs(deltaX) > Math.abs(deltaY) && Math.abs(deltaX) > swipeThreshold) {
+                if (deltaX > 0) {
+                    // Swipe right - previous question
+                    navigateQuestion(-1);
+                } else {
+                    // Swipe left - next question
+                    navigateQuestion(1);
+                }
+            }
+        }
+
+        // Update current question index on scroll
+        let scrollTimeout;
+        window.addEventListener('scroll', () => {
+            clearTimeout(scrollTimeout);
+            scrollTimeout = setTimeout(() => {
+                // The entry under the middle of the viewport (or the first question after a header)
+                const list = document.getElementById('questionList');
+                const index = findEntry(window.innerHeight / 2 - list.getBoundingClientRect().top);
+                const entry = studyList.entries[index];
+                const question = entry && entry.type === 'section' ? studyList.entries[index + 1] : entry;
+                if (question) currentQuestionIndex = question.position;
+
+                updateNavButtons();
+            }, 100);
+        }, { passive: true });
+
+        // Initialize nav buttons
+        updateNavButtons();
+
+        // Hamburger menu functions (mobile only)
+        function toggleMenu() {
+            // Only toggle on mobile
+            if (window.innerWidth <= 768) {
+                const menu = document.getElementById('indexMenu');
+                const overlay = document.querySelector('.menu-overlay');
+                menu.classList.toggle('open');
+                overlay.classList.toggle('open');
+            }
+        }
+
+        // Build index/table of contents
+        function buildIndex() {
+            console.log('buildIndex() called');
+            const sections = Object.keys(sectionTitles);
+            const indexContent = document.getElementById('indexContent');
+            console.log('Found sections:', sections.length);
+            console.log('indexContent element:', indexContent);
+
+            if (!indexContent) {
+                console.error('indexContent element not found!');
+                return;
+            }
+
+            sections.forEach(section => {
+                const sectionDiv = document.createElement('div');
+                sectionDiv.className = 'index-section';
+
+                const titleDiv = document.createElement('div');
+                titleDiv.className = 'index-section-title collapsed';
+                titleDiv.textContent = sectionTitles[section][0];
+
+                const contentDiv = document.createElement('div');
+                contentDiv.className = 'index-section-content collapsed';
+
+                // Toggle collapse on click
+                titleDiv.onclick = () => {
+                    titleDiv.classList.toggle('collapsed');
+                    contentDiv.classList.toggle('collapsed');
+                };
+
+                sectionDiv.appendChild(titleDiv);
+
+                // One link per question of the section
+                sectionQuestions[section].forEach(qNum => {
+                    const question = questionData[qNum].q;
+
+                    const link = document.createElement('a');
+                    link.href = '#';
+                    link.className = 'index-link';
+                    if (studySession[qNum]) {
+                        link.classList.add('answered');
+                    }
+                    link.textContent = '#' + qNum + ' ' + (question.length > 40 ? question.substring(0, 40) + '...' : question);
+                    link.onclick = (e) => {
+                        e.preventDefault();
+                        scrollToQuestion(qNum);
+                        const position = studyList.questions.indexOf(qNum);
+                        if (position >= 0) currentQuestionIndex = position;
+                        // Close menu only on mobile
+                        if (window.innerWidth <= 768) {
+                            toggleMenu();
+                        }
+                    };
+                    contentDiv.appendChild(link);
+                });
+
+                sectionDiv.appendChild(contentDiv);
+                indexContent.appendChild(sectionDiv);
+            });
+        }
+
+        // Time allowed for the full exam; shorter quizzes get a proportional share
+        const FULL_EXAM_MINUTES = 45;
+
+        // Quiz Mode Implementation
+        let quizMode = {
+            active: false,
+            currentQuestionIndex: 0,
+            config: {
+                questionCount: 25,
+                sections: [],
+                randomOrder: false,
+                timerEnabled: false,
+                timerMinutes: FULL_EXAM_MINUTES
+            },
+            session: {
+                questions: [],
+                answers: {},
+                flagged: new Set(),
+                startTime: null,
+                endTime: null,
+                timerInterval: null
+            },
+            results: null
+        };
+
+        // Enable/disable inputs based on radio selection
+        document.querySelectorAll('input[name="questionMode"]').forEach(radio => {
+            radio.addEventListener('change', (e) => {
+                const mode = e.target.value;
+                document.getElementById('sectionSelect').disabled = (mode !== 'section');
+                document.getElementById('customCount').disabled = (mode !== 'custom');
+            });
+        });
+
+        function openQuizConfig() {
+            document.getElementById('quizModal').style.display = 'flex';
+        }
+
+        function closeQuizConfig() {
+            document.getElementById('quizModal').style.display = 'none';
+        }
+
+        function startQuizFromConfig() {
+            const questionMode = document.querySelector('input[name="questionMode"]:checked').value;
+            const timerMode = document.querySelector('input[name="timerMode"]:checked').value;
+            const randomOrder = document.getElementById('randomOrder').checked;
+
+            const config = {
+                randomOrder: randomOrder,
+                timerEnabled: timerMode !== 'none',
+                timerMinutes: FULL_EXAM_MINUTES
+            };
+
+            // Determine question selection
+            if (questionMode === 'all') {
+                config.questionCount = allQuestionNumbers.length;
+                config.sections = [];
+            } else if (questionMode === 'section') {
+                const section = parseInt(document.getElementById('sectionSelect').value);
+                config.sections = [section];
+                config.questionCount = sectionQuestions[section].length;
+            } else {
+                config.questionCount = parseInt(document.getElementById('customCount').value) || 25;
+                config.sections = [];
+            }
+
+            // Adjust timer for proportional mode
+            if (timerMode === 'proportional') {
+                config.timerMinutes = Math.ceil(config.questionCount * FULL_EXAM_MINUTES / totalQuestions);
+            } else if (timerMode === 'full') {
+                config.timerMinutes = FULL_EXAM_MINUTES;
+            }
+
+            closeQuizConfig();
+            startQuiz(config);
+        }
+
+        function getQuizQuestions(config) {
+            let pool = [];
+
+            if (config.sections.length === 0) {
+                // All questions
+                pool = [...allQuestionNumbers];
+            } else {
+                // Specific sections
+                config.sections.forEach(s => {
+                    pool.push(...sectionQuestions[s]);
+                });
+            }
+
+            if (config.randomOrder) {
+                return sampleWithoutReplacement(pool, config.questionCount);
+            }
+
+            return pool.slice(0, config.questionCount);
+        }
+
+        function startQuiz(config) {
+            // Exit practice mode if active
+            if (practiceMode.active) {
+                exitFocusedPractice();
+            }
+
+            quizMode.config = config;
+            quizMode.active = true;
+            quizMode.currentQuestionIndex = 0;
+            quizMode.session.questions = getQuizQuestions(config);
+            quizMode.session.answers = {};
+            quizMode.session.flagged = new Set();
+            quizMode.session.startTime = Date.now();
+            quizMode.results = null;
+
+            // Add quiz mode class to body
+            document.body.classList.add('quiz-mode');
+
+            // Show only the current question; cards are re-rendered in quiz mode,
+            // so no study mode selections carry over
+            showQuizQuestion(0);
+
+            // Update progress and navigation buttons
+            updateQuizProgress();
+            updateQuizNavButtons();
+
+            // Start timer if enabled
+            if (config.timerEnabled) {
+                startTimer(config.timerMinutes);
+            } else {
+                document.getElementById('quizTimer').textContent = '';
+            }
+
+            // Save the session so it can be resumed after a reload
+            saveQuizSession();
+
+            // Update toggle button
+            updateQuizToggleButton();
+        }
+
+        function showQuizQuestion(index) {
+            // Show only the current quiz question
+            if (index >= 0 && index < quizMode.session.questions.length) {
+                const qNum = quizMode.session.questions[index];
+                setStudyList([qNum], false);
+                const card = getCard(qNum);
+                if (card) {
+                    card.scrollIntoView({ behavior: 'smooth', block: 'center' });
+
+                    // Show next/end button if question is already answered
+                    if (quizMode.session.answers[qNum]) {
+                        let quizNextCardBtn = card.querySelector('.quiz-next-card-btn');
+                        if (!quizNextCardBtn) {
+                            quizNextCardBtn = document.createElement('button');
+                            quizNextCardBtn.className = 'quiz-next-card-btn btn-primary';
+
+                            // If last question, show "End Exam" button
+                            if (index >= quizMode.session.questions.length - 1) {
+                                quizNextCardBtn.textContent = t('finishExam');
+                                quizNextCardBtn.onclick = () => submitQuiz();
+                            } else {
+                                quizNextCardBtn.textContent = t('next');
+                                quizNextCardBtn.onclick = () => navigateQuizQuestion(1);
+                            }
+
+                            card.appendChild(quizNextCardBtn);
+                        }
+                    }
+                }
+            }
+        }
+
+        function navigateQuizQuestion(direction) {
+            const newIndex = quizMode.currentQuestionIndex + direction;
+            if (newIndex >= 0 && newIndex < quizMode.session.questions.length) {
+                quizMode.currentQuestionIndex = newIndex;
+                showQuizQuestion(newIndex);
+                updateQuizProgress();
+                updateQuizNavButtons();
+                saveQuizSession();
+            }
+        }
+
+        function updateQuizNavButtons() {
+            const prevBtn = document.getElementById('quizPrevBtn');
+            const nextBtn = document.getElementById('quizNextBtn');
+
+            if (prevBtn) {
+                prevBtn.disabled = quizMode.currentQuestionIndex === 0;
+            }
+
+            if (nextBtn) {
+                nextBtn.disabled = quizMode.currentQuestionIndex >= quizMode.session.questions.length - 1;
+            }
+        }
+
+        function selectQuizAnswer(qNum, label) {
+            quizMode.session.answers[qNum] = label;
+            progress.quizLatency.set(qNum, answerLatency(qNum));
+
+            // Update visual state
+            const card = getCard(qNum);
+            const options = card.querySelectorAll('.option');
+            options.forEach(opt => {
+                opt.classList.remove('selected-quiz');
+                if (opt.dataset.label === label) {
+                    opt.classList.add('selected-quiz');
+                }
+            });
+
+            // Show next button or end exam button
+            let quizNextCardBtn = card.querySelector('.quiz-next-card-btn');
+            if (!quizNextCardBtn) {
+                quizNextCardBtn = document.createElement('button');
+                quizNextCardBtn.className = 'quiz-next-card-btn btn-primary';
+
+                // If last question, show "End Exam" button
+                if (quizMode.currentQuestionIndex >= quizMode.session.questions.length - 1) {
+                    quizNextCardBtn.textContent = t('finishExam');
+                    quizNextCardBtn.onclick = () => submitQuiz();
+                } else {
+                    quizNextCardBtn.textContent = t('next');
+                    quizNextCardBtn.onclick = () => navigateQuizQuestion(1);
+                }
+
+                card.appendChild(quizNextCardBtn);
+            }
+
+            // Update progress
+            updateQuizProgress();
+
+            // Save session
+            saveQuizSession();
+        }
+
+        function updateQuizProgress() {
+            const answered = Object.keys(quizMode.session.answers).length;
+            const total = quizMode.session.questions.length;
+            const percentage = total > 0 ? (answered / total * 100) : 0;
+            const current = quizMode.currentQuestionIndex + 1;
+
+            document.getElementById('quizProgressText').textContent = `${t('question')} ${current}/${total} (${answered} ${t('answered')})`;
+            document.getElementById('progressFill').style.width = percentage + '%';
+        }
+
+        function startTimer(minutes) {
+            const endTime = Date.now() + minutes * 60 * 1000;
+
+            function updateTimer() {
+                const remaining = Math.max(0, endTime - Date.now());
+                const mins = Math.floor(remaining / 60000);
+                const secs = Math.floor((remaining % 60000) / 1000);
+
+                const display = `${String(mins).padStart(2, '0')}:${String(secs).padStart(2, '0')}`;
+                const timerEl = document.getElementById('quizTimer');
+                timerEl.textContent = display;
+
+                // Warning at 5 minutes
+                if (mins < 5) {
+                    timerEl.classList.add('warning');
+                } else {
+                    timerEl.classList.remove('warning');
+                }
+
+                // Auto-submit at 0
+                if (remaining === 0) {
+                    stopTimer();
+                    alert(t('timeExpired'));
+                    calculateResults();
+                }
+            }
+
+            updateTimer();
+            quizMode.session.timerInterval = setInterval(updateTimer, 1000);
+        }
+
+        function stopTimer() {
+            if (quizMode.session.timerInterval) {
+                clearInterval(quizMode.session.timerInterval);
+                quizMode.session.timerInterval = null;
+            }
+        }
+
+        function submitQuiz() {
+            console.log('submitQuiz called');
+            const answered = Object.keys(quizMode.session.answers).length;
+            const total = quizMode.session.questions.length;
+            const unanswered = total - answered;
+
+            let message = t('confirmFinish');
+            if (unanswered > 0) {
+                message += `\n\n${t('unansweredQuestions')} ${unanswered} ${t('questionsUnanswered')}`;
+            }
+
+            if (confirm(message)) {
+                console.log('User confirmed, calculating results...');
+                stopTimer();
+                calculateResults();
+            }
+        }
+
+        function calculateResults() {
+            console.log('calculateResults called');
+            quizMode.session.endTime = Date.now();
+
+            const results = {
+                correct: 0,
+                total: quizMode.session.questions.length,
+                bySection: {},
+                details: []
+            };
+
+            quizMode.session.questions.forEach(qNum => {
+                const userAnswer = quizMode.session.answers[qNum];
+                const correctLabel = questionData[qNum].correct;
+                console.log(`Question ${qNum}: user=${userAnswer}, correct=${correctLabel}`);
+
+                const isCorrect = userAnswer === correctLabel;
+
+                if (isCorrect) results.correct++;
+
+                const section = questionSection[qNum];
+                if (!results.bySection[section]) {
+                    results.bySection[section] = {correct: 0, total: 0};
+                }
+                results.bySection[section].total++;
+                if (isCorrect) results.bySection[section].correct++;
+
+                results.details.push({qNum, userAnswer, correctLabel, isCorrect});
+
+                // Update question score for spaced repetition
+                if (userAnswer !== undefined) {
+                    updateQuestionScore(qNum, isCorrect);
+                    logAttempt(qNum, userAnswer, isCorrect, 'quiz', progress.quizLatency.get(qNum) ?? null);
+                }
+            });
+
+            results.percentage = (results.correct / results.total * 100).toFixed(1);
+            results.passed = results.percentage >= 60;
+
+            progress.quizLatency.clear();
+
+            // Calculate time taken
+            const timeMs = quizMode.session.endTime - quizMode.session.startTime;
+            const mins = Math.floor(timeMs / 60000);
+            const secs = Math.floor((timeMs % 60000) / 1000);
+            results.timeTaken = `${mins}m ${secs}s`;
+
+            quizMode.results = results;
+
+            // Clear the saved quiz session
+            setProgressMeta('quizSession', undefined);
+
+            // Show results
+            showQuizResults();
+        }
+
+        function showQuizResults() {
+            console.log('showQuizResults called', quizMode.results);
+            document.body.classList.remove('quiz-mode');
+            document.body.classList.add('quiz-results');
+
+            const results = quizMode.results;
+            console.log('Body classes:', document.body.className);
+            // Build section performance HTML
+            let sectionHTML = '';
+            Object.keys(results.bySection).sort().forEach(section => {
+                const data = results.bySection[section];
+                const pct = (data.correct / data.total * 100).toFixed(0);
+                sectionHTML += `
+                    <div class="performance-bar">
+                        <div class="performance-label">${escapeHtml(sectionTitles[section] ? sectionTitles[section][0] : 'Sección ' + section)}</div>
+                        <div class="performance-track">
+                            <div class="performance-fill" style="width: ${pct}%"></div>
+                        </div>
+                        <div class="performance-percentage">${pct}%</div>
+                    </div>
+                `;
+            });
+
+            // Calculate circle progress
+            const radius = 75;
+            const circumference = 2 * Math.PI * radius;
+            const progressOffset = circumference - (results.percentage / 100 * circumference);
+
+            const passMessage = {
+                'es': 'Has aprobado el examen con éxito.',
+                'en': 'You have successfully passed the examination.',
+                'ru': 'Вы успешно сдали экзамен.'
+            };
+
+            const failMessage = {
+                'es': 'No has alcanzado la puntuación mínima. ¡Sigue practicando!',
+                'en': 'You have not reached the minimum score. Keep practicing!',
+                'ru': 'Вы не набрали минимальный балл. Продолжайте практиковаться!'
+            };
+
+            const html = `
+                <div class="results-container">
+                    <div class="results-card ${results.passed ? 'passed' : 'failed'}">
+                        <div class="results-hero">
+                            <div class="results-content">
+                                <div class="results-kicker">CCSE 2026 — ${t('examTimeExpired').split('.')[0] || 'RESULTADO DEL EXAMEN'}</div>
+                                <h1 class="results-status ${results.passed ? 'passed' : 'failed'}">
+                                    ${results.passed ? t('passed') : t('failed')}
+                                </h1>
+                                <p class="results-subtitle">
+                                    ${results.passed ? passMessage[currentLanguage] : failMessage[currentLanguage]}
+                                </p>
+                                <div class="results-meta">
+                                    <div class="results-meta-item">
+                                        <div class="results-meta-label">${t('correctAnswers')}</div>
+                                        <div class="results-meta-value">${results.correct} / ${results.total}</div>
+                                    </div>
+                                    <div class="results-meta-item">
+                                        <div class="results-meta-label">${t('time')}</div>
+                                        <div class="results-meta-value">${results.timeTaken}</div>
+                                    </div>
+                                </div>
+                            </div>
+                            <div class="results-score-section">
+                                <div class="results-score-circle">
+                                    <svg width="160" height="160" viewBox="0 0 160 160">
+                                        <defs>
+                                            <linearGradient id="scoreGradient" x1="0%" y1="0%" x2="100%" y2="100%">
+                                                <stop offset="0%" style="stop-color:${results.passed ? '#065f46' : '#b45309'};stop-opacity:1" />
+                                                <stop offset="100%" style="stop-color:${results.passed ? '#10b981' : '#f59e0b'};stop-opacity:1" />
+                                            </linearGradient>
+                                        </defs>
+                                        <circle class="results-circle-bg" cx="80" cy="80" r="${radius}" />
+                                        <circle
+                                            class="results-circle-progress"
+                                            cx="80"
+                                            cy="80"
+                                            r="${radius}"
+                                            stroke-dasharray="${circumference}"
+                                            stroke-dashoffset="${progressOffset}"
+                                        />
+                                    </svg>
+                                    <div class="results-score">
+                                        <div class="results-score-number ${results.passed ? 'passed' : 'failed'}">${results.percentage}%</div>
+                                        <div class="results-score-label">${t('questionsAnswered').toUpperCase()}</div>
+                                    </div>
+                                </div>
+                            </div>
+                        </div>
+                        <div class="section-performance">
+                            <h3>${t('sectionPerformance')}</h3>
+                            <div class="performance-grid">
+                                ${sectionHTML}
+                            </div>
+                        </div>
+                        <div class="results-actions">
+                            <button class="btn-primary" onclick="retryQuiz()">${t('newExam')}</button>
+                            <button class="btn-secondary" onclick="reviewQuizQuestions()">${t('reviewQuestions')}</button>
+                            <button class="btn-secondary" onclick="exitToStudyMode()">${t('studyMode')}</button>
+                        </div>
+                    </div>
+                    <div id="questionReviewContainer"></div>
+                </div>
+            `;
+
+            const resultsPageEl = document.getElementById('resultsPage');
+            console.log('resultsPage element:', resultsPageEl);
+            resultsPageEl.innerHTML = html;
+            console.log('Results HTML inserted, resultsPage display:', window.getComputedStyle(resultsPageEl).display);
+        }
+
+        function reviewQuizQuestions() {
+            const container = document.getElementById('questionReviewContainer');
+
+            // If already showing review, scroll to it
+            if (container.innerHTML) {
+                container.scrollIntoView({ behavior: 'smooth', block: 'start' });
+                return;
+            }
+
+            let html = `<h3 style="margin: 32px 0 24px; font-size: 1.5rem; font-family: 'Crimson Pro', Georgia, serif; font-weight: 700;">${t('detailedReview')}</h3>`;
+
+            quizMode.results.details.forEach(detail => {
+                const qNum = detail.qNum;
+                const data = questionData[qNum];
+                const question = escapeHtml(data.q);
+                const optionText = label => {
+                    const opt = data.options.find(o => o.label === label);
+                    return opt ? escapeHtml(opt.label + ') ' + opt.text) : null;
+                };
+
+                const userOption = optionText(detail.userAnswer);
+                const correctOption = optionText(detail.correctLabel);
+
+                html += `
+                    <div class="question-review">
+                        <div class="review-header">
+                            <div class="q-number">#${qNum}</div>
+                            <div class="review-status ${detail.isCorrect ? 'correct-review' : 'incorrect-review'}">
+                                ${detail.isCorrect ? '✓ ' + t('correct') : '✗ ' + t('incorrect')}
+                            </div>
+                        </div>
+                        <div class="review-question">${question}</div>
+                        <div class="review-answers">
+                            ${detail.userAnswer ? `
+                                <div class="review-answer ${detail.isCorrect ? 'user-correct' : 'user-incorrect'}">
+                                    ${t('yourAnswer')} ${userOption || t('notAnswered')}
+                                </div>
+                            ` : `<div class="review-answer user-incorrect">${t('notAnswered')}</div>`}
+                            ${!detail.isCorrect ? `
+                                <div class="review-answer correct-answer">
+                                    ${t('correctAnswer')} ${correctOption || 'N/A'}
+                                </div>
+                            ` : ''}
+                        </div>
+                    </div>
+                `;
+            });
+
+            container.innerHTML = html;
+
+            // Scroll to review section
+            setTimeout(() => {
+                container.scrollIntoView({ behavior: 'smooth', block: 'start' });
+            }, 100);
+        }
+
+        function retryQuiz() {
+            // Exit results mode first
+            document.body.classList.remove('quiz-results');
+            quizMode.active = false;
+            quizMode.results = null;
+
+            // Reset quiz session
+            quizMode.session = {
+                questions: [],
+                answers: {},
+                flagged: new Set(),
+                startTime: null,
+                endTime: null,
+                timerInterval: null
+            };
+
+            // Show all cards again, re-rendered without quiz state
+            showSearchResults();
+
+            // Open quiz config
+            openQuizConfig();
+        }
+
+        function exitToStudyMode() {
+            document.body.classList.remove('quiz-results');
+            quizMode.active = false;
+            quizMode.results = null;
+
+            // Reset quiz session
+            quizMode.session = {
+                questions: [],
+                answers: {},
+                flagged: new Set(),
+                startTime: null,
+                endTime: null,
+                timerInterval: null
+            };
+
+            // Show all cards again, re-rendered without quiz state
+            showSearchResults();
+
+            // Scroll to top
+            window.scrollTo({ top: 0, behavior: 'smooth' });
+
+            // Update toggle button
+            updateQuizToggleButton();
+        }
+
+        function exitQuiz() {
+            if (confirm(t('confirmExit'))) {
+                stopTimer();
+                document.body.classList.remove('quiz-mode');
+                quizMode.active = false;
+
+                // Clear session
+                setProgressMeta('quizSession', undefined);
+
+                // Show all cards again, re-rendered without quiz state
+                showSearchResults();
+
+                // Scroll to top
+                window.scrollTo({ top: 0, behavior: 'smooth' });
+
+                // Update toggle button
+                updateQuizToggleButton();
+            }
+        }
+
+        // Custom confirmation dialog
+        function showConfirmDialog(message, confirmText, cancelText, onConfirm, onCancel) {
+            // Create modal overlay
+            const overlay = document.createElement('div');
+            overlay.style.cssText = 'position: fixed; top: 0; left: 0; right: 0; bottom: 0; background: rgba(0,0,0,0.7); z-index: 10000; display: flex; align-items: center; justify-content: center; padding: 20px;';
+
+            // Create dialog box
+            const dialog = document.createElement('div');
+            dialog.style.cssText = 'background: var(--bg-card); border-radius: 16px; padding: 32px; max-width: 500px; width: 100%; box-shadow: 0 20px 60px rgba(0,0,0,0.3); border: 1px solid var(--border);';
+
+            // Message
+            const msg = document.createElement('p');
+            msg.textContent = message;
+            msg.style.cssText = 'color: var(--text); font-size: 1.125rem; margin-bottom: 24px; line-height: 1.6;';
+            dialog.appendChild(msg);
+
+            // Button container
+            const buttons = document.createElement('div');
+            buttons.style.cssText = 'display: flex; gap: 12px; justify-content: flex-end; flex-wrap: wrap;';
+
+            // Cancel button
+            const cancelBtn = document.createElement('button');
+            cancelBtn.textContent = cancelText;
+            cancelBtn.style.cssText = 'padding: 14px 28px; border-radius: 10px; border: 1px solid var(--border); background: var(--bg); color: var(--text-secondary); cursor: pointer; font-size: 1rem; font-family: inherit; transition: all 0.2s; min-width: 120px; touch-action: manipulation;';
+            cancelBtn.onmouseover = () => cancelBtn.style.background = 'var(--accent-soft)';
+            cancelBtn.onmouseout = () => cancelBtn.style.background = 'var(--bg)';
+            cancelBtn.onclick = () => {
+                document.body.removeChild(overlay);
+                if (onCancel) onCancel();
+            };
+
+            // Confirm button
+            const confirmBtn = document.createElement('button');
+            confirmBtn.textContent = confirmText;
+            confirmBtn.style.cssText = 'padding: 14px 28px; border-radius: 10px; border: none; background: var(--success); color: white; cursor: pointer; font-size: 1rem; font-weight: 600; font-family: inherit; transition: all 0.2s; min-width: 120px; touch-action: manipulation;';
+            confirmBtn.onmouseover = () => confirmBtn.style.background = '#047857';
+            confirmBtn.onmouseout = () => confirmBtn.style.background = 'var(--success)';
+            confirmBtn.onclick = () => {
+                document.body.removeChild(overlay);
+                if (onConfirm) onConfirm();
+            };
+
+            buttons.appendChild(cancelBtn);
+            buttons.appendChild(confirmBtn);
+            dialog.appendChild(buttons);
+            overlay.appendChild(dialog);
+            document.body.appendChild(overlay);
+        }
+
+        function saveQuizSession() {
+            if (quizMode.active && !quizMode.results) {
+                const session = {
+                    config: quizMode.config,
+                    currentQuestionIndex: quizMode.currentQuestionIndex,
+                    questions: quizMode.session.questions,
+                    answers: quizMode.session.answers,
+                    flagged: Array.from(quizMode.session.flagged),
+                    startTime: quizMode.session.startTime
+                };
+                setProgressMeta('quizSession', session);
+            }
+        }
+
+        function restoreQuizSession() {
+            const session = progress.meta.get('quizSession');
+            if (session) {
+                try {
+
+                    // Show custom confirmation dialog
+                    showConfirmDialog(
+                        t('continueExam'),
+                        t('continueButton'),
+                        t('startNewButton'),
+                        // On Continue
+                        () => {
+                            quizMode.config = session.config;
+                            quizMode.active = true;
+                            quizMode.currentQuestionIndex = session.currentQuestionIndex || 0;
+                            quizMode.session.questions = session.questions;
+                            quizMode.session.answers = session.answers;
+                            quizMode.session.flagged = new Set(session.flagged);
+                            quizMode.session.startTime = session.startTime;
+
+                            document.body.classList.add('quiz-mode');
+
+                            // Show only the current question
+                            showQuizQuestion(quizMode.currentQuestionIndex);
+
+                            updateQuizProgress();
+                            updateQuizNavButtons();
+                            updateQuizToggleButton();
+
+                            // Resume timer if enabled
+                            if (session.config.timerEnabled) {
+                                const elapsed = Date.now() - session.startTime;
+                                const remaining = session.config.timerMinutes * 60 * 1000 - elapsed;
+                                if (remaining > 0) {
+                                    startTimer(Math.ceil(remaining / 60000));
+                                } else {
+                                    alert(t('examTimeExpired'));
+                                    calculateResults();
+                                }
+                            } else {
+                                document.getElementById('quizTimer').textContent = '';
+                            }
+                        },
+                        // On Start New
+                        () => {
+                            setProgressMeta('quizSession', undefined);
+                        }
+                    );
+                } catch (e) {
+                    console.error('Error restoring quiz session:', e);
+                    setProgressMeta('quizSession', undefined);
+                }
+            }
+        }
+
+        // Warn before leaving during quiz or practice mode
+        window.addEventListener('beforeunload', (e) => {
+            if ((quizMode.active && !quizMode.results) || practiceMode.active) {
+                e.preventDefault();
+                e.returnValue = t('confirmLeave');
+            }
+        });
+
+        // Mount the cards around the top of the page
+        showSearchResults();
+
+        // Load saved progress, then restore it on the page
+        loadProgress().then(() => {
+            // Try to restore quiz session on page load
+            setTimeout(restoreQuizSession, 500);
+
+            // Restore study session on page load
+            try {
+                restoreStudyState();
+                console.log('Study session restored');
+            } catch (error) {
+                console.error('Error restoring study session:', error);
+            }
+
+            // Build index on load
+            console.log('About to call buildIndex()');
+            try {
+                buildIndex();
+                console.log('buildIndex() completed');
+            } catch (error) {
+                console.error('Error in buildIndex():', error);
+            }
+
+            // Initialize scoring system on page load
+            try {
+                renderAllIndicators();
+                updateStatsPanel();
+                updatePracticeBadge();
+                console.log('Scoring system initialized');
+            } catch (error) {
+                console.error('Error initializing scoring system:', error);
+            }
+        });
+
+        // Register Service Worker for offline support
+        if ('serviceWorker' in navigator) {
+            const registerServiceWorker = () => {
+                navigator.serviceWorker.register('./sw.js')
+                    .then(registration => {
+                        console.log('SW registered:', registration.scope);
+
+                        // Check for updates periodically
+                        setInterval(() => {
+                            registration.update();
+                        }, 60 * 60 * 1000); // Check every hour
+
+                        // Handle updates
+                        registration.addEventListener('updatefound', () => {
+                            const newWorker = registration.installing;
+                            newWorker.addEventListener('statechange', () => {
+                                if (newWorker.state === 'installed' && navigator.serviceWorker.controller) {
+                                    // New content available, could show update prompt
+                                    console.log('New content available, refresh to update');
+                                }
+                            });
+                        });
+                    })
+                    .catch(error => {
+                        console.log('SW registration failed:', error);
+                    });
+            };
+            // In the bundled build this script runs once the data file has
+            // arrived, which may be after the load event
+            if (document.readyState === 'complete') registerServiceWorker();
+            else window.addEventListener('load', registerServiceWorker);
+        }
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Offline batch backend for bulk chat-completion stages.
+
+All pending requests of a stage are written to one JSONL request file and
+submitted as a single Batch API job, which is polled until it finishes.
+Results are stored in the shared response cache under the same keys the
+live code paths use, so a batch run and a live run are interchangeable.
+
+Pass base_url to point the backend at another server, e.g. the local
+stub in batch_stub_server.py for testing. Its replies are cached under
+keys that include base_url, and callers write them to the files named by
+output_path(), so they never reach the live cache or outputs.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from response_cache import chat_key
+
+BATCH_ENDPOINT = '/v1/chat/completions'
+TERMINAL_STATUSES = {'completed', 'failed', 'expired', 'cancelled'}
+
+
+def output_path(path, base_url=None):
+    """Where to write results from base_url: path itself for the real API, a sibling file otherwise
+
+    explanations.json -> explanations.<first 8 hex digits of the base_url hash>.json
+    """
+    path = Path(path)
+    if not base_url:
+        return path
+    tag = hashlib.sha256(base_url.encode('utf-8')).hexdigest()[:8]
+    return path.with_name(f'{path.stem}.{tag}{path.suffix}')
+
+
+def write_request_file(requests, path):
+    """Write {custom_id: chat completion body} as a Batch API JSONL request file"""
+    with open(path, 'w', encoding='utf-8') as f:
+        for custom_id, body in requests.items():
+            line = {'custom_id': custom_id, 'method': 'POST', 'url': BATCH_ENDPOINT, 'body': body}
+            f.write(json.dumps(line, ensure_ascii=False) + '\n')
+
+
+def parse_output(text):
+    """Parse a Batch API output file into {custom_id: message text or None}"""
+    results = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get('response') or {}
+        content = None
+        if response.get('status_code') == 200:
+            content = response['body']['choices'][0]['message']['content'].strip()
+        results[record['custom_id']] = content
+    return results
+
+
+class BatchBackend:
+    """Submits request files to the Batch API (or a compatible server) and collects results"""
+
+    def __init__(self, base_url=None, poll_interval=30.0, completion_window='24h'):
+        from openai import OpenAI
+
+        api_key = os.getenv('OPENAI_API_KEY')
+        if base_url and not api_key:
+            # Stub servers don't check credentials
+            api_key = 'stub'
+        self.client = OpenAI(base_url=base_url, api_key=api_key)
+        self.base_url = base_url
+        self.poll_interval = poll_interval
+        self.completion_window = completion_window
+
+    def submit(self, request_file, description=''):
+        """Upload the request file and create the batch job; returns the batch id"""
+        with open(request_file, 'rb') as f:
+            uploaded = self.client.files.create(file=f, purpose='batch')
+        options = {'metadata': {'description': description}} if description else {}
+        batch = self.client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=self.completion_window,
+            **options,
+        )
+        return batch.id
+
+    def wait(self, batch_id):
+        """Poll until the batch reaches a terminal status"""
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            counts = getattr(batch, 'request_counts', None)
+            if counts is not None:
+                print(f"  Batch {batch_id}: {batch.status} ({counts.completed}/{counts.total})")
+            else:
+                print(f"  Batch {batch_id}: {batch.status}")
+            if batch.status in TERMINAL_STATUSES:
+                return batch
+            time.sleep(self.poll_interval)
+
+    def fetch_results(self, batch):
+        """Download and parse the output file of a finished batch"""
+        if not batch.output_file_id:
+            return {}
+        return parse_output(self.client.files.content(batch.output_file_id).text)
+
+    def run(self, requests, request_file, cache=None, description='', validate=None):
+        """Run {custom_id: body} through one batch job, returning {custom_id: text or None}.
+
+        Requests already in `cache` are answered locally and never submitted;
+        fresh results are written back to it (keyed by base_url too when one
+        was given). If given, validate(custom_id,
+        text) must raise ValueError for a malformed reply: such replies are
+        returned but never cached, and cached ones that fail it are evicted
+        and submitted again.
+        """
+        def valid(custom_id, content):
+            if validate is None:
+                return True
+            try:
+                validate(custom_id, content)
+            except ValueError:
+                return False
+            return True
+
+        results = {}
+        pending = {}
+        for custom_id, body in requests.items():
+            key = chat_key(body, self.base_url)
+            cached = cache.get(key) if cache is not None else None
+            if cached is not None and not valid(custom_id, cached):
+                cache.delete(key)
+                cached = None
+            if cached is not None:
+                results[custom_id] = cached
+            else:
+                pending[custom_id] = body
+
+        print(f"Batch: {len(results)} cached, {len(pending)} to submit")
+        if not pending:
+            return results
+
+        write_request_file(pending, request_file)
+        batch_id = self.submit(request_file, description)
+        print(f"Submitted batch {batch_id} ({Path(request_file).name})")
+        batch = self.wait(batch_id)
+        if batch.status != 'completed':
+            print(f"Batch {batch_id} ended with status {batch.status}")
+
+        fetched = self.fetch_results(batch)
+        for custom_id, body in pending.items():
+            content = fetched.get(custom_id)
+            results[custom_id] = content
+            if content is not None and cache is not None and valid(custom_id, content):
+                cache.put(chat_key(body, self.base_url), content)
+        return results
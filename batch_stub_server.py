@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the OpenAI Files + Batch API (and plain chat
+completions), for testing batch mode without spending tokens. Every
+request is answered with a canned reply that echoes the start of its
+last user message; grouped translation prompts (a JSON array of
+{"id", "text"} items) get a JSON array of the same shape back.
+
+Usage:
+    python batch_stub_server.py --port 8765
+    python generate_html.py --batch --batch-base-url http://127.0.0.1:8765/v1
+"""
+
+import argparse
+import itertools
+import json
+import time
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+files = {}
+batches = {}
+ids = itertools.count(1)
+
+
+def stub_reply(body):
+    """Canned completion for one batched request body"""
+    messages = body.get('messages', [])
+    prompt = messages[-1]['content'] if messages else ''
+    try:
+        items = json.loads(prompt)
+    except ValueError:
+        items = None
+    if isinstance(items, list) and all(isinstance(i, dict) and 'id' in i for i in items):
+        text = json.dumps([{'id': i['id'], 'text': f"[stub] {i.get('text', '')}"} for i in items],
+                          ensure_ascii=False)
+    else:
+        text = f"[stub] {' '.join(prompt.split())[:60]}"
+    return {
+        'id': f'chatcmpl-stub{next(ids)}',
+        'object': 'chat.completion',
+        'model': body.get('model', 'stub'),
+        'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text}, 'finish_reason': 'stop'}],
+    }
+
+
+def run_batch(input_file_id):
+    """Process a request file synchronously and return the output file id"""
+    lines = []
+    for line in files[input_file_id]['content'].decode('utf-8').splitlines():
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        lines.append(json.dumps({
+            'id': f'batch_req_{next(ids)}',
+            'custom_id': request['custom_id'],
+            'response': {'status_code': 200, 'request_id': 'stub', 'body': stub_reply(request['body'])},
+            'error': None,
+        }, ensure_ascii=False))
+    output_id = f'file-stub{next(ids)}'
+    files[output_id] = {'content': '\n'.join(lines).encode('utf-8'), 'filename': 'output.jsonl', 'purpose': 'batch_output'}
+    return output_id, len(lines)
+
+
+def file_object(file_id):
+    entry = files[file_id]
+    return {
+        'id': file_id, 'object': 'file', 'bytes': len(entry['content']), 'created_at': int(time.time()),
+        'filename': entry['filename'], 'purpose': entry['purpose'], 'status': 'processed',
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def _send(self, status, payload, content_type='application/json'):
+        data = payload if isinstance(payload, bytes) else json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self):
+        return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    def do_POST(self):
+        if self.path.endswith('/files'):
+            # multipart/form-data: a 'purpose' field and a 'file' part
+            raw = b'Content-Type: ' + self.headers['Content-Type'].encode() + b'\r\n\r\n' + self._body()
+            message = BytesParser(policy=HTTP).parsebytes(raw)
+            fields = {}
+            for part in message.iter_parts():
+                fields[part.get_param('name', header='content-disposition')] = part
+            file_id = f'file-stub{next(ids)}'
+            files[file_id] = {
+                'content': fields['file'].get_payload(decode=True),
+                'filename': fields['file'].get_filename() or 'input.jsonl',
+                'purpose': fields['purpose'].get_content().strip(),
+            }
+            self._send(200, file_object(file_id))
+        elif self.path.endswith('/chat/completions'):
+            self._send(200, stub_reply(json.loads(self._body())))
+        elif self.path.endswith('/batches'):
+            request = json.loads(self._body())
+            output_id, total = run_batch(request['input_file_id'])
+            batch_id = f'batch_stub{next(ids)}'
+            batches[batch_id] = {
+                'id': batch_id, 'object': 'batch', 'endpoint': request['endpoint'],
+                'input_file_id': request['input_file_id'], 'output_file_id': output_id, 'error_file_id': None,
+                'completion_window': request['completion_window'], 'status': 'completed',
+                'created_at': int(time.time()), 'metadata': request.get('metadata'),
+                'request_counts': {'total': total, 'completed': total, 'failed': 0},
+            }
+            self._send(200, batches[batch_id])
+        else:
+            self._send(404, {'error': {'message': f'unknown path {self.path}'}})
+
+    def do_GET(self):
+        parts = self.path.rstrip('/').split('/')
+        if len(parts) >= 2 and parts[-2] == 'batches' and parts[-1] in batches:
+            self._send(200, batches[parts[-1]])
+        elif parts[-1] == 'content' and parts[-2] in files:
+            self._send(200, files[parts[-2]]['content'], 'application/octet-stream')
+        elif len(parts) >= 2 and parts[-2] == 'files' and parts[-1] in files:
+            self._send(200, file_object(parts[-1]))
+        else:
+            self._send(404, {'error': {'message': f'unknown path {self.path}'}})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Local stub for the OpenAI Batch API')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), StubHandler)
+    print(f'Batch stub listening on http://127.0.0.1:{args.port}/v1')
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
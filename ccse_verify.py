@@ -0,0 +1,674 @@
+#!/usr/bin/env python3
+"""
+Verification library for the CCSE question data.
+
+Every source (question bank, official_options.json, official_options_raw.json,
+options_translations.json and the PDF solution key) is read once, with the
+corrections in overrides.json applied, into a VerificationModel joined by question number. Each check is a function of the
+model and a list of question numbers that returns issue dicts, so checks can
+be combined, run on part of the bank, or spread over a process pool.
+comprehensive_verify.py, random_verify.py and manual_verify.py are front ends
+over it.
+
+Full runs are stored as JSON reports in REPORTS_DIR, named by a content
+hash of every input, and --incremental only re-checks the questions whose
+inputs changed since the latest stored report.
+
+Usage:
+    python ccse_verify.py                          # every check
+    python ccse_verify.py answer-key answer-text   # some of them
+    python ccse_verify.py --jobs 4 --question 1059
+    python ccse_verify.py --incremental --format jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from difflib import SequenceMatcher
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from overrides import apply_overrides, override_status, read_sources
+from pdf_text_extract import load_solutions
+from question_bank import load_all, section_registry
+
+OFFICIAL_OPTIONS_FILE = Path('official_options.json')
+RAW_OPTIONS_FILE = Path('official_options_raw.json')
+OPTIONS_TRANSLATIONS_FILE = Path('options_translations.json')
+REPORTS_DIR = Path('.verify_reports')
+# Modules whose code decides what the checks report (see checks_fingerprint)
+CHECK_MODULES = ('ccse_verify.py', 'overrides.py', 'pdf_text_extract.py', 'question_bank.py')
+LATEST_REPORT = REPORTS_DIR / 'latest'
+
+# Minimum similarity between a bank answer and the text of its correct option
+ANSWER_SIMILARITY = 0.8
+
+# PDF Solution Key (from pages 25-27 of the PDF)
+# Format: question_number: correct_label
+PDF_SOLUTIONS = {
+    # TAREA 1 (pages 25)
+    1001: 'a', 1002: 'a', 1003: 'a', 1004: 'b', 1005: 'a', 1006: 'a', 1007: 'c', 1008: 'b',
+    1009: 'a', 1010: 'b', 1011: 'b', 1012: 'b', 1013: 'b', 1014: 'b', 1015: 'b', 1016: 'a',
+    1017: 'b', 1018: 'b', 1019: 'a', 1020: 'a', 1021: 'b', 1022: 'b', 1023: 'b', 1024: 'a',
+    1025: 'b', 1026: 'a', 1027: 'b', 1028: 'b', 1029: 'a', 1030: 'a', 1031: 'a', 1032: 'c',
+    1033: 'b', 1034: 'a', 1035: 'b', 1036: 'a', 1037: 'c', 1038: 'c', 1039: 'c', 1040: 'c',
+    1041: 'a', 1042: 'a', 1043: 'a', 1044: 'a', 1045: 'c', 1046: 'b', 1047: 'b', 1048: 'c',
+    1049: 'c', 1050: 'b', 1051: 'c', 1052: 'c', 1053: 'b', 1054: 'a', 1055: 'b', 1056: 'c',
+    1057: 'b', 1058: 'c', 1059: 'b', 1060: 'a', 1061: 'b', 1062: 'b', 1063: 'b', 1064: 'b',
+    1065: 'c', 1066: 'a', 1067: 'b', 1068: 'b', 1069: 'b', 1070: 'b', 1071: 'a', 1072: 'a',
+    1073: 'a', 1074: 'b', 1075: 'b', 1076: 'c', 1077: 'a', 1078: 'c', 1079: 'b', 1080: 'c',
+    1081: 'a', 1082: 'b', 1083: 'c', 1084: 'c', 1085: 'a', 1086: 'a', 1087: 'b', 1088: 'c',
+    1089: 'a', 1090: 'c', 1091: 'b', 1092: 'b', 1093: 'c', 1094: 'b', 1095: 'a', 1096: 'b',
+    1097: 'b', 1098: 'b', 1099: 'a', 1100: 'b', 1101: 'a', 1102: 'a', 1103: 'a', 1104: 'a',
+    1105: 'a', 1106: 'c', 1107: 'a', 1108: 'c', 1109: 'a', 1110: 'b', 1111: 'c', 1112: 'b',
+    1113: 'a', 1114: 'c', 1115: 'a', 1116: 'b', 1117: 'b', 1118: 'a', 1119: 'c', 1120: 'a',
+
+    # TAREA 2 (page 26)
+    2001: 'b', 2002: 'b', 2003: 'a', 2004: 'a', 2005: 'b', 2006: 'b', 2007: 'a', 2008: 'a',
+    2009: 'b', 2010: 'a', 2011: 'a', 2012: 'a', 2013: 'b', 2014: 'a', 2015: 'a', 2016: 'a',
+    2017: 'a', 2018: 'b', 2019: 'a', 2020: 'a', 2021: 'b', 2022: 'a', 2023: 'b', 2024: 'a',
+    2025: 'a', 2026: 'a', 2027: 'b', 2028: 'b', 2029: 'a', 2030: 'a', 2031: 'a', 2032: 'a',
+    2033: 'a', 2034: 'b', 2035: 'a', 2036: 'a',
+
+    # TAREA 3 (page 26)
+    3001: 'c', 3002: 'c', 3003: 'b', 3004: 'c', 3005: 'a', 3006: 'b', 3007: 'a', 3008: 'a',
+    3009: 'c', 3010: 'b', 3011: 'a', 3012: 'b', 3013: 'b', 3014: 'a', 3015: 'b', 3016: 'c',
+    3017: 'a', 3018: 'a', 3019: 'b', 3020: 'c', 3021: 'a', 3022: 'b', 3023: 'a', 3024: 'c',
+
+    # TAREA 4 (page 26)
+    4001: 'b', 4002: 'c', 4003: 'a', 4004: 'a', 4005: 'a', 4006: 'b', 4007: 'b', 4008: 'c',
+    4009: 'a', 4010: 'c', 4011: 'c', 4012: 'a', 4013: 'a', 4014: 'b', 4015: 'b', 4016: 'b',
+    4017: 'c', 4018: 'a', 4019: 'b', 4020: 'c', 4021: 'c', 4022: 'a', 4023: 'a', 4024: 'b',
+    4025: 'a', 4026: 'b', 4027: 'a', 4028: 'a', 4029: 'a', 4030: 'c', 4031: 'a', 4032: 'b',
+    4033: 'a', 4034: 'b', 4035: 'a', 4036: 'c',
+
+    # TAREA 5 (page 27)
+    5001: 'b', 5002: 'a', 5003: 'c', 5004: 'b', 5005: 'a', 5006: 'c', 5007: 'a', 5008: 'c',
+    5009: 'b', 5010: 'a', 5011: 'b', 5012: 'b', 5013: 'b', 5014: 'b', 5015: 'b', 5016: 'c',
+    5017: 'b', 5018: 'c', 5019: 'b', 5020: 'a', 5021: 'b', 5022: 'b', 5023: 'a', 5024: 'a',
+    5025: 'c', 5026: 'c', 5027: 'b', 5028: 'b', 5029: 'b', 5030: 'b', 5031: 'b', 5032: 'b',
+    5033: 'c', 5034: 'a', 5035: 'c', 5036: 'c', 5037: 'a', 5038: 'b', 5039: 'a', 5040: 'a',
+    5041: 'c', 5042: 'c', 5043: 'a', 5044: 'b', 5045: 'a', 5046: 'c', 5047: 'a', 5048: 'b',
+    5049: 'b', 5050: 'b', 5051: 'c', 5052: 'b', 5053: 'b', 5054: 'c', 5055: 'a', 5056: 'a',
+    5057: 'a', 5058: 'c', 5059: 'c', 5060: 'a', 5061: 'a', 5062: 'b', 5063: 'c', 5064: 'c',
+    5065: 'a', 5066: 'b', 5067: 'b', 5068: 'c', 5069: 'b', 5070: 'a', 5071: 'b', 5072: 'b',
+    5073: 'b', 5074: 'a', 5075: 'b', 5076: 'b', 5077: 'b', 5078: 'a', 5079: 'b', 5080: 'b',
+    5081: 'b', 5082: 'a', 5083: 'a', 5084: 'a',
+}
+
+# The key parsed from the PDF text layer (pdf_text_extract.py) wins when it has been generated
+PDF_SOLUTIONS.update(load_solutions())
+
+# Sample questions checked by key words against what was read in the PDF:
+# (q_num, key words in the question, key words in the options, correct label)
+SPOT_CHECKS = [
+    (1001, ["espana"], ["monarquia parlamentaria", "republica federal"], 'a'),
+    (1015, ["modera", "instituciones"], ["presidente", "rey", "academia"], 'b'),
+    (1059, ["lengua", "baleares"], ["gallego", "catalan", "euskera"], 'b'),
+    (2001, ["constitucion", "religion"], ["verdadero", "falso"], 'b'),
+    (3001, ["caceres", "badajoz"], ["asturias", "andalucia", "extremadura"], 'c'),
+    (4001, ["quijote"], ["don juan", "sancho panza"], 'b'),
+    (5001, ["extranjeros", "residir"], ["dni", "tie", "empadronamiento"], 'b'),
+]
+
+
+# Special characters replaced before comparison (ñ becomes n)
+SPECIAL_CHARS = str.maketrans({
+    '\u2019': "'", '\u2013': '-', '\u200b': '', '\u2026': '...', 'ñ': 'n', 'Ñ': 'N',
+})
+PUNCTUATION = str.maketrans('', '', '¿¡?!.,;:-')
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=None)
+def normalize(text):
+    """Normalize text for comparison.
+
+    Every distinct string is normalized once; the interned result makes
+    repeated comparisons of the same text an identity check.
+    """
+    if not text:
+        return ''
+    text = text.translate(SPECIAL_CHARS)
+    if not text.isascii():
+        # Remove accents: decompose, drop combining marks, recompose
+        text = unicodedata.normalize('NFD', text)
+        text = ''.join(c for c in text if unicodedata.category(c) != 'Mn')
+        text = unicodedata.normalize('NFC', text)
+    # Remove extra whitespace and punctuation
+    text = WHITESPACE_RE.sub(' ', text.strip()).translate(PUNCTUATION)
+    return sys.intern(text.lower().strip())
+
+
+def similarity(a, b):
+    """Calculate similarity between two strings."""
+    return SequenceMatcher(None, normalize(a), normalize(b)).ratio()
+
+
+def bounded_levenshtein(a, b, limit):
+    """Edit distance between a and b, or limit + 1 as soon as it must exceed limit.
+
+    Only the diagonal band of width 2 * limit + 1 is computed, so the cost is
+    O(limit * len) instead of O(len(a) * len(b)).
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if len(a) > len(b):
+        a, b = b, a
+    over = limit + 1
+    previous = list(range(len(b) + 1))
+    current = [0] * (len(b) + 1)
+    for i in range(1, len(a) + 1):
+        lo = max(1, i - limit)
+        hi = min(len(b), i + limit)
+        # Cells just outside the band may hold values from two rows back
+        current[lo - 1] = i if lo == 1 else over
+        if hi < len(b):
+            current[hi + 1] = over
+        char = a[i - 1]
+        row_min = current[lo - 1]
+        for j in range(lo, hi + 1):
+            cost = min(previous[j - 1] + (char != b[j - 1]), previous[j] + 1, current[j - 1] + 1)
+            current[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if row_min > limit:
+            return over
+        previous, current = current, previous
+    return min(previous[len(b)], over)
+
+
+def is_similar(a, b, threshold=0.8):
+    """True if a and b are at least threshold similar.
+
+    Cheap checks settle most pairs: identical normalized text, difflib's O(1)
+    and O(n) upper bounds on the SequenceMatcher ratio, and an edit distance
+    above (1 - threshold) of both lengths together, computed with early exit
+    (the ratio is at most 1 - distance / total length). The edit distance can
+    only reject: difflib matches greedily, so a small distance doesn't imply a
+    high ratio. Only pairs none of them decide pay for SequenceMatcher.ratio().
+    """
+    a, b = normalize(a), normalize(b)
+    if a is b:
+        return True
+    matcher = SequenceMatcher(None, a, b)
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return False
+    total = len(a) + len(b)
+    if (total - bounded_levenshtein(a, b, int((1 - threshold) * total) + 1)) / total < threshold:
+        return False
+    return matcher.ratio() >= threshold
+
+
+def by_number(data: Dict[str, dict]) -> Dict[int, dict]:
+    """{q_num: entry} of a per-question JSON file as loaded"""
+    return {int(q_num): entry for q_num, entry in data.items()}
+
+
+class VerificationModel:
+    """Every verification source joined by question number.
+
+    records[q_num] has the bank's 'question', 'answer' and 'translation' and,
+    where the sources have them, the 'official', 'raw' and 'ru_options'
+    entries (with overrides applied), the PDF 'solution' label and the
+    'overrides' status of each file it has a correction for (see
+    overrides.override_status), for every expected question.
+    sources maps each source name to the question numbers it covers, which
+    may include unexpected ones (see all_numbers).
+    """
+
+    def __init__(self, expected, bank, official, raw, ru_options, solutions, override_statuses=()):
+        self.expected = list(expected)
+        self.sources = {
+            'ccse_questions.py (questions)': set(bank),
+            'ccse_questions.py (translations)': {q for q, record in bank.items() if record.get('translation')},
+            OFFICIAL_OPTIONS_FILE.name: set(official),
+            RAW_OPTIONS_FILE.name: set(raw),
+            OPTIONS_TRANSLATIONS_FILE.name: set(ru_options),
+            'PDF_SOLUTIONS': set(solutions),
+        }
+        self.all_numbers = sorted(set(self.expected).union(*self.sources.values()))
+        statuses: Dict[int, List[dict]] = {}
+        for status in override_statuses:
+            statuses.setdefault(status['q_num'], []).append(status)
+        self.records: Dict[int, dict] = {}
+        for q_num in self.expected:
+            record = dict(bank.get(q_num, {}))
+            record['official'] = official.get(q_num)
+            record['raw'] = raw.get(q_num)
+            record['ru_options'] = (ru_options.get(q_num) or {}).get('options')
+            record['solution'] = solutions.get(q_num)
+            record['overrides'] = statuses.get(q_num, [])
+            self.records[q_num] = record
+
+        # Normalized official question text -> question numbers, for the duplicate check
+        self.by_question_text: Dict[str, List[int]] = {}
+        for q_num in self.expected:
+            official_record = self.records[q_num]['official'] or {}
+            text = normalize(official_record.get('question', ''))
+            if text:
+                self.by_question_text.setdefault(text, []).append(q_num)
+
+    def correct_option(self, q_num: int) -> Optional[dict]:
+        """The official option labelled as correct, if there is one"""
+        official_record = self.records[q_num]['official'] or {}
+        label = official_record.get('correct')
+        return next((opt for opt in official_record.get('options', []) if opt.get('label') == label), None)
+
+
+def load_model() -> VerificationModel:
+    """Read every source once"""
+    extracted = read_sources()
+    patched = {source: by_number(apply_overrides(data, source)) for source, data in extracted.items()}
+    return VerificationModel(
+        section_registry().all_questions(),
+        load_all(),
+        patched[OFFICIAL_OPTIONS_FILE.name],
+        patched[RAW_OPTIONS_FILE.name],
+        patched[OPTIONS_TRANSLATIONS_FILE.name],
+        PDF_SOLUTIONS,
+        override_status(extracted),
+    )
+
+
+def issue(check: str, q_num: int, message: str, observed=None, expected=None, severity: str = 'error') -> dict:
+    return {
+        'check': check, 'q_num': q_num, 'severity': severity,
+        'message': message, 'observed': observed, 'expected': expected,
+    }
+
+
+def check_coverage(model: VerificationModel, q_nums: Iterable[int]) -> List[dict]:
+    """Every expected question is in every source, and no source has others"""
+    issues = []
+    expected = set(model.expected)
+    for q_num in q_nums:
+        for source, covered in model.sources.items():
+            if q_num in expected and q_num not in covered:
+                issues.append(issue('coverage', q_num, f'missing from {source}', expected=source))
+            elif q_num not in expected and q_num in covered:
+                issues.append(issue('coverage', q_num, f'extra question in {source}', observed=source))
+    return issues
+
+
+def check_answer_key(model: VerificationModel, q_nums: Iterable[int]) -> List[dict]:
+    """The correct label in official_options.json matches the PDF solution key"""
+    issues = []
+    for q_num in q_nums:
+        record = model.records.get(q_num)
+        if not record or record['official'] is None:
+            continue
+        json_correct = record['official'].get('correct')
+        if json_correct != record['solution']:
+            issues.append(issue(
+                'answer-key', q_num, f"PDF says '{record['solution']}', JSON says '{json_correct}'",
+                observed=json_correct, expected=record['solution'],
+            ))
+    return issues
+
+
+def check_answer_text(model: VerificationModel, q_nums: Iterable[int]) -> List[dict]:
+    """The bank answer is similar to the text of the correct official option"""
+    issues = []
+    for q_num in q_nums:
+        record = model.records.get(q_num)
+        if not record or 'answer' not in record or record['official'] is None:
+            continue
+        option = model.correct_option(q_num)
+        if option and not is_similar(record['answer'], option['text'], ANSWER_SIMILARITY):
+            sim = similarity(record['answer'], option['text'])
+            issues.append(issue(
+                'answer-text', q_num,
+                f"Answer '{record['answer'][:40]}...' vs Option {option['label']}: '{option['text'][:40]}...' (sim: {sim:.2f})",
+                observed=record['answer'], expected=option['text'],
+            ))
+    return issues
+
+
+def option_labels(count: int) -> List[str]:
+    """Labels of a question with count options (2 for true/false, else 3)"""
+    return ['a', 'b'] if count == 2 else ['a', 'b', 'c']
+
+
+def check_option_count(model: VerificationModel, q_nums: Iterable[int]) -> List[dict]:
+    """Official options are a, b (true/false) or a, b, c, all with text"""
+    issues = []
+    for q_num in q_nums:
+        record = model.records.get(q_num)
+        if not record or record['official'] is None:
+            continue
+        options = record['official'].get('options', [])
+        if len(options) < 2 or len(options) > 3:
+            issues.append(issue(
+                'option-count', q_num, f'Has {len(options)} options (expected 2 or 3)',
+                observed=len(options), expected='2-3',
+            ))
+            continue
+        labels = [opt.get('label') for opt in options]
+        if labels != option_labels(len(options)):
+            issues.append(issue(
+                'option-count', q_num, f'Labels are {labels}, expected {option_labels(len(options))}',
+                observed=labels, expected=option_labels(len(options)),
+            ))
+        for opt in options:
+            if not opt.get('text'):
+                issues.append(issue('option-count', q_num, f"Option {opt.get('label')} has no text"))
+    return issues
+
+
+def check_translation(model: VerificationModel, q_nums: Iterable[int]) -> List[dict]:
+    """options_translations.json has a non-empty Russian text for every official option"""
+    issues = []
+    for q_num in q_nums:
+        record = model.records.get(q_num)
+        if not record or record['official'] is None or record['ru_options'] is None:
+            continue
+        labels = [opt.get('label') for opt in record['official'].get('options', [])]
+        ru_labels = [opt.get('label') for opt in record['ru_options']]
+        if ru_labels != labels:
+            issues.append(issue(
+                'translation', q_num, f'Russian options are {ru_labels}, official options are {labels}',
+                observed=ru_labels, expected=labels,
+            ))
+        for opt in record['ru_options']:
+            if not opt.get('text'):
+                issues.append(issue('translation', q_num, f"Russian option {opt.get('label')} has no text"))
+    return issues
+
+
+def check_duplicates(model: VerificationModel, q_nums: Iterable[int]) -> List[dict]:
+    """No two questions have the same official question text"""
+    issues = []
+    for q_num in q_nums:
+        official_record = (model.records.get(q_num) or {}).get('official') or {}
+        same = model.by_question_text.get(normalize(official_record.get('question', '')), [])
+        if len(same) > 1 and q_num in same:
+            others = [n for n in same if n != q_num]
+            issues.append(issue(
+                'duplicates', q_num, f'Same question text as {others}',
+                observed=official_record.get('question'),
+            ))
+    return issues
+
+
+def check_spot(model: VerificationModel, q_nums: Iterable[int]) -> List[dict]:
+    """SPOT_CHECKS questions contain their key words and have the expected answer"""
+    issues = []
+    wanted = set(q_nums)
+    for q_num, q_keywords, opt_keywords, expected_correct in SPOT_CHECKS:
+        if q_num not in wanted:
+            continue
+        data = model.records[q_num]['official'] if q_num in model.records else None
+        if data is None:
+            issues.append(issue('spot-check', q_num, f'Missing from {OFFICIAL_OPTIONS_FILE.name}'))
+            continue
+        question_text = normalize(data.get('question', ''))
+        missing = [kw for kw in q_keywords if normalize(kw) not in question_text]
+        if missing:
+            issues.append(issue(
+                'spot-check', q_num, f"Question missing keywords {missing}. Got: '{data.get('question', '')[:50]}...'",
+                observed=data.get('question'), expected=missing,
+            ))
+            continue
+        if data.get('correct') != expected_correct:
+            issues.append(issue(
+                'spot-check', q_num, f"Correct answer is '{data.get('correct')}', expected '{expected_correct}'",
+                observed=data.get('correct'), expected=expected_correct,
+            ))
+            continue
+        options_text = ' '.join(normalize(opt.get('text', '')) for opt in data.get('options', []))
+        missing = [kw for kw in opt_keywords if normalize(kw) not in options_text]
+        if missing:
+            shown = [opt.get('text', '') for opt in data.get('options', [])]
+            issues.append(issue(
+                'spot-check', q_num, f'Options missing keywords {missing}. Got: {shown}',
+                observed=shown, expected=missing,
+            ))
+    return issues
+
+
+def check_overrides(model: VerificationModel, q_nums: Iterable[int]) -> List[dict]:
+    """Every correction in overrides.json still targets the extracted entry it was written against"""
+    issues = []
+    for q_num in q_nums:
+        for status in (model.records.get(q_num) or {}).get('overrides', []):
+            if status['status'] == 'conflict':
+                issues.append(issue(
+                    'overrides', q_num,
+                    f"{status['source']} entry changed since the override was written "
+                    f"(review it, then python fix_options.py --rebase {q_num})",
+                    observed=status['current'], expected=status['base'],
+                ))
+            elif status['status'] == 'unbased':
+                issues.append(issue(
+                    'overrides', q_num, f"override has no base for {status['source']}",
+                    observed=status['current'], severity='warning',
+                ))
+    return issues
+
+
+CHECKS: Dict[str, Callable[[VerificationModel, Iterable[int]], List[dict]]] = {
+    'coverage': check_coverage,
+    'answer-key': check_answer_key,
+    'answer-text': check_answer_text,
+    'option-count': check_option_count,
+    'translation': check_translation,
+    'duplicates': check_duplicates,
+    'spot-check': check_spot,
+    'overrides': check_overrides,
+}
+
+_worker_model: Optional[VerificationModel] = None
+
+
+def _init_worker(model: VerificationModel) -> None:
+    global _worker_model
+    _worker_model = model
+
+
+def _run_check(name: str, q_nums: List[int]) -> List[dict]:
+    return CHECKS[name](_worker_model, q_nums)
+
+
+def run_checks(
+    model: VerificationModel, names: Optional[Iterable[str]] = None,
+    q_nums: Optional[Iterable[int]] = None, jobs: int = 1,
+) -> Dict[str, List[dict]]:
+    """{check name: issues} for the named checks (default: all) over q_nums (default: every question in any source).
+
+    With jobs > 1 every check is split into contiguous slices of questions
+    run on a process pool; each worker gets the already loaded model once.
+    """
+    names = list(names or CHECKS)
+    q_nums = sorted(model.all_numbers if q_nums is None else q_nums)
+    if jobs <= 1:
+        return {name: CHECKS[name](model, q_nums) for name in names}
+
+    size = -(-len(q_nums) // jobs) or 1
+    slices = [q_nums[i:i + size] for i in range(0, len(q_nums), size)]
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(model,)) as executor:
+        futures = {name: [executor.submit(_run_check, name, part) for part in slices] for name in names}
+        return {name: [found for future in parts for found in future.result()] for name, parts in futures.items()}
+
+
+def checks_fingerprint() -> str:
+    """Hash of every module the checks run, so stored reports are not reused once one changes"""
+    digest = hashlib.sha256()
+    for name in CHECK_MODULES:
+        digest.update(Path(__file__).with_name(name).read_bytes())
+    return digest.hexdigest()
+
+
+def question_fingerprints(model: VerificationModel) -> Dict[int, str]:
+    """Content hash of everything the checks read for each question.
+
+    Besides the question's own record this covers the sources listing it
+    and the questions sharing its normalized text, so a change that makes
+    or breaks a duplicate changes the fingerprint of both questions.
+    """
+    fingerprints = {}
+    for q_num in model.all_numbers:
+        record = model.records.get(q_num)
+        official_record = (record or {}).get('official') or {}
+        inputs = [
+            q_num,
+            record,
+            sorted(source for source, covered in model.sources.items() if q_num in covered),
+            model.by_question_text.get(normalize(official_record.get('question', '')), []),
+        ]
+        payload = json.dumps(inputs, ensure_ascii=False, sort_keys=True)
+        fingerprints[q_num] = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    return fingerprints
+
+
+def sort_issues(issues: Iterable[dict]) -> List[dict]:
+    order = {name: idx for idx, name in enumerate(CHECKS)}
+    return sorted(issues, key=lambda found: (order[found['check']], found['q_num']))
+
+
+def build_report(fingerprints: Dict[int, str], issues: Iterable[dict]) -> dict:
+    """Report of a full run; its fingerprint hashes the checks and every question's inputs"""
+    checks = checks_fingerprint()
+    digest = hashlib.sha256(checks.encode('utf-8'))
+    for q_num in sorted(fingerprints):
+        digest.update(f'{q_num}:{fingerprints[q_num]}\n'.encode('utf-8'))
+    return {
+        'fingerprint': digest.hexdigest(),
+        'checks': checks,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'questions': {str(q_num): fp for q_num, fp in sorted(fingerprints.items())},
+        'issues': sort_issues(issues),
+    }
+
+
+def save_report(report: dict) -> Path:
+    """Store a report under its fingerprint and make it the latest one"""
+    REPORTS_DIR.mkdir(exist_ok=True)
+    path = REPORTS_DIR / f"{report['fingerprint']}.json"
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+    tmp_path.replace(path)
+    LATEST_REPORT.write_text(report['fingerprint'], encoding='utf-8')
+    return path
+
+
+def load_report(fingerprint: Optional[str] = None) -> Optional[dict]:
+    """A stored report (default: the latest), or None"""
+    if fingerprint is None:
+        if not LATEST_REPORT.exists():
+            return None
+        fingerprint = LATEST_REPORT.read_text(encoding='utf-8').strip()
+    path = REPORTS_DIR / f'{fingerprint}.json'
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def full_report(model: VerificationModel, jobs: int = 1) -> dict:
+    results = run_checks(model, jobs=jobs)
+    return build_report(question_fingerprints(model), [found for issues in results.values() for found in issues])
+
+
+def incremental_report(model: VerificationModel, previous: Optional[dict], jobs: int = 1) -> dict:
+    """Full report that only re-runs the checks of questions changed since previous.
+
+    Issues of unchanged questions are carried over. report['delta'] lists
+    the re-checked and removed questions and the issues that appeared or
+    went away. Without a usable previous report every question is checked.
+    """
+    fingerprints = question_fingerprints(model)
+    if previous is None or previous['checks'] != checks_fingerprint():
+        previous = {'fingerprint': None, 'questions': {}, 'issues': []}
+    old = {int(q_num): fp for q_num, fp in previous['questions'].items()}
+    changed = [q_num for q_num, fp in fingerprints.items() if old.get(q_num) != fp]
+    removed = sorted(set(old) - set(fingerprints))
+    stale = set(changed) | set(removed)
+
+    results = run_checks(model, q_nums=changed, jobs=jobs) if changed else {}
+    fresh = [found for issues in results.values() for found in issues]
+    kept = [found for found in previous['issues'] if found['q_num'] not in stale]
+    report = build_report(fingerprints, kept + fresh)
+    before = [found for found in previous['issues'] if found['q_num'] in stale]
+    report['delta'] = {
+        'base': previous['fingerprint'],
+        'checked': changed,
+        'removed': removed,
+        'added': [found for found in fresh if found not in before],
+        'resolved': [found for found in before if found not in fresh],
+    }
+    return report
+
+
+def print_issues(issues: List[dict], names: Iterable[str]) -> None:
+    for name in names:
+        found = [issue for issue in issues if issue['check'] == name]
+        if not found:
+            print(f'✅ {name}')
+            continue
+        print(f'❌ {name}: {len(found)} problema(s)')
+        for issue in found[:20]:
+            print(f"   {issue['q_num']}: {issue['message']}")
+        if len(found) > 20:
+            print(f'   ... y {len(found) - 20} más')
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Verify the CCSE question data against the PDF source of truth')
+    parser.add_argument('checks', nargs='*', metavar='check', help=f"checks to run (default: all): {', '.join(CHECKS)}")
+    parser.add_argument('--question', '-q', type=int, action='append', dest='questions',
+                        help='only verify this question (repeatable)')
+    parser.add_argument('--jobs', '-j', type=int, default=1, help='processes to spread the checks over')
+    parser.add_argument('--incremental', action='store_true',
+                        help=f'only re-check questions changed since the latest report in {REPORTS_DIR}')
+    parser.add_argument('--format', choices=('text', 'json', 'jsonl'), default='text',
+                        help='text summary, the JSON report, or one JSON issue per line')
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.checks if name not in CHECKS]
+    if unknown:
+        parser.error(f"comprobación desconocida: {', '.join(unknown)} (disponibles: {', '.join(CHECKS)})")
+    partial = bool(args.checks or args.questions)
+    if args.incremental and partial:
+        parser.error('--incremental verifica todo el banco: no admite comprobaciones ni --question')
+
+    model = load_model()
+    if args.incremental:
+        report = incremental_report(model, load_report(), args.jobs)
+    elif partial:
+        results = run_checks(model, args.checks, args.questions, args.jobs)
+        report = {'issues': [found for issues in results.values() for found in issues]}
+    else:
+        report = full_report(model, args.jobs)
+    if not partial:
+        path = save_report(report)
+
+    issues = report['issues']
+    if args.format == 'json':
+        print(json.dumps(report, ensure_ascii=False, indent=1))
+    elif args.format == 'jsonl':
+        for found in issues:
+            print(json.dumps(found, ensure_ascii=False))
+    else:
+        print_issues(issues, args.checks or CHECKS)
+        if 'delta' in report:
+            delta = report['delta']
+            base = (delta['base'] or 'ninguno')[:12]
+            print(f"🔁 Incremental (base {base}): {len(delta['checked'])} pregunta(s) re-verificada(s), "
+                  f"+{len(delta['added'])} / -{len(delta['resolved'])} problema(s)")
+        checked = len(args.questions) if args.questions else len(model.expected)
+        print(f'{checked} preguntas, {len(args.checks or CHECKS)} comprobaciones, {len(issues)} problema(s)')
+        if not partial:
+            print(f'💾 Informe en {path}')
+    return 1 if any(found['severity'] == 'error' for found in issues) else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
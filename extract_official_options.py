@@ -1,19 +1,34 @@
 #!/usr/bin/env python3
-"""Extract official CCSE question options from the PDF via gpt-5-nano."""
+"""Extract official CCSE question options from the PDF.
+
+The default local engine reads the PDF text layer (pdf_text_extract.py) and
+only sends the questions it can't segment confidently to gpt-5-nano; the llm
+engine sends every question.
+
+The output files keep what the PDF yielded, mistakes included; the
+corrections in overrides.json are applied when they are read (see
+overrides.load_options), so don't json.load them directly.
+"""
 
 from __future__ import annotations
 
+import argparse
 import json
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 from openai import OpenAI
 
 from ccse_questions import questions
+from journal import Journal
+from pdf_text_extract import extract_local, save_solutions, SOLUTIONS_OUTPUT
+from response_cache import ResponseCache, file_digest, make_key
 
 PDF_PATH = Path.home() / 'Downloads' / 'Preguntas ccse 2026.pdf'
 RAW_OUTPUT = Path('official_options_raw.json')
@@ -21,6 +36,11 @@ FINAL_OUTPUT = Path('official_options.json')
 CHUNK_SIZE = 5
 RETRIES = 3
 SLEEP_SECONDS = 2
+WORKERS = 6
+MODEL = 'gpt-5-nano'
+ENGINES = ('local', 'llm')
+
+response_cache = ResponseCache()
 
 PROMPT_TEMPLATE = """
 Utiliza exclusivamente el archivo PDF adjunto "Preguntas ccse 2026.pdf".
@@ -49,75 +69,178 @@ def clean_json_text(text: str) -> str:
     return text.strip()
 
 
-def extract_options() -> Dict[str, Dict[str, object]]:
-    load_dotenv(Path.cwd().parent / 'exocortex' / '.env')
-
+def request_chunk(client: OpenAI, file_id: str, prompt: str) -> Dict[str, Dict[str, object]]:
+    """Ask the model to transcribe one chunk of questions from the uploaded PDF"""
+    response = client.responses.create(
+        model=MODEL,
+        input=[{
+            'role': 'user',
+            'content': [
+                {'type': 'input_text', 'text': prompt},
+                {'type': 'input_file', 'file_id': file_id},
+            ],
+        }],
+        timeout=120,
+    )
+    text_parts = []
+    for item in response.output:
+        content = getattr(item, 'content', None)
+        if not content:
+            continue
+        for block in content:
+            block_text = getattr(block, 'text', None)
+            if block_text:
+                text_parts.append(block_text)
+    combined = clean_json_text(''.join(text_parts))
+    return json.loads(combined)
+
+
+def is_complete(record: object) -> bool:
+    """True if a checkpointed record has a question and at least two labelled options"""
+    if not isinstance(record, dict) or not record.get('question'):
+        return False
+    options = record.get('options')
+    return isinstance(options, list) and len(options) >= 2 and all(
+        isinstance(opt, dict) and opt.get('label') and opt.get('text') for opt in options
+    )
+
+
+def extract_chunk(client: OpenAI, uploaded_file_id, pdf_digest: str, group: List[int]) -> Dict[str, Dict[str, object]]:
+    """Extract one chunk (from cache if possible), retrying with backoff"""
+    numbers = ', '.join(str(n) for n in group)
+    prompt = PROMPT_TEMPLATE.format(numbers=numbers)
+    cache_key = make_key(endpoint='responses', model=MODEL, prompt=prompt, file=pdf_digest)
+
+    chunk_data = response_cache.get(cache_key)
+    if chunk_data is not None:
+        return chunk_data
+
+    for attempt in range(1, RETRIES + 1):
+        try:
+            chunk_data = request_chunk(client, uploaded_file_id(), prompt)
+            # Partial answers aren't cached, so the missing questions get asked again
+            if all(is_complete(chunk_data.get(str(n))) for n in group):
+                response_cache.put(cache_key, chunk_data)
+            return chunk_data
+        except Exception:  # noqa: BLE001
+            if attempt == RETRIES:
+                raise
+            time.sleep(SLEEP_SECONDS * attempt)
+
+
+def extract_options(
+    workers: int = WORKERS, fresh: bool = False, engine: str = 'local',
+) -> Tuple[Dict[str, Dict[str, object]], Dict[int, str]]:
+    """Extract every question, resuming from the RAW_OUTPUT checkpoint.
+
+    With the local engine, questions the PDF text layer yields confidently
+    are checkpointed straight away and only the rest go to the model. LLM
+    chunks run concurrently on `workers` threads against a single uploaded
+    PDF. Each finished chunk is journalled, so an interrupted or partly
+    failed run only re-extracts the missing question numbers next time.
+
+    Returns the raw records and the solution key parsed from the PDF (empty
+    with the llm engine).
+    """
     if not PDF_PATH.exists():
         sys.exit(f'No se encuentra el PDF en {PDF_PATH}')
 
-    print(f'📄 Cargando PDF: {PDF_PATH.name}')
-    client = OpenAI()
-    uploaded = client.files.create(file=open(PDF_PATH, 'rb'), purpose='assistants')
-    file_id = uploaded.id
-    print(f'✓ PDF cargado (ID: {file_id[:12]}...)\n')
-
-    aggregated: Dict[str, Dict[str, object]] = {}
+    checkpoint = Journal(RAW_OUTPUT)
+    aggregated: Dict[str, Dict[str, object]] = checkpoint.load()
+    if fresh:
+        aggregated.clear()
     question_ids = sorted(questions.keys())
-    chunks = chunked(question_ids, CHUNK_SIZE)
+    pending = [n for n in question_ids if not is_complete(aggregated.get(str(n)))]
+    solutions: Dict[int, str] = {}
+
+    print(f'📊 Total: {len(question_ids)} preguntas, {len(question_ids) - len(pending)} ya extraídas')
+
+    if engine == 'local':
+        print(f'📄 Leyendo el texto del PDF: {PDF_PATH.name}')
+        try:
+            records, uncertain, solutions = extract_local(PDF_PATH, question_ids)
+        except RuntimeError as err:
+            print(f'⚠ {err} - se usará el modelo para todas las preguntas')
+            records, uncertain = {}, list(question_ids)
+        for n in pending:
+            if str(n) in records:
+                checkpoint.append(n, records[str(n)])
+        pending = [n for n in pending if str(n) not in records]
+        print(f'✓ {len(records)} preguntas extraídas del texto, {len(uncertain)} con baja confianza')
+        print(f'✓ Clave de soluciones: {len(solutions)} respuestas')
+
+    try:
+        if pending:
+            extract_with_llm(checkpoint, pending, workers)
+    finally:
+        # Keep the snapshot in question order so it diffs cleanly
+        ordered = sorted(aggregated.items(), key=lambda item: int(item[0]))
+        aggregated.clear()
+        aggregated.update(ordered)
+        checkpoint.close()
+
+    return aggregated, solutions
+
+
+def extract_with_llm(checkpoint: Journal, pending: List[int], workers: int) -> None:
+    """Extract the pending questions with the model, journalling each finished chunk"""
+    load_dotenv(Path.cwd().parent / 'exocortex' / '.env')
+
+    client = OpenAI()
+    # Cache entries are keyed on the PDF content, not the per-upload file id,
+    # so a re-run only uploads the PDF if some chunk actually needs the API.
+    pdf_digest = file_digest(PDF_PATH)
+    file_id = None
+    upload_lock = threading.Lock()
+
+    def uploaded_file_id() -> str:
+        nonlocal file_id
+        with upload_lock:
+            if file_id is None:
+                print(f'📄 Cargando PDF: {PDF_PATH.name}')
+                with open(PDF_PATH, 'rb') as fh:
+                    uploaded = client.files.create(file=fh, purpose='assistants')
+                file_id = uploaded.id
+                print(f'✓ PDF cargado (ID: {file_id[:12]}...)')
+        return file_id
+
+    chunks = chunked(pending, CHUNK_SIZE)
     total_chunks = len(chunks)
-    total_questions = len(question_ids)
 
-    print(f'📊 Total: {total_questions} preguntas en {total_chunks} grupos de {CHUNK_SIZE}\n')
+    print(f'   Pendientes: {len(pending)} preguntas en {total_chunks} grupos de {CHUNK_SIZE} ({workers} en paralelo)\n')
     start_time = time.time()
+    failed: List[int] = []
 
-    for chunk_idx, group in enumerate(chunks, 1):
-        numbers = ', '.join(str(n) for n in group)
-        print(f'[{chunk_idx}/{total_chunks}] Procesando preguntas {numbers}... ', end='', flush=True)
-        prompt = PROMPT_TEMPLATE.format(numbers=numbers)
-
-        for attempt in range(1, RETRIES + 1):
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(extract_chunk, client, uploaded_file_id, pdf_digest, group): group
+            for group in chunks
+        }
+        for done_idx, future in enumerate(as_completed(futures), 1):
+            group = futures[future]
+            numbers = ', '.join(str(n) for n in group)
             try:
-                response = client.responses.create(
-                    model='gpt-5-nano',
-                    input=[{
-                        'role': 'user',
-                        'content': [
-                            {'type': 'input_text', 'text': prompt},
-                            {'type': 'input_file', 'file_id': file_id},
-                        ],
-                    }],
-                    timeout=120,
-                )
-                text_parts = []
-                for item in response.output:
-                    content = getattr(item, 'content', None)
-                    if not content:
-                        continue
-                    for block in content:
-                        block_text = getattr(block, 'text', None)
-                        if block_text:
-                            text_parts.append(block_text)
-                combined = clean_json_text(''.join(text_parts))
-                chunk_data = json.loads(combined)
-                aggregated.update(chunk_data)
-                print(f'✓ ({len(chunk_data)} preguntas)')
-
-                # Save incrementally after each chunk
-                with open(RAW_OUTPUT, 'w', encoding='utf-8') as fh:
-                    json.dump(aggregated, fh, ensure_ascii=False, indent=2)
-
-                break
+                chunk_data = future.result()
             except Exception as err:  # noqa: BLE001
-                if attempt == RETRIES:
-                    print(f'✗ ERROR después de {RETRIES} intentos: {err}')
-                    raise
-                print(f'⚠ Intento {attempt} falló, reintentando... ', end='', flush=True)
-                time.sleep(SLEEP_SECONDS * attempt)
-        time.sleep(1)
+                failed.extend(group)
+                print(f'[{done_idx}/{total_chunks}] ✗ {numbers}: ERROR después de {RETRIES} intentos: {err}')
+                continue
+
+            # Only checkpoint the questions that were asked for and came back whole
+            accepted = 0
+            for n in group:
+                record = chunk_data.get(str(n))
+                if is_complete(record):
+                    checkpoint.append(n, record)
+                    accepted += 1
+                else:
+                    failed.append(n)
+            print(f'[{done_idx}/{total_chunks}] ✓ {numbers} ({accepted}/{len(group)} preguntas)')
 
     elapsed = time.time() - start_time
-    print(f'\n✓ Completado en {elapsed:.1f}s - {len(aggregated)} preguntas extraídas')
-    return aggregated
+    print(f'\n✓ Completado en {elapsed:.1f}s - {len(pending) - len(failed)} preguntas extraídas')
+    if failed:
+        print(f'⚠ {len(failed)} pregunta(s) sin extraer, se reintentarán en la próxima ejecución: {sorted(failed)}')
 
 
 def normalize(text: str) -> str:
@@ -128,10 +251,19 @@ def normalize(text: str) -> str:
     return text.lower()
 
 
-def build_final_payload(raw_data: Dict[str, Dict[str, object]]) -> Dict[str, Dict[str, object]]:
+def build_final_payload(
+    raw_data: Dict[str, Dict[str, object]], solutions: Optional[Dict[int, str]] = None,
+) -> Dict[str, Dict[str, object]]:
+    """Pair each question with its correct label by matching the known answer text.
+
+    If a solution key was parsed from the PDF, any question where the two
+    disagree is reported and the PDF key wins.
+    """
     print('\n🔍 Validando y emparejando respuestas...')
+    solutions = solutions or {}
     final: Dict[str, Dict[str, object]] = {}
     missing = []
+    disagreements = []
     total = len(raw_data)
 
     for idx, q_num in enumerate(sorted(raw_data.keys(), key=int), 1):
@@ -147,6 +279,13 @@ def build_final_payload(raw_data: Dict[str, Dict[str, object]]) -> Dict[str, Dic
             if normalize(option['text']) == norm_answer:
                 correct_label = option['label']
                 break
+        key_label = solutions.get(int(q_num))
+        if key_label and key_label != correct_label:
+            if correct_label:
+                disagreements.append(q_num)
+                print(f'\n⚠ {q_num}: la clave del PDF dice {key_label!r} pero el texto de la respuesta '
+                      f'coincide con {correct_label!r}; se usa la clave del PDF')
+            correct_label = key_label
         if not correct_label:
             missing.append(q_num)
         final[q_num] = {
@@ -161,23 +300,35 @@ def build_final_payload(raw_data: Dict[str, Dict[str, object]]) -> Dict[str, Dic
         print(f'\n⚠ Advertencia: {len(missing)} pregunta(s) sin coincidencia: {missing}')
     else:
         print('✓ Todas las respuestas coinciden correctamente')
+    if disagreements:
+        print(f'⚠ {len(disagreements)} pregunta(s) donde la clave del PDF no coincide con el texto '
+              f'(se usa la clave del PDF): {disagreements}')
 
     return final
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--workers', type=int, default=WORKERS,
+                        help=f'chunks extracted in parallel (default {WORKERS})')
+    parser.add_argument('--fresh', action='store_true',
+                        help=f'ignore the {RAW_OUTPUT} checkpoint and extract every question again')
+    parser.add_argument('--engine', choices=ENGINES, default='local',
+                        help='local: PDF text layer, model only for low-confidence questions; '
+                             'llm: model for every question (default local)')
+    args = parser.parse_args()
+
     print('═' * 60)
     print('  Extracción de Opciones Oficiales - CCSE 2026')
     print('═' * 60 + '\n')
 
-    raw = extract_options()
-
-    print(f'\n💾 Guardando datos sin procesar en {RAW_OUTPUT}... ', end='', flush=True)
-    with open(RAW_OUTPUT, 'w', encoding='utf-8') as fh:
-        json.dump(raw, fh, ensure_ascii=False, indent=2)
-    print('✓')
+    # Raw data is checkpointed to RAW_OUTPUT chunk by chunk during extraction
+    raw, solutions = extract_options(workers=args.workers, fresh=args.fresh, engine=args.engine)
+    if solutions:
+        save_solutions(solutions)
+        print(f'💾 Clave de soluciones guardada en {SOLUTIONS_OUTPUT}')
 
-    final = build_final_payload(raw)
+    final = build_final_payload(raw, solutions)
 
     print(f'💾 Guardando datos finales en {FINAL_OUTPUT}... ', end='', flush=True)
     with open(FINAL_OUTPUT, 'w', encoding='utf-8') as fh:
@@ -1,110 +1,79 @@
 #!/usr/bin/env python3
 """
-Fix specific issues in official_options.json and official_options_raw.json based on PDF source of truth.
+Review the corrections in overrides.json against the extracted option files.
+
+The corrections themselves are applied whenever the files are loaded (see
+overrides.py), so nothing here rewrites official_options.json,
+official_options_raw.json or options_translations.json. After a
+re-extraction, a correction whose extracted entry changed is reported as a
+conflict until it is reviewed and rebased.
+
+Usage:
+    python fix_options.py                  # status of every override
+    python fix_options.py --check          # exit 1 if any override conflicts
+    python fix_options.py --rebase 1059    # accept the current entries as its base
 """
 
-import json
-from pathlib import Path
-
-FILES_TO_FIX = [
-    Path('official_options.json'),
-    Path('official_options_raw.json'),
-    Path('options_translations.json'),
-]
-
-
-def fix_data(data: dict, filename: str) -> list:
-    """Apply fixes to the data dict. Returns list of fix descriptions."""
-    fixes = []
-
-    # Fix 1: Question 1059 - completely wrong question from GPT extraction
-    # PDF says: "¿Qué lengua cooficial se habla en las Islas Baleares?"
-    # Options: a. Gallego, b. Catalán, c. Euskera
-    # Correct: b
-    print(f'  Fixing question 1059 in {filename}...')
-
-    if 'translations' in filename:
-        # Russian translations file
-        data['1059'] = {
-            'options': [
-                {'label': 'a', 'text': 'Галисийский.'},
-                {'label': 'b', 'text': 'Каталанский.'},
-                {'label': 'c', 'text': 'Баскский.'}
-            ]
-        }
-    elif 'raw' in filename:
-        # Raw file - no 'correct' key
-        data['1059'] = {
-            'question': '¿Qué lengua cooficial se habla en las Islas Baleares?',
-            'options': [
-                {'label': 'a', 'text': 'Gallego.'},
-                {'label': 'b', 'text': 'Catalán.'},
-                {'label': 'c', 'text': 'Euskera.'}
-            ]
-        }
-    else:
-        # Main file - includes 'correct' key
-        data['1059'] = {
-            'question': '¿Qué lengua cooficial se habla en las Islas Baleares?',
-            'options': [
-                {'label': 'a', 'text': 'Gallego.'},
-                {'label': 'b', 'text': 'Catalán.'},
-                {'label': 'c', 'text': 'Euskera.'}
-            ],
-            'correct': 'b'
-        }
-    fixes.append('1059: Replaced wrong question (was 1015 content) with correct Balearic language question')
-
-    # Fix 2: Question 5038 - missing correct answer label (only in official_options.json)
-    if 'raw' not in filename and 'translations' not in filename:
-        print(f'  Fixing question 5038 in {filename}...')
-        if data.get('5038', {}).get('correct') is None:
-            data['5038']['correct'] = 'b'
-            fixes.append('5038: Set correct answer to "b" (se compone de dos cursos académicos)')
-
-    # Fix 3: Question 5041 - question text includes answer (skip translations file)
-    # Should be: "Los colegios públicos…"
-    if 'translations' not in filename:
-        print(f'  Fixing question 5041 in {filename}...')
-        if '5041' in data:
-            data['5041']['question'] = 'Los colegios públicos…'
-            fixes.append('5041: Fixed question text (removed answer from question)')
-
-    return fixes
+import argparse
+import sys
 
+from ccse_verify import load_model, run_checks
+from overrides import (
+    entry_fingerprint, load_overrides, override_status, read_sources, save_overrides, touched_sources,
+)
 
-def main():
-    print('=' * 60)
-    print('  Fixing official_options JSON files')
-    print('=' * 60 + '\n')
-
-    all_fixes = []
+STATUS_ICONS = {'ok': '✓', 'redundant': '=', 'conflict': '✗', 'unbased': '?'}
 
-    for filepath in FILES_TO_FIX:
-        if not filepath.exists():
-            print(f'Skipping {filepath} (not found)')
-            continue
 
-        print(f'Processing {filepath}...')
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+def rebase(q_nums, extracted):
+    """Record the current extracted entries as the base of the given overrides, in the files they change"""
+    overrides = {q_num: dict(override) for q_num, override in load_overrides().items()}
+    unknown = [q_num for q_num in q_nums if q_num not in overrides]
+    if unknown:
+        sys.exit(f'❌ Sin override para: {unknown}')
+    for q_num in q_nums:
+        overrides[q_num]['base'] = {
+            source: entry_fingerprint(extracted[source].get(str(q_num)))
+            for source in touched_sources(overrides[q_num])
+        }
+    save_overrides(overrides)
+    print(f'✅ Base actualizada para {q_nums}')
 
-        fixes = fix_data(data, str(filepath))
 
-        print(f'  Saving to {filepath}...')
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--check', action='store_true', help='exit with status 1 if any override conflicts')
+    parser.add_argument('--rebase', type=int, nargs='+', metavar='N', help='accept the current extracted entries')
+    args = parser.parse_args()
 
-        all_fixes.extend(fixes)
-        print()
+    extracted = read_sources()
+    if args.rebase:
+        rebase(args.rebase, extracted)
 
+    overrides = load_overrides()
+    statuses = override_status(extracted, overrides)
     print('=' * 60)
-    print('  All fixes applied:')
+    print(f'  {len(overrides)} correcciones en overrides.json')
     print('=' * 60)
-    for fix in all_fixes:
-        print(f'  ✓ {fix}')
-
-    print(f'\n✓ Done! {len(all_fixes)} fixes applied.')
+    for q_num, override in sorted(overrides.items()):
+        print(f"\n{q_num}: {override.get('note', '')}")
+        for status in statuses:
+            if status['q_num'] == q_num:
+                print(f"  {STATUS_ICONS[status['status']]} {status['source']}: {status['status']}")
+
+    conflicts = [status for status in statuses if status['status'] == 'conflict']
+    if conflicts:
+        print(f'\n⚠ {len(conflicts)} conflicto(s): revisa la nueva extracción y usa --rebase N')
+
+    results = run_checks(load_model(), q_nums=sorted(overrides))
+    remaining = [issue for issues in results.values() for issue in issues if issue['check'] != 'overrides']
+    for issue in remaining:
+        print(f"  ✗ {issue['q_num']} ({issue['check']}): {issue['message']}")
+    if not remaining:
+        print(f'\n✓ Las preguntas corregidas {sorted(overrides)} pasan todas las comprobaciones.')
+
+    if args.check and conflicts:
+        sys.exit(1)
 
 
 if __name__ == '__main__':
@@ -6,7 +6,12 @@ with Russian explanations generated via OpenAI API
 
 import os
 import json
+import argparse
 import asyncio
+import hashlib
+import inspect
+import re
+import unicodedata
 import aiohttp
 import html as html_module
 from pathlib import Path
@@ -16,12 +21,69 @@ from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent / "exocortex" / ".env")
 
 # Import questions data
-from ccse_questions import questions, translations, sections, get_section
+from ccse_questions import questions, translations
+from question_bank import section_registry
+from llm_pool import AdaptivePool, RateLimitError, TransientError, parse_duration
+from journal import Journal
+from overrides import load_options
+from response_cache import ResponseCache, make_key
 
 EXPLANATIONS_FILE = "explanations.json"
 OPTIONS_FILE = "options.json"
+BUILD_CACHE_FILE = ".build_cache.json"
+BATCH_REQUEST_FILE = "explanations_batch.jsonl"
+SINGLE_FILE_OUTPUT = "ccse_study.html"
+BUILD_MANIFEST_FILE = "asset-manifest.json"
+PRECACHE_MANIFEST_FILE = "precache-manifest.js"
+# Files of the app shell that the service worker precaches besides the hashed assets
+SHELL_FILES = ('./', './index.html', './manifest.json', './icons/icon-192.png', './icons/icon-512.png')
+# Hand-written files of the app, next to this script, that every build directory needs
+STATIC_FILES = ('sw.js', 'manifest.json', 'icons/icon-192.png', 'icons/icon-512.png')
+HASHED_ASSET_RE = re.compile(r'^(app|data)\.[0-9a-f]{10}\.(css|js|json)$')
+CHAT_COMPLETIONS_URL = "https://api.openai.com/v1/chat/completions"
+MAX_CONCURRENCY = 16
+PROGRESS_EVERY = 10
+
+# Shared on-disk cache of API responses, keyed by the full request payload
+response_cache = ResponseCache()
+
+async def post_chat_completion(session, pool, payload):
+    """POST a chat completion and return the message text.
+
+    Identical payloads are answered from response_cache without an API
+    call. Raises RateLimitError / TransientError so the worker pool can
+    back off and retry; any other failure is raised as RuntimeError.
+    """
+    cache_key = make_key(endpoint='chat.completions', **payload)
+    cached = await response_cache.aget(cache_key)
+    if cached is not None:
+        return cached
 
-async def generate_wrong_options(session, q_num, es_q, es_a, ru_q, ru_a):
+    headers = {
+        "Authorization": f"Bearer {os.getenv('OPENAI_API_KEY')}",
+        "Content-Type": "application/json"
+    }
+
+    try:
+        async with session.post(CHAT_COMPLETIONS_URL, headers=headers, json=payload) as response:
+            pool.observe_headers(response.headers)
+            if response.status == 200:
+                data = await response.json()
+                content = data['choices'][0]['message']['content'].strip()
+                await response_cache.aput(cache_key, content)
+                return content
+
+            error = f"{response.status} - {(await response.text())[:100]}"
+            retry_after = parse_duration(response.headers.get('retry-after'))
+            if response.status == 429:
+                raise RateLimitError(error, retry_after)
+            if response.status >= 500:
+                raise TransientError(error, retry_after)
+            raise RuntimeError(error)
+    except aiohttp.ClientError as e:
+        raise TransientError(str(e)) from e
+
+async def generate_wrong_options(session, pool, q_num, es_q, es_a, ru_q, ru_a):
     """Generate 2 plausible but wrong answer options in Spanish and Russian"""
 
     prompt = f"""Para esta pregunta del examen CCSE (ciudadanía española), genera 2 respuestas INCORRECTAS pero plausibles.
@@ -35,11 +97,6 @@ Responde SOLO en este formato JSON (sin explicaciones):
 
 Las respuestas en ruso deben ser traducciones de las españolas."""
 
-    headers = {
-        "Authorization": f"Bearer {os.getenv('OPENAI_API_KEY')}",
-        "Content-Type": "application/json"
-    }
-
     payload = {
         "model": "gpt-4o-mini",
         "messages": [{"role": "user", "content": prompt}],
@@ -47,36 +104,37 @@ Las respuestas en ruso deben ser traducciones de las españolas."""
         "max_tokens": 200
     }
 
-    try:
-        async with session.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers=headers,
-            json=payload
-        ) as response:
-            if response.status == 200:
-                data = await response.json()
-                content = data['choices'][0]['message']['content'].strip()
-                # Parse JSON from response
-                import re
-                json_match = re.search(r'\{[^}]+\}', content, re.DOTALL)
-                if json_match:
-                    return json.loads(json_match.group())
-                return None
-            else:
-                error = await response.text()
-                print(f"Error for {q_num}: {response.status} - {error[:100]}")
-                return None
-    except Exception as e:
-        print(f"Exception for {q_num}: {e}")
-        return None
+    content = await post_chat_completion(session, pool, payload)
+    # Parse JSON from response
+    import re
+    json_match = re.search(r'\{[^}]+\}', content, re.DOTALL)
+    if not json_match:
+        raise ValueError(f"no JSON object in response: {content[:100]}")
+    return json.loads(json_match.group())
+
+def report_progress(label, total, journal):
+    """Build an on_result callback that journals each result as it completes"""
+    done = 0
+
+    def on_result(q_num, ok, result):
+        nonlocal done
+        done += 1
+        if ok:
+            journal.append(q_num, result)
+        else:
+            print(f"Error for {q_num}: {result}")
+        if done % PROGRESS_EVERY == 0 or done == total:
+            print(f"{label}: {done}/{total}")
+
+    return on_result
 
 async def generate_all_options():
     """Generate wrong options for all questions"""
 
-    options = {}
-    if os.path.exists(OPTIONS_FILE):
-        with open(OPTIONS_FILE, 'r', encoding='utf-8') as f:
-            options = json.load(f)
+    # Compacts any journal left by an interrupted run into OPTIONS_FILE
+    journal = Journal(OPTIONS_FILE)
+    options = journal.load()
+    if options:
         print(f"Loaded {len(options)} existing options")
 
     to_generate = []
@@ -90,33 +148,24 @@ async def generate_all_options():
 
     print(f"Generating options for {len(to_generate)} questions...")
 
-    async with aiohttp.ClientSession() as session:
-        batch_size = 10
-        for i in range(0, len(to_generate), batch_size):
-            batch = to_generate[i:i+batch_size]
-            tasks = []
-
-            for q_num in batch:
-                es_q, es_a, _ = get_question_data(q_num)
-                ru_q, ru_a = get_translation_data(q_num)
-                tasks.append(generate_wrong_options(session, q_num, es_q, es_a, ru_q, ru_a))
-
-            results = await asyncio.gather(*tasks)
+    on_result = report_progress("Options progress", len(to_generate), journal)
 
-            for q_num, opts in zip(batch, results):
-                if opts:
-                    options[str(q_num)] = opts
-
-            with open(OPTIONS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(options, f, ensure_ascii=False, indent=2)
+    pool = AdaptivePool(max_concurrency=MAX_CONCURRENCY)
+    async with aiohttp.ClientSession() as session:
+        async def worker(q_num):
+            es_q, es_a, _ = get_question_data(q_num)
+            ru_q, ru_a, _ = get_translation_data(q_num)
+            return await generate_wrong_options(session, pool, q_num, es_q, es_a, ru_q, ru_a)
 
-            print(f"Options progress: {min(i+batch_size, len(to_generate))}/{len(to_generate)}")
-            await asyncio.sleep(0.5)
+        try:
+            await pool.run(to_generate, worker, on_result)
+        finally:
+            journal.close()
 
     return options
 
-async def generate_explanation(session, q_num, es_q, es_a, ru_q, ru_a):
-    """Generate a brief Russian explanation for why this is the correct answer"""
+def explanation_payload(es_q, es_a, ru_q, ru_a):
+    """Chat completion request asking for a brief Russian explanation of the answer"""
 
     prompt = f"""Вопрос для экзамена CCSE (испанское гражданство):
 
@@ -127,34 +176,16 @@ async def generate_explanation(session, q_num, es_q, es_a, ru_q, ru_a):
 
 Напиши КРАТКОЕ объяснение на русском языке (1-2 предложения), почему этот ответ правильный. Только факты, без вступлений."""
 
-    headers = {
-        "Authorization": f"Bearer {os.getenv('OPENAI_API_KEY')}",
-        "Content-Type": "application/json"
-    }
-
-    payload = {
+    return {
         "model": "gpt-4o-mini",
         "messages": [{"role": "user", "content": prompt}],
         "temperature": 0.3,
         "max_tokens": 150
     }
 
-    try:
-        async with session.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers=headers,
-            json=payload
-        ) as response:
-            if response.status == 200:
-                data = await response.json()
-                return data['choices'][0]['message']['content'].strip()
-            else:
-                error = await response.text()
-                print(f"Error for {q_num}: {response.status} - {error[:100]}")
-                return ""
-    except Exception as e:
-        print(f"Exception for {q_num}: {e}")
-        return ""
+async def generate_explanation(session, pool, q_num, es_q, es_a, ru_q, ru_a):
+    """Generate a brief Russian explanation for why this is the correct answer"""
+    return await post_chat_completion(session, pool, explanation_payload(es_q, es_a, ru_q, ru_a))
 
 def get_question_data(q_num):
     """Extract question and answer, handling variable tuple lengths"""
@@ -187,14 +218,23 @@ def normalize(text: str) -> str:
     text = text.rstrip(' .')
     return text
 
-async def generate_all_explanations():
-    """Generate explanations for all questions"""
+async def generate_all_explanations(batch_backend=None):
+    """Generate explanations for all questions
+
+    With a batch_backend, all pending questions are submitted as a single
+    Batch API job instead of live requests. A backend pointed at another
+    server (e.g. the batch stub) keeps its explanations in a file of its own.
+    """
 
-    # Load existing explanations if any
-    explanations = {}
-    if os.path.exists(EXPLANATIONS_FILE):
-        with open(EXPLANATIONS_FILE, 'r', encoding='utf-8') as f:
-            explanations = json.load(f)
+    explanations_file = EXPLANATIONS_FILE
+    if batch_backend is not None:
+        from batch_backend import output_path
+        explanations_file = output_path(EXPLANATIONS_FILE, batch_backend.base_url)
+
+    # Load existing explanations, recovering any journal left by an interrupted run
+    journal = Journal(explanations_file)
+    explanations = journal.load()
+    if explanations:
         print(f"Loaded {len(explanations)} existing explanations")
 
     # Check for embedded explanations in questions data
@@ -202,7 +242,7 @@ async def generate_all_explanations():
         if str(q_num) not in explanations:
             es_q, es_a, embedded_expl = get_question_data(q_num)
             if embedded_expl:
-                explanations[str(q_num)] = embedded_expl
+                journal.append(q_num, embedded_expl)
 
     # Find questions that need explanations
     to_generate = []
@@ -211,183 +251,240 @@ async def generate_all_explanations():
             to_generate.append(q_num)
 
     if not to_generate:
+        journal.close()
         print("All explanations already generated!")
         return explanations
 
     print(f"Generating {len(to_generate)} explanations...")
 
-    async with aiohttp.ClientSession() as session:
-        # Process in batches of 10 to avoid rate limits
-        batch_size = 10
-        for i in range(0, len(to_generate), batch_size):
-            batch = to_generate[i:i+batch_size]
-            tasks = []
+    if batch_backend is not None:
+        requests = {}
+        for q_num in to_generate:
+            es_q, es_a, _ = get_question_data(q_num)
+            ru_q, ru_a, _ = get_translation_data(q_num)
+            requests[str(q_num)] = explanation_payload(es_q, es_a, ru_q, ru_a)
+
+        results = batch_backend.run(requests, BATCH_REQUEST_FILE, cache=response_cache,
+                                    description='CCSE explanations')
+        try:
+            for q_num, explanation in results.items():
+                if explanation:
+                    journal.append(q_num, explanation)
+                else:
+                    print(f"Error for {q_num}: no result in batch output")
+        finally:
+            journal.close()
+        return explanations
 
-            for q_num in batch:
-                es_q, es_a, _ = get_question_data(q_num)
-                ru_q, ru_a = get_translation_data(q_num)
-                tasks.append(generate_explanation(session, q_num, es_q, es_a, ru_q, ru_a))
+    on_result = report_progress("Progress", len(to_generate), journal)
 
-            results = await asyncio.gather(*tasks)
+    # Keep the pool full; concurrency adapts to the API's rate limits
+    pool = AdaptivePool(max_concurrency=MAX_CONCURRENCY)
+    async with aiohttp.ClientSession() as session:
+        async def worker(q_num):
+            es_q, es_a, _ = get_question_data(q_num)
+            ru_q, ru_a, _ = get_translation_data(q_num)
+            return await generate_explanation(session, pool, q_num, es_q, es_a, ru_q, ru_a)
 
-            for q_num, explanation in zip(batch, results):
-                explanations[str(q_num)] = explanation
+        try:
+            await pool.run(to_generate, worker, on_result)
+        finally:
+            journal.close()
 
-            # Save progress after each batch
-            with open(EXPLANATIONS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(explanations, f, ensure_ascii=False, indent=2)
+    return explanations
 
-            print(f"Progress: {min(i+batch_size, len(to_generate))}/{len(to_generate)}")
+def find_correct_label(es_options, es_a):
+    """Find the label of the option whose text matches the answer (defaults to 'a')"""
+    for opt in es_options:
+        if normalize(opt['text']) == normalize(es_a):
+            return opt['label']
+    return 'a'
 
-            # Small delay to avoid rate limits
-            await asyncio.sleep(0.5)
+def card_data(q_num, es_q, es_a, ru_q, ru_options, explanation, official_record):
+    """Data for a single question card; the page renders the card from it (see renderCard)"""
 
-    return explanations
+    # Get Spanish options from official_options_raw.json
+    if official_record:
+        es_options = official_record['options']
+        correct_label = find_correct_label(es_options, es_a)
+    else:
+        # Fallback if options not available
+        es_options = [
+            {'label': 'a', 'text': es_a},
+            {'label': 'b', 'text': '...'},
+            {'label': 'c', 'text': '...'}
+        ]
+        correct_label = 'a'
+
+    return {
+        'q': es_q,
+        'options': [{'label': opt['label'], 'text': opt['text']} for opt in es_options],
+        'correct': correct_label,
+        'ruQ': ru_q,
+        'ruOptions': [{'label': opt['label'], 'text': opt['text']} for opt in ru_options],
+        'explanation': explanation,
+    }
 
-def generate_html(explanations):
-    """Generate the interactive HTML file"""
+def script_json(data):
+    """Serialize data for an inline <script type="application/json"> block"""
+    # No '<' may survive, or question text could close the script element
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).replace('<', '\\u003c')
+
+# Card fields in the search index, with the weight of a match in each (at most 7)
+SEARCH_FIELDS = (('q', 5), ('options', 3), ('ruQ', 3), ('ruOptions', 2), ('explanation', 1))
+TOKEN_RE = re.compile(r'[^\W_]+')
+
+def fold_text(text):
+    """Lowercase text without diacritics; the page folds search queries the same way
+
+    Same folding as normalize() in ccse_verify.py: NFD without the
+    combining marks, so "ó" -> "o", "ñ" -> "n" and Cyrillic "ё" -> "е".
+    """
+    text = unicodedata.normalize('NFD', text.lower())
+    return ''.join(c for c in text if unicodedata.category(c) != 'Mn')
+
+def search_tokens(text):
+    """Folded words of an HTML text fragment"""
+    return TOKEN_RE.findall(fold_text(html_module.unescape(re.sub(r'<[^>]+>', ' ', text))))
+
+def term_trigrams(term):
+    """Trigrams of a folded word, anchored at its start so a prefix shares them"""
+    padded = '^' + term
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def build_search_index(question_data):
+    """Inverted index over the card texts for the page's search box
+
+    Returns {"terms": sorted folded words, "postings": one list per term,
+    "trigrams": {trigram: delta-encoded indexes of the terms containing it}}.
+    Each posting is position * 8 + weight, where position indexes the sorted
+    question numbers and weight is that of the best field holding the term.
+    The trigram table finds candidate words for query words with typos.
+    """
+    best = {}
+    for position, q_num in enumerate(sorted(question_data, key=int)):
+        data = question_data[q_num]
+        texts = {
+            'q': f"{q_num} {data['q']}",
+            'options': ' '.join(opt['text'] for opt in data['options']),
+            'ruQ': data['ruQ'],
+            'ruOptions': ' '.join(opt['text'] for opt in data['ruOptions']),
+            'explanation': data['explanation'],
+        }
+        for field, weight in SEARCH_FIELDS:
+            for token in search_tokens(texts[field]):
+                postings = best.setdefault(token, {})
+                postings[position] = max(postings.get(position, 0), weight)
+
+    terms = sorted(best)
+    trigrams = {}
+    for idx, term in enumerate(terms):
+        if term.isdigit():
+            continue  # question numbers and years are looked up exactly
+        for gram in term_trigrams(term):
+            trigrams.setdefault(gram, []).append(idx)
+    return {
+        'terms': terms,
+        'postings': [[position * 8 + weight for position, weight in sorted(best[term].items())] for term in terms],
+        'trigrams': {gram: [b - a for a, b in zip([0] + ids, ids)] for gram, ids in sorted(trigrams.items())},
+    }
 
-    # Load official options from JSON file
+def build_fingerprint(explanations, official_options):
+    """Content hash of everything the question data and search index are built from
+
+    The bank entries, their translations, official options and explanations,
+    plus the generator code that turns them into card data and the index.
+    """
+    code = ''.join(inspect.getsource(fn) for fn in (
+        get_question_data, get_translation_data, normalize, find_correct_label, card_data,
+        fold_text, search_tokens, term_trigrams, build_search_index,
+    ))
+    q_nums = sorted(questions.keys())
+    inputs = [
+        code,
+        SEARCH_FIELDS,
+        TOKEN_RE.pattern,
+        [[q_num, questions[q_num], translations[q_num]] for q_num in q_nums],
+        {str(q_num): official_options.get(str(q_num)) for q_num in q_nums},
+        {str(q_num): explanations.get(str(q_num), "") for q_num in q_nums},
+    ]
+    payload = json.dumps(inputs, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def load_build_cache(fingerprint):
+    """Question data and search index of the previous build, if it had the same fingerprint"""
+    if os.path.exists(BUILD_CACHE_FILE):
+        try:
+            with open(BUILD_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('fingerprint') == fingerprint:
+                return cache
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable build cache: {e}")
+    return None
+
+def save_build_cache(fingerprint, question_data, search_index):
+    """Write the cache atomically so an interrupted build never corrupts it"""
+    tmp_file = BUILD_CACHE_FILE + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        # One dumps() call: json.dump's chunked writes take several times longer here
+        f.write(json.dumps({'fingerprint': fingerprint, 'questionData': question_data, 'searchIndex': search_index},
+                           ensure_ascii=False, separators=(',', ':')))
+    os.replace(tmp_file, BUILD_CACHE_FILE)
+
+def generate_html(explanations, incremental=False):
+    """Build the parts of the interactive page: {'head', 'css', 'body', 'js', 'data'}
+
+    Question content is shipped as one JSON blob and each card is rendered
+    by the page just before it scrolls into view. single_file_page and
+    write_bundle assemble the parts into pages. With incremental=True, the
+    question data and search index (most of the build time) are reused from
+    BUILD_CACHE_FILE when their inputs hash to the same fingerprint as in the
+    previous build.
+    """
+
+    # Load official options from JSON file, with the corrections in overrides.json
     options_file = Path('official_options_raw.json')
     if options_file.exists():
-        with open(options_file, 'r', encoding='utf-8') as f:
-            official_options = json.load(f)
+        official_options = load_options(options_file)
         print(f"Loaded {len(official_options)} questions with official options")
     else:
         official_options = {}
         print("Warning: official_options_raw.json not found, using fallback options")
 
-    html_questions = []
-    current_section = 0
-
-    for q_num in sorted(questions.keys()):
-        section = get_section(q_num)
-        es_q, es_a, _ = get_question_data(q_num)
-        ru_q, ru_a, ru_options = get_translation_data(q_num)
-        explanation = explanations.get(str(q_num), "")
-
-        # Add section header if new section
-        if section != current_section:
-            current_section = section
-            es_title, ru_title = sections[section]
-            html_questions.append(f'''
-        <div class="section-header">
-            <h2>{es_title}</h2>
-            <p class="section-ru">{ru_title}</p>
-        </div>''')
-
-        # Get Spanish options from official_options_raw.json
-        q_num_str = str(q_num)
-        if q_num_str in official_options:
-            es_options = official_options[q_num_str]['options']
-            correct_label = None
-
-            # Find correct option label by matching answer
-            for opt in es_options:
-                if normalize(opt['text']) == normalize(es_a):
-                    correct_label = opt['label']
-                    break
-
-            if not correct_label:
-                correct_label = 'a'
-        else:
-            # Fallback if options not available
-            es_options = [
-                {'label': 'a', 'text': es_a},
-                {'label': 'b', 'text': '...'},
-                {'label': 'c', 'text': '...'}
-            ]
-            correct_label = 'a'
-
-        # Build options HTML
-        options_html = []
-        for opt in es_options:
-            opt_text = opt['text']
-            label = opt['label']
-            options_html.append(f'''
-                <button class="option" data-label="{label}" onclick="selectOption(this, {q_num}, '{label}', '{correct_label}')">
-                    {label}) {opt_text}
-                </button>''')
-
-        # Prepare data for JavaScript - escape for JS strings inside HTML onclick attributes
-        # Must escape for both JavaScript AND HTML attribute context
-        def js_and_html_escape(text):
-            # First escape for JavaScript string (single quotes)
-            text = text.replace('\\', '\\\\').replace("'", "\\'").replace('\n', ' ').replace('\r', '')
-            # Then escape double quotes for HTML attribute parsing
-            text = text.replace('"', '&quot;')
-            return text
-
-        ru_q_js = js_and_html_escape(ru_q)
-
-        # Prepare Russian options for translation button - JSON string needs JS+HTML escaping
-        ru_options_json_str = json.dumps([{
-            'label': opt['label'],
-            'text': opt['text']
-        } for opt in ru_options], ensure_ascii=False)
-        ru_options_js = js_and_html_escape(ru_options_json_str)
-
-        # Also prepare Spanish options to show in parenthesis for correct answer
-        es_options_json_str = json.dumps([{
-            'label': opt['label'],
-            'text': opt['text']
-        } for opt in es_options], ensure_ascii=False)
-        es_options_js = js_and_html_escape(es_options_json_str)
-
-        explanation_js = js_and_html_escape(explanation)
-
-        # Build Russian options HTML for print
-        ru_options_html = []
-        for opt in ru_options:
-            opt_class = 'correct' if opt['label'] == correct_label else ''
-            ru_options_html.append(f'                    <div class="ru-option {opt_class}">{opt["label"]}) {opt["text"]}</div>')
-
-        # Build Spanish options as plain text for print
-        es_options_print_html = []
-        for opt in es_options:
-            opt_class = 'correct' if opt['label'] == correct_label else ''
-            es_options_print_html.append(f'                    <div class="print-option {opt_class}">{opt["label"]}) {opt["text"]}</div>')
-
-        html_questions.append(f'''
-        <div class="question-card" id="q{q_num}" data-correct="{correct_label}">
-            <div class="score-indicator not-attempted" id="indicator{q_num}" title="Sin responder">
-                <span class="score-tooltip">Sin responder</span>
-            </div>
-            <div class="print-columns">
-                <div class="print-spanish">
-                    <div class="q-number">#{q_num}</div>
-                    <div class="question">{es_q}</div>
-                    <div class="print-options">
-{''.join(es_options_print_html)}
-                    </div>
-                </div>
-                <div class="print-russian">
-                    <div class="q-number-ru">#{q_num}</div>
-                    <div class="question-ru">{ru_q}</div>
-                    <div class="ru-options">
-{''.join(ru_options_html)}
-                    </div>
-                </div>
-            </div>
-            <div class="screen-only">
-                <div class="q-number">#{q_num}</div>
-                <div class="question">{es_q}</div>
-                <div class="options-container">
-                    {''.join(options_html)}
-                    <div class="result" id="result{q_num}"></div>
-                </div>
-                <div class="buttons">
-                    <button class="btn translate" onclick="toggleTranslate({q_num}, '{ru_q_js}', '{ru_options_js}', '{es_options_js}', '{correct_label}')">Перевод</button>
-                    <button class="btn explain" onclick="toggleExplain({q_num}, '{explanation_js}')">Объяснение</button>
-                </div>
-                <div class="translation" id="trans{q_num}"></div>
-                <div class="explanation" id="expl{q_num}"></div>
-            </div>
-        </div>''')
-
-    questions_html = '\n'.join(html_questions)
+    cache = None
+    if incremental:
+        fingerprint = build_fingerprint(explanations, official_options)
+        cache = load_build_cache(fingerprint)
 
-    html = f'''<!DOCTYPE html>
+    if cache is not None:
+        question_data = cache['questionData']
+        search_index = cache['searchIndex']
+        print("Incremental build: content unchanged, reused the question data and search index")
+    else:
+        question_data = {}
+        for q_num in sorted(questions.keys()):
+            es_q, es_a, _ = get_question_data(q_num)
+            ru_q, ru_a, ru_options = get_translation_data(q_num)
+            question_data[str(q_num)] = card_data(
+                q_num, es_q, es_a, ru_q, ru_options,
+                explanations.get(str(q_num), ""), official_options.get(str(q_num)),
+            )
+        search_index = build_search_index(question_data)
+        if incremental:
+            save_build_cache(fingerprint, question_data, search_index)
+
+    # Section membership for the quiz builder and per-section stats
+    registry = section_registry()
+    section_questions = {str(s): nums for s, nums in registry.questions_by_section.items()}
+    section_titles = {str(s): titles for s, titles in registry.titles.items()}
+    total_questions = len(registry.all_questions())
+    section_options = '\n'.join(
+        f'                                <option value="{s}">TAREA {s} ({len(nums)} preguntas)</option>'
+        for s, nums in registry.questions_by_section.items()
+    )
+
+    head = f'''<!DOCTYPE html>
 <html lang="es">
 <head>
     <meta charset="UTF-8">
@@ -403,8 +500,9 @@ def generate_html(explanations):
     <link rel="preconnect" href="https://fonts.googleapis.com">
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
     <link href="https://fonts.googleapis.com/css2?family=Source+Serif+4:ital,opsz,wght@0,8..60,300;0,8..60,400;0,8..60,500;0,8..60,600;1,8..60,400&display=optional" rel="stylesheet">
-    <link href="https://fonts.googleapis.com/css2?family=Crimson+Pro:wght@400;600;700;900&family=Literata:opsz,wght@7..72,400;7..72,600;7..72,700&display=optional" rel="stylesheet">
-    <style>
+    <link href="https://fonts.googleapis.com/css2?family=Crimson+Pro:wght@400;600;700;900&family=Literata:opsz,wght@7..72,400;7..72,600;7..72,700&display=optional" rel="stylesheet">'''
+
+    css = f'''
         :root {{
             --bg: #fafafa;
             --bg-card: #ffffff;
@@ -561,6 +659,12 @@ def generate_html(explanations):
             color: var(--text-tertiary);
         }}
 
+        mark.search-hit {{
+            background: var(--accent-soft);
+            color: inherit;
+            border-radius: 3px;
+        }}
+
         .section-header {{
             margin: 56px 0 32px;
             padding: 16px 0;
@@ -599,6 +703,11 @@ def generate_html(explanations):
             border-color: var(--text-tertiary);
         }}
 
+        /* Scroll anchoring is done by the virtual list itself */
+        .question-list {{
+            overflow-anchor: none;
+        }}
+
         .q-number {{
             color: var(--text-tertiary);
             font-size: 0.9rem;
@@ -2523,9 +2632,9 @@ def generate_html(explanations):
                 display: none;
             }}
         }}
-    </style>
-</head>
-<body>
+'''
+
+    body = f'''
     <!-- Hamburger menu toggle -->
     <button class="menu-toggle" onclick="toggleMenu()">☰</button>
 
@@ -2591,23 +2700,19 @@ def generate_html(explanations):
                     <div class="radio-group">
                         <label class="radio-option">
                             <input type="radio" name="questionMode" value="all" checked>
-                            <span id="fullExamLabel">Examen completo (300 preguntas)</span>
+                            <span id="fullExamLabel">Examen completo ({total_questions} preguntas)</span>
                         </label>
                         <label class="radio-option">
                             <input type="radio" name="questionMode" value="section">
                             <span id="bySectionLabel">Por sección:</span>
                             <select id="sectionSelect" disabled>
-                                <option value="1">TAREA 1 (120 preguntas)</option>
-                                <option value="2">TAREA 2 (36 preguntas)</option>
-                                <option value="3">TAREA 3 (24 preguntas)</option>
-                                <option value="4">TAREA 4 (36 preguntas)</option>
-                                <option value="5">TAREA 5 (84 preguntas)</option>
+{section_options}
                             </select>
                         </label>
                         <label class="radio-option">
                             <input type="radio" name="questionMode" value="custom">
                             <span id="quickPracticeLabel">Práctica rápida:</span>
-                            <input type="number" id="customCount" min="1" max="300" value="25" disabled>
+                            <input type="number" id="customCount" min="1" max="{total_questions}" value="25" disabled>
                             <span id="questionsLabel">preguntas</span>
                         </label>
                     </div>
@@ -2689,9 +2794,9 @@ def generate_html(explanations):
             <span id="revealed">0</span> / {len(questions)} вопросов отвечено
         </div>
 
-        <input type="text" class="search-box" placeholder="Поиск вопроса..." oninput="filterQuestions(this.value)">
+        <input type="text" class="search-box" placeholder="Поиск вопроса..." oninput="filterQuestions()">
 
-        {questions_html}
+        <div class="question-list" id="questionList"></div>
     </div>
 
     <div class="bottom-nav">
@@ -2713,12 +2818,359 @@ def generate_html(explanations):
         </button>
     </div>
 
-    <script>
+'''
+
+    js = f'''
+        // Question content and structure: the build's data file, loaded by
+        // the page before this script runs
+        const ccseData = window.ccseData;
+
         let revealedCount = 0;
-        const totalQuestions = {len(questions)};
+        const totalQuestions = ccseData.allQuestionNumbers.length;
 
         // All question numbers for quiz mode
-        const allQuestionNumbers = {json.dumps(sorted(questions.keys()))};
+        const allQuestionNumbers = ccseData.allQuestionNumbers;
+
+        // Question numbers of each section, and the section of each question
+        const sectionQuestions = ccseData.sectionQuestions;
+        const questionSection = {{}};
+        Object.entries(sectionQuestions).forEach(([section, nums]) => {{
+            nums.forEach(qNum => {{ questionSection[qNum] = parseInt(section); }});
+        }});
+
+        // Spanish and Russian title of each section
+        const sectionTitles = ccseData.sectionTitles;
+
+        // ==========================================
+        // CARD RENDERING
+        // ==========================================
+
+        // Question content by number; cards are built from it on demand
+        const questionData = ccseData.questionData;
+
+        // Question data is plain text: escape it wherever it goes into markup
+        const HTML_ESCAPES = {{ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' }};
+        function escapeHtml(text) {{
+            return String(text).replace(/[&<>"']/g, ch => HTML_ESCAPES[ch]);
+        }}
+
+        // Inner markup of one question card
+        function renderCard(qNum) {{
+            const data = questionData[qNum];
+            const correctClass = opt => opt.label === data.correct ? 'correct' : '';
+            const printOptions = data.options.map(opt =>
+                `<div class="print-option ${{correctClass(opt)}}">${{escapeHtml(opt.label)}}) ${{escapeHtml(opt.text)}}</div>`).join('');
+            const ruOptions = data.ruOptions.map(opt =>
+                `<div class="ru-option ${{correctClass(opt)}}">${{escapeHtml(opt.label)}}) ${{escapeHtml(opt.text)}}</div>`).join('');
+            const options = data.options.map(opt => `
+                    <button class="option" data-action="select" data-label="${{escapeHtml(opt.label)}}">
+                        ${{escapeHtml(opt.label)}}) ${{escapeHtml(opt.text)}}
+                    </button>`).join('');
+
+            return `
+            <div class="score-indicator not-attempted" id="indicator${{qNum}}" title="Sin responder">
+                <span class="score-tooltip">Sin responder</span>
+            </div>
+            <div class="print-columns">
+                <div class="print-spanish">
+                    <div class="q-number">#${{qNum}}</div>
+                    <div class="question">${{escapeHtml(data.q)}}</div>
+                    <div class="print-options">${{printOptions}}</div>
+                </div>
+                <div class="print-russian">
+                    <div class="q-number-ru">#${{qNum}}</div>
+                    <div class="question-ru">${{escapeHtml(data.ruQ)}}</div>
+                    <div class="ru-options">${{ruOptions}}</div>
+                </div>
+            </div>
+            <div class="screen-only">
+                <div class="q-number">#${{qNum}}</div>
+                <div class="question">${{escapeHtml(data.q)}}</div>
+                <div class="options-container">
+                    ${{options}}
+                    <div class="result" id="result${{qNum}}"></div>
+                </div>
+                <div class="buttons">
+                    <button class="btn translate" data-action="translate">Перевод</button>
+                    <button class="btn explain" data-action="explain">Объяснение</button>
+                </div>
+                <div class="translation" id="trans${{qNum}}"></div>
+                <div class="explanation" id="expl${{qNum}}"></div>
+            </div>`;
+        }}
+
+        // Card buttons name what they do in data-action; one listener on the
+        // list handles them all, whichever cards are mounted
+        const CARD_ACTIONS = {{
+            select: (button, qNum, card) => selectOption(button, qNum, button.dataset.label, card.dataset.correct),
+            translate: (button, qNum) => toggleTranslate(qNum),
+            explain: (button, qNum) => toggleExplain(qNum),
+        }};
+
+        document.getElementById('questionList').addEventListener('click', event => {{
+            const button = event.target.closest('[data-action]');
+            const card = button && button.closest('.question-card');
+            if (!card) return;
+            CARD_ACTIONS[button.dataset.action](button, Number(card.dataset.q), card);
+        }});
+
+        // Questions whose translation / explanation panel is open, so recycled cards reopen them
+        const openPanels = {{ translation: new Set(), explanation: new Set() }};
+
+        // Bring a freshly rendered card up to date with the current mode
+        function restoreCardState(card, qNum) {{
+            progress.shownAt.set(qNum, Date.now());
+            if (quizMode.active) {{
+                const answer = quizMode.session.answers[qNum];
+                card.querySelectorAll('.option').forEach(opt => {{
+                    if (opt.dataset.label === answer) opt.classList.add('selected-quiz');
+                }});
+            }} else {{
+                applyStudyState(qNum);
+            }}
+            if (practiceMode.active) card.classList.add('practice-visible');
+            if (openPanels.translation.has(qNum)) showTranslation(qNum);
+            if (openPanels.explanation.has(qNum)) showExplanation(qNum);
+            highlightMatches(card.querySelector('.screen-only'));
+            updateScoreIndicator(qNum);
+        }}
+
+        // The card element of a question, or null while it is outside the rendered window
+        function getCard(qNum) {{
+            return document.getElementById('q' + qNum);
+        }}
+
+        // ==========================================
+        // VIRTUAL QUESTION LIST
+        // ==========================================
+
+        // The list is a sequence of logical entries (section headers and questions).
+        // Only the entries within `overscan` px of the viewport are in the DOM; the
+        // rest are stood in for by the list's padding, computed from each entry's
+        // measured height (or an estimate until it has been on screen). Elements
+        // that leave the window are pooled and reused for the next entries.
+        const ESTIMATED_HEIGHTS = {{ section: 150, question: 360 }};
+        const measuredHeights = new Map(); // 's1' / 'q1001' -> px, kept across list changes
+        const studyList = {{
+            entries: [],            // {{type: 'section', section}} | {{type: 'question', qNum, position, header}}
+            questions: [],          // question numbers in list order
+            positions: new Map(),   // qNum -> entry index
+            offsets: [0],           // offsets[i] = top of entry i, offsets[n] = total height
+            mounted: new Map(),     // entry index -> element
+            pool: {{ section: [], question: [] }},
+            gap: document.createElement('div'),
+            overscan: 800,
+            printing: false,
+            frame: null,
+            settle: null,
+        }};
+
+        function entryHeight(entry) {{
+            const key = entry.type === 'section' ? 's' + entry.section : 'q' + entry.qNum;
+            return measuredHeights.get(key) || ESTIMATED_HEIGHTS[entry.type];
+        }}
+
+        function computeOffsets() {{
+            const offsets = [0];
+            studyList.entries.forEach((entry, i) => offsets.push(offsets[i] + entryHeight(entry)));
+            studyList.offsets = offsets;
+        }}
+
+        // Index of the entry at list offset y
+        function findEntry(y) {{
+            const offsets = studyList.offsets;
+            let lo = 0;
+            let hi = studyList.entries.length - 1;
+            while (lo < hi) {{
+                const mid = (lo + hi + 1) >> 1;
+                if (offsets[mid] <= y) lo = mid;
+                else hi = mid - 1;
+            }}
+            return lo;
+        }}
+
+        // Show these questions in this order, grouped under section headers unless withSections is false
+        function setStudyList(qNums, withSections = true) {{
+            const entries = [];
+            const positions = new Map();
+            let header;
+            qNums.forEach((qNum, position) => {{
+                const section = questionSection[qNum];
+                if (withSections && (header === undefined || entries[header].section !== section)) {{
+                    header = entries.length;
+                    entries.push({{ type: 'section', section }});
+                }}
+                positions.set(qNum, entries.length);
+                entries.push({{ type: 'question', qNum, position, header }});
+            }});
+
+            Array.from(studyList.mounted.keys()).forEach(unmountEntry);
+            studyList.entries = entries;
+            studyList.questions = qNums.slice();
+            studyList.positions = positions;
+            computeOffsets();
+            renderStudyList();
+        }}
+
+        function mountEntry(entry) {{
+            const el = studyList.pool[entry.type].pop() || document.createElement('div');
+            el.removeAttribute('style');
+            if (entry.type === 'section') {{
+                const [esTitle, ruTitle] = sectionTitles[entry.section];
+                el.className = 'section-header';
+                el.innerHTML = `
+            <h2>${{escapeHtml(esTitle)}}</h2>
+            <p class="section-ru">${{escapeHtml(ruTitle)}}</p>`;
+            }} else {{
+                el.className = 'question-card';
+                el.id = 'q' + entry.qNum;
+                el.dataset.q = entry.qNum;
+                el.dataset.correct = questionData[entry.qNum].correct;
+                el.innerHTML = renderCard(entry.qNum);
+            }}
+            return el;
+        }}
+
+        function unmountEntry(index) {{
+            const el = studyList.mounted.get(index);
+            studyList.mounted.delete(index);
+            el.remove();
+            el.removeAttribute('id');
+            studyList.pool[el.classList.contains('section-header') ? 'section' : 'question'].push(el);
+        }}
+
+        function marginTop(el) {{
+            return parseFloat(getComputedStyle(el).marginTop) || 0;
+        }}
+
+        // Record the real heights of the mounted entries; returns how much the
+        // entries above the viewport grew, so the caller can keep the view still
+        function measureMounted(list, first, last, header) {{
+            const anchor = findEntry(-list.getBoundingClientRect().top);
+            const measure = (index, height) => {{
+                const entry = studyList.entries[index];
+                const delta = height - entryHeight(entry);
+                if (height <= 0 || Math.abs(delta) < 1) return 0;
+                measuredHeights.set(entry.type === 'section' ? 's' + entry.section : 'q' + entry.qNum, height);
+                return index < anchor ? delta : 0;
+            }};
+
+            // Distance between consecutive tops counts collapsed margins exactly once
+            let shift = 0;
+            if (header !== null) {{
+                shift += measure(header, studyList.gap.getBoundingClientRect().top -
+                    studyList.mounted.get(header).getBoundingClientRect().top);
+            }}
+            const tops = [];
+            for (let i = first; i <= last; i++) tops.push(studyList.mounted.get(i).getBoundingClientRect().top);
+            for (let i = first; i < last; i++) shift += measure(i, tops[i - first + 1] - tops[i - first]);
+            const lastEl = studyList.mounted.get(last);
+            shift += measure(last, lastEl.getBoundingClientRect().height +
+                (parseFloat(getComputedStyle(lastEl).marginBottom) || 0));
+
+            computeOffsets();
+            return shift;
+        }}
+
+        // Mount the entries near the viewport and recycle the rest
+        function renderStudyList() {{
+            studyList.frame = null;
+            const list = document.getElementById('questionList');
+            const entries = studyList.entries;
+            const mounted = studyList.mounted;
+
+            let first = 0;
+            let last = entries.length - 1;
+            if (!studyList.printing && entries.length > 0) {{
+                const top = -list.getBoundingClientRect().top;
+                first = findEntry(top - studyList.overscan);
+                last = findEntry(top + window.innerHeight + studyList.overscan);
+            }}
+
+            // The header of the topmost section stays mounted so it can stick to the top
+            let header = entries.length > 0 && entries[first].header !== undefined ? entries[first].header : null;
+            if (header === first - 1) first = header;
+            if (header !== null && header >= first) header = null;
+
+            Array.from(mounted.keys()).forEach(index => {{
+                if (index !== header && (index < first || index > last)) unmountEntry(index);
+            }});
+            if (header === null) studyList.gap.remove();
+
+            const fresh = [];
+            const mount = index => {{
+                if (!mounted.has(index)) {{
+                    mounted.set(index, mountEntry(entries[index]));
+                    fresh.push(index);
+                }}
+                return mounted.get(index);
+            }};
+            const children = header !== null ? [mount(header), studyList.gap] : [];
+            for (let i = first; i <= last; i++) children.push(mount(i));
+
+            // Insert new elements in place, keeping DOM order = list order
+            let prev = null;
+            children.forEach(el => {{
+                const next = prev ? prev.nextSibling : list.firstChild;
+                if (el !== next) list.insertBefore(el, next);
+                prev = el;
+            }});
+            fresh.forEach(index => {{
+                const entry = entries[index];
+                if (entry.type === 'question') restoreCardState(mounted.get(index), entry.qNum);
+            }});
+
+            if (studyList.printing || entries.length === 0) {{
+                list.style.paddingTop = '0px';
+                list.style.paddingBottom = '0px';
+                studyList.gap.style.height = '0px';
+                return;
+            }}
+
+            const shift = measureMounted(list, first, last, header);
+            const offsets = studyList.offsets;
+            const start = header !== null ? header : first;
+            list.style.paddingTop = Math.max(0, offsets[start] - marginTop(mounted.get(start))) + 'px';
+            if (header !== null) studyList.gap.style.height = (offsets[first] - offsets[header + 1]) + 'px';
+            list.style.paddingBottom = (offsets[entries.length] - offsets[last + 1]) + 'px';
+            if (shift) window.scrollBy(0, shift);
+        }}
+
+        function scheduleStudyListRender() {{
+            if (!studyList.frame) studyList.frame = requestAnimationFrame(renderStudyList);
+        }}
+
+        window.addEventListener('scroll', scheduleStudyListRender, {{ passive: true }});
+        window.addEventListener('resize', scheduleStudyListRender);
+
+        // Scroll a question of the list to the middle of the viewport
+        function scrollToQuestion(qNum, behavior = 'smooth') {{
+            const index = studyList.positions.get(qNum);
+            if (index === undefined) return;
+            const list = document.getElementById('questionList');
+            const height = studyList.offsets[index + 1] - studyList.offsets[index];
+            const top = list.getBoundingClientRect().top + window.scrollY + studyList.offsets[index];
+            window.scrollTo({{ top: top - (window.innerHeight - height) / 2, behavior }});
+
+            // Cards on the way may be taller or shorter than estimated; settle on the real one
+            clearTimeout(studyList.settle);
+            studyList.settle = setTimeout(() => {{
+                const card = getCard(qNum);
+                if (card) card.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
+            }}, behavior === 'smooth' ? 600 : 50);
+        }}
+
+        // Printing lays out every entry
+        function mountAllForPrint() {{
+            studyList.printing = true;
+            renderStudyList();
+        }}
+
+        window.addEventListener('beforeprint', mountAllForPrint);
+        window.addEventListener('afterprint', () => {{
+            studyList.printing = false;
+            renderStudyList();
+        }});
 
         // Quiz toggle button update
         function updateQuizToggleButton() {{
@@ -2770,7 +3222,7 @@ def generate_html(explanations):
                 // Quiz config modal
                 configureExam: 'Configurar Examen',
                 questionSelection: 'Selección de preguntas:',
-                fullExam: 'Examen completo (300 preguntas)',
+                fullExam: 'Examen completo (%d preguntas)',
                 bySection: 'Por sección:',
                 quickPractice: 'Práctica rápida:',
                 questions: 'preguntas',
@@ -2873,7 +3325,7 @@ def generate_html(explanations):
                 // Quiz config modal
                 configureExam: 'Configure Exam',
                 questionSelection: 'Question selection:',
-                fullExam: 'Full exam (300 questions)',
+                fullExam: 'Full exam (%d questions)',
                 bySection: 'By section:',
                 quickPractice: 'Quick practice:',
                 questions: 'questions',
@@ -2976,7 +3428,7 @@ def generate_html(explanations):
                 // Quiz config modal
                 configureExam: 'Настроить Экзамен',
                 questionSelection: 'Выбор вопросов:',
-                fullExam: 'Полный экзамен (300 вопросов)',
+                fullExam: 'Полный экзамен (%d вопросов)',
                 bySection: 'По разделу:',
                 quickPractice: 'Быстрая практика:',
                 questions: 'вопросов',
@@ -3069,145 +3521,467 @@ def generate_html(explanations):
         }}
 
         // ==========================================
-        // QUESTION SCORING SYSTEM
+        // PROGRESS STORAGE
         // ==========================================
 
-        // Get question scores from localStorage
-        function getQuestionScores() {{
+        // Learner progress lives in IndexedDB:
+        //   questions - one record per question: {{qNum, score, study}}
+        //   attempts  - append-only answer log: {{id, qNum, timestamp, selected, correct, mode, latency}}
+        //   meta      - small keyed values ('quizSession', 'migrated')
+        // It is read into memory once at startup (scoreStore, studySession,
+        // progress.meta). Changes are queued and written in a single transaction
+        // when the browser is idle or the page is hidden. The old localStorage
+        // keys are migrated on first run; without IndexedDB (some private modes)
+        // progress stays in localStorage as before, minus the attempt log.
+        const PROGRESS_DB = 'ccse-progress';
+        const LEGACY_KEYS = ['questionScores', 'studySession', 'quizSession'];
+
+        const progress = {{
+            db: null,
+            meta: new Map(),
+            dirtyQuestions: new Set(),
+            pendingAttempts: [],
+            pendingMeta: new Set(),
+            clearAttempts: false,
+            flushHandle: null,
+            shownAt: new Map(),  // qNum -> when its card was last rendered, for answer latency
+            quizLatency: new Map(),  // qNum -> latency of the current quiz answer, logged when graded
+        }};
+
+        function readLocalJSON(key) {{
             try {{
-                const stored = localStorage.getItem('questionScores');
-                return stored ? JSON.parse(stored) : {{}};
+                const stored = localStorage.getItem(key);
+                return stored ? JSON.parse(stored) : null;
             }} catch (e) {{
-                console.error('Error parsing questionScores:', e);
-                localStorage.removeItem('questionScores');
-                return {{}};
+                console.error('Error parsing ' + key + ':', e);
+                localStorage.removeItem(key);
+                return null;
             }}
         }}
 
-        // Save question scores to localStorage
-        function saveQuestionScores(scores) {{
-            localStorage.setItem('questionScores', JSON.stringify(scores));
+        function requestResult(request) {{
+            return new Promise((resolve, reject) => {{
+                request.onsuccess = () => resolve(request.result);
+                request.onerror = () => reject(request.error);
+            }});
         }}
 
-        // Update score for a specific question
-        function updateQuestionScore(qNum, isCorrect) {{
-            const scores = getQuestionScores();
-            const qKey = String(qNum);
+        function openProgressDB() {{
+            if (!('indexedDB' in window)) return Promise.reject(new Error('IndexedDB is not available'));
+            const request = indexedDB.open(PROGRESS_DB, 1);
+            request.onupgradeneeded = () => {{
+                const db = request.result;
+                db.createObjectStore('questions', {{ keyPath: 'qNum' }});
+                db.createObjectStore('attempts', {{ keyPath: 'id', autoIncrement: true }}).createIndex('qNum', 'qNum');
+                db.createObjectStore('meta');
+            }};
+            return requestResult(request);
+        }}
 
-            if (!scores[qKey]) {{
-                scores[qKey] = {{ score: 0, consecutiveWrong: 0 }};
+        // Fill the in-memory state from the database (or localStorage), migrating old data
+        async function loadProgress() {{
+            const scores = {{}};
+            const study = {{}};
+            try {{
+                progress.db = await openProgressDB();
+                const tx = progress.db.transaction(['questions', 'attempts', 'meta'], 'readonly');
+                const [records, attempts, quizSession, migrated] = await Promise.all([
+                    requestResult(tx.objectStore('questions').getAll()),
+                    requestResult(tx.objectStore('attempts').getAll()),
+                    requestResult(tx.objectStore('meta').get('quizSession')),
+                    requestResult(tx.objectStore('meta').get('migrated')),
+                ]);
+                attempts.forEach(attempt => srsReview(attempt.qNum, attempt.correct, attempt.timestamp));
+                records.forEach(record => {{
+                    if (record.score) scores[record.qNum] = record.score;
+                    if (record.study) study[record.qNum] = record.study;
+                }});
+                if (quizSession) progress.meta.set('quizSession', quizSession);
+
+                if (!migrated) {{
+                    const legacyScores = readLocalJSON('questionScores') || {{}};
+                    const legacyStudy = readLocalJSON('studySession') || {{}};
+                    Object.assign(scores, legacyScores);
+                    Object.assign(study, legacyStudy);
+                    Object.keys(legacyScores).concat(Object.keys(legacyStudy))
+                        .forEach(qNum => progress.dirtyQuestions.add(parseInt(qNum)));
+                    const legacyQuiz = readLocalJSON('quizSession');
+                    if (legacyQuiz) setProgressMeta('quizSession', legacyQuiz);
+                    setProgressMeta('migrated', true);
+                }}
+            }} catch (e) {{
+                console.warn('Keeping progress in localStorage:', e);
+                progress.db = null;
+                Object.assign(scores, readLocalJSON('questionScores'));
+                Object.assign(study, readLocalJSON('studySession'));
+                const quizSession = readLocalJSON('quizSession');
+                if (quizSession) progress.meta.set('quizSession', quizSession);
             }}
 
-            if (isCorrect) {{
-                scores[qKey].score += 1;
-                scores[qKey].consecutiveWrong = 0;
-            }} else {{
-                // Escalating penalty based on consecutive wrong answers
-                const consecutive = scores[qKey].consecutiveWrong + 1;
-                let penalty;
-                if (consecutive === 1) penalty = -2;
-                else if (consecutive === 2) penalty = -3;
-                else penalty = -4;
+            // Anything answered while loading wins over the stored state
+            scoreStore.scores = Object.assign(scores, scoreStore.scores);
+            studySession = Object.assign(study, studySession);
+            recountScores();
 
-                scores[qKey].score += penalty;
-                scores[qKey].consecutiveWrong = consecutive;
+            // Drop the old keys once their contents are safely in the database
+            if (progress.db && progress.pendingMeta.has('migrated') && await flushProgress()) {{
+                LEGACY_KEYS.forEach(key => localStorage.removeItem(key));
             }}
+        }}
 
-            saveQuestionScores(scores);
-            updateScoreIndicator(qNum);
-            updateStatsPanel();
-            updatePracticeBadge();
+        function scheduleProgressFlush() {{
+            if (progress.flushHandle !== null) return;
+            progress.flushHandle = 'requestIdleCallback' in window
+                ? requestIdleCallback(flushProgress, {{ timeout: 2000 }})
+                : setTimeout(flushProgress, 1000);
         }}
 
-        // Get score indicator class based on score
-        function getScoreIndicatorClass(score) {{
-            if (score === null || score === undefined) return 'not-attempted';
-            if (score < -4) return 'struggling';
-            if (score >= -4 && score <= -1) return 'needs-work';
-            if (score >= 0 && score <= 1) return 'learning';
-            return 'mastered';
+        function markQuestionDirty(qNum) {{
+            progress.dirtyQuestions.add(qNum);
+            scheduleProgressFlush();
         }}
 
-        // Get score indicator tooltip text
-        function getScoreTooltip(score) {{
-            if (score === null || score === undefined) return t('scoreNotAttempted');
-            if (score < -4) return t('scoreStruggling') + ': ' + score;
-            if (score >= -4 && score <= -1) return t('scoreNeedsWork') + ': ' + score;
-            if (score >= 0 && score <= 1) return t('scoreLearning') + ': ' + score;
-            return t('scoreMastered') + ': ' + score;
+        // Set (or, with undefined, delete) a meta value
+        function setProgressMeta(key, value) {{
+            if (value === undefined) progress.meta.delete(key);
+            else progress.meta.set(key, value);
+            progress.pendingMeta.add(key);
+            scheduleProgressFlush();
         }}
 
-        // Update score indicator for a specific question
-        function updateScoreIndicator(qNum) {{
-            const scores = getQuestionScores();
-            const scoreData = scores[String(qNum)];
-            const score = scoreData ? scoreData.score : null;
+        // Milliseconds since the card of a question was rendered
+        function answerLatency(qNum) {{
+            const shownAt = progress.shownAt.get(qNum);
+            return shownAt ? Date.now() - shownAt : null;
+        }}
 
-            const indicator = document.getElementById('indicator' + qNum);
-            if (indicator) {{
-                // Remove all score classes
-                indicator.classList.remove('struggling', 'needs-work', 'learning', 'mastered', 'not-attempted');
-                // Add the appropriate class
-                indicator.classList.add(getScoreIndicatorClass(score));
-                // Update tooltip
-                const tooltip = indicator.querySelector('.score-tooltip');
-                if (tooltip) {{
-                    tooltip.textContent = getScoreTooltip(score);
+        // Append a graded answer to the attempt log and the spaced repetition model
+        function logAttempt(qNum, selected, correct, mode, latency = answerLatency(qNum)) {{
+            const timestamp = Date.now();
+            progress.pendingAttempts.push({{ qNum, timestamp, selected, correct, mode, latency }});
+            srsReview(qNum, correct, timestamp);
+            scheduleProgressFlush();
+        }}
+
+        // Write all queued changes; resolves to whether they were saved
+        function flushProgress() {{
+            if (progress.flushHandle !== null) {{
+                if ('cancelIdleCallback' in window) cancelIdleCallback(progress.flushHandle);
+                else clearTimeout(progress.flushHandle);
+                progress.flushHandle = null;
+            }}
+            const dirty = Array.from(progress.dirtyQuestions);
+            const attempts = progress.pendingAttempts;
+            const metaKeys = Array.from(progress.pendingMeta);
+            const clearAttempts = progress.clearAttempts;
+            if (!dirty.length && !attempts.length && !metaKeys.length && !clearAttempts) return Promise.resolve(true);
+            progress.dirtyQuestions = new Set();
+            progress.pendingAttempts = [];
+            progress.pendingMeta = new Set();
+            progress.clearAttempts = false;
+
+            if (!progress.db) {{
+                try {{
+                    localStorage.setItem('questionScores', JSON.stringify(scoreStore.scores));
+                    localStorage.setItem('studySession', JSON.stringify(studySession));
+                    const quizSession = progress.meta.get('quizSession');
+                    if (quizSession) localStorage.setItem('quizSession', JSON.stringify(quizSession));
+                    else localStorage.removeItem('quizSession');
+                }} catch (e) {{
+                    console.error('Error saving progress:', e);
+                    return Promise.resolve(false);
                 }}
-                indicator.title = getScoreTooltip(score);
+                return Promise.resolve(true);
             }}
-        }}
 
-        // Render all score indicators on page load
-        function renderAllIndicators() {{
-            allQuestionNumbers.forEach(qNum => {{
-                updateScoreIndicator(qNum);
+            return new Promise(resolve => {{
+                const tx = progress.db.transaction(['questions', 'attempts', 'meta'], 'readwrite');
+                const questionStore = tx.objectStore('questions');
+                dirty.forEach(qNum => {{
+                    const score = scoreStore.scores[qNum] || null;
+                    const study = studySession[qNum] || null;
+                    if (score || study) questionStore.put({{ qNum, score, study }});
+                    else questionStore.delete(qNum);
+                }});
+                const attemptStore = tx.objectStore('attempts');
+                if (clearAttempts) attemptStore.clear();
+                attempts.forEach(attempt => attemptStore.add(attempt));
+                const metaStore = tx.objectStore('meta');
+                metaKeys.forEach(key => {{
+                    if (progress.meta.has(key)) metaStore.put(progress.meta.get(key), key);
+                    else metaStore.delete(key);
+                }});
+                tx.oncomplete = () => resolve(true);
+                tx.onerror = () => {{
+                    console.error('Error saving progress:', tx.error);
+                    resolve(false);
+                }};
             }});
         }}
 
-        // Update stats panel with current counts
-        function updateStatsPanel() {{
-            const scores = getQuestionScores();
-            let needsPractice = 0;
-            let mastered = 0;
-            let notAttempted = 0;
+        // The page may never become idle again once it is hidden or closed
+        document.addEventListener('visibilitychange', () => {{
+            if (document.visibilityState === 'hidden') flushProgress();
+        }});
+        window.addEventListener('pagehide', flushProgress);
 
-            allQuestionNumbers.forEach(qNum => {{
-                const scoreData = scores[String(qNum)];
-                if (!scoreData) {{
-                    notAttempted++;
-                }} else if (scoreData.score >= 2) {{
-                    mastered++;
-                }} else {{
-                    needsPractice++;
-                }}
-            }});
+        // ==========================================
+        // RANDOM SAMPLING
+        // ==========================================
 
-            const needsPracticeEl = document.getElementById('statsNeedsPractice');
-            const masteredEl = document.getElementById('statsMastered');
-            const notAttemptedEl = document.getElementById('statsNotAttempted');
+        // Random source for picking questions: Math.random, or a seeded
+        // generator (?seed=N in the URL, or seedRandom(N) from the console)
+        // so that a practice or quiz run can be reproduced
+        let rng = Math.random;
+
+        // mulberry32: small 32-bit PRNG returning floats in [0, 1)
+        function mulberry32(seed) {{
+            let state = seed >>> 0;
+            return function() {{
+                state = (state + 0x6D2B79F5) >>> 0;
+                let t = state;
+                t = Math.imul(t ^ (t >>> 15), t | 1);
+                t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+                return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+            }};
+        }}
 
-            if (needsPracticeEl) needsPracticeEl.textContent = needsPractice;
-            if (masteredEl) masteredEl.textContent = mastered;
-            if (notAttemptedEl) notAttemptedEl.textContent = notAttempted;
+        function seedRandom(seed) {{
+            rng = seed === null || seed === undefined ? Math.random : mulberry32(seed);
         }}
 
-        // Update practice button badge
-        function updatePracticeBadge() {{
-            const scores = getQuestionScores();
-            let count = 0;
+        const seedParam = new URLSearchParams(window.location.search).get('seed');
+        if (seedParam !== null && !isNaN(Number(seedParam))) seedRandom(Number(seedParam));
 
-            allQuestionNumbers.forEach(qNum => {{
-                const scoreData = scores[String(qNum)];
-                if (scoreData && scoreData.score < 2) {{
-                    count++;
-                }}
-            }});
+        // Weighted sampler over keys (Vose's alias method): every draw is O(1).
+        // Changing a weight is O(1) too; the alias table is rebuilt by the
+        // first draw after a change.
+        function makeSampler() {{
+            return {{ weights: new Map(), keys: [], prob: null, alias: null, total: 0, stale: true }};
+        }}
 
-            const badge = document.getElementById('practiceBadge');
-            if (badge) {{
-                badge.textContent = count;
-                badge.classList.toggle('empty', count === 0);
+        // Set the weight of a key; 0 removes it
+        function samplerSet(sampler, key, weight) {{
+            if ((sampler.weights.get(key) || 0) === weight) return;
+            if (weight > 0) sampler.weights.set(key, weight);
+            else sampler.weights.delete(key);
+            sampler.stale = true;
+        }}
+
+        function samplerClear(sampler) {{
+            sampler.weights.clear();
+            sampler.stale = true;
+        }}
+
+        function buildAliasTable(sampler) {{
+            const keys = Array.from(sampler.weights.keys());
+            const n = keys.length;
+            const prob = new Float64Array(n);
+            const alias = new Uint32Array(n);
+            let total = 0;
+            sampler.weights.forEach(weight => {{ total += weight; }});
+
+            // Split the slots into those under and over the average weight, then
+            // top up each light slot with the excess of a heavy one
+            const small = [];
+            const large = [];
+            keys.forEach((key, i) => {{
+                prob[i] = sampler.weights.get(key) * n / total;
+                (prob[i] < 1 ? small : large).push(i);
+            }});
+            while (small.length > 0 && large.length > 0) {{
+                const light = small.pop();
+                const heavy = large[large.length - 1];
+                alias[light] = heavy;
+                prob[heavy] -= 1 - prob[light];
+                if (prob[heavy] < 1) {{
+                    large.pop();
+                    small.push(heavy);
+                }}
+            }}
+            // Whatever is left is full, up to rounding error
+            large.forEach(i => {{ prob[i] = 1; }});
+            small.forEach(i => {{ prob[i] = 1; }});
+
+            Object.assign(sampler, {{ keys, prob, alias, total, stale: false }});
+        }}
+
+        // Draw a key with probability proportional to its weight, avoiding the
+        // keys in exclude (a Set) unless nothing else is left; null if empty
+        function samplerDraw(sampler, exclude) {{
+            if (sampler.weights.size === 0) return null;
+            if (sampler.stale) buildAliasTable(sampler);
+
+            let excludedWeight = 0;
+            exclude.forEach(key => {{ excludedWeight += sampler.weights.get(key) || 0; }});
+            const avoid = excludedWeight < sampler.total ? exclude : new Set();
+
+            while (true) {{
+                const u = rng() * sampler.keys.length;
+                const slot = Math.floor(u);
+                const key = u - slot < sampler.prob[slot] ? sampler.keys[slot] : sampler.keys[sampler.alias[slot]];
+                if (!avoid.has(key)) return key;
+            }}
+        }}
+
+        // Uniformly random sample of count items, in random order: a partial
+        // Fisher-Yates shuffle that only touches the first count slots
+        function sampleWithoutReplacement(items, count) {{
+            const pool = items.slice();
+            const size = Math.min(count, pool.length);
+            for (let i = 0; i < size; i++) {{
+                const j = i + Math.floor(rng() * (pool.length - i));
+                [pool[i], pool[j]] = [pool[j], pool[i]];
+            }}
+            pool.length = size;
+            return pool;
+        }}
+
+        // ==========================================
+        // QUESTION SCORING SYSTEM
+        // ==========================================
+
+        // Scores live in memory (filled by loadProgress) with running
+        // per-category counts, so answering never re-reads stored state
+        const scoreStore = {{
+            scores: {{}},  // qNum -> {{score, consecutiveWrong}}
+            counts: {{ mastered: 0, needsPractice: 0, notAttempted: 0 }},
+        }};
+
+        // Questions that need practice (score < 2), weighted so that lower
+        // scores are picked more often
+        const practicePool = makeSampler();
+
+        function practiceWeight(scoreData) {{
+            if (!scoreData || scoreData.score >= 2) return 0;
+            return Math.max(1, Math.abs(scoreData.score));
+        }}
+
+        // Stats category of a question's score data
+        function scoreCategory(scoreData) {{
+            if (!scoreData) return 'notAttempted';
+            return scoreData.score >= 2 ? 'mastered' : 'needsPractice';
+        }}
+
+        function recountScores() {{
+            const counts = {{ mastered: 0, needsPractice: 0, notAttempted: 0 }};
+            samplerClear(practicePool);
+            allQuestionNumbers.forEach(qNum => {{
+                const scoreData = scoreStore.scores[String(qNum)];
+                counts[scoreCategory(scoreData)]++;
+                samplerSet(practicePool, qNum, practiceWeight(scoreData));
+            }});
+            scoreStore.counts = counts;
+        }}
+
+        recountScores();
+
+        // Current question scores (the live object; change them through setQuestionScore)
+        function getQuestionScores() {{
+            return scoreStore.scores;
+        }}
+
+        function setQuestionScore(qNum, scoreData) {{
+            const qKey = String(qNum);
+            scoreStore.counts[scoreCategory(scoreStore.scores[qKey])]--;
+            scoreStore.counts[scoreCategory(scoreData)]++;
+            scoreStore.scores[qKey] = scoreData;
+            samplerSet(practicePool, Number(qNum), practiceWeight(scoreData));
+            markQuestionDirty(qNum);
+        }}
+
+        // Update score for a specific question
+        function updateQuestionScore(qNum, isCorrect) {{
+            const previous = scoreStore.scores[String(qNum)] || {{ score: 0, consecutiveWrong: 0 }};
+            const scoreData = {{ score: previous.score, consecutiveWrong: previous.consecutiveWrong }};
+
+            if (isCorrect) {{
+                scoreData.score += 1;
+                scoreData.consecutiveWrong = 0;
+            }} else {{
+                // Escalating penalty based on consecutive wrong answers
+                const consecutive = scoreData.consecutiveWrong + 1;
+                let penalty;
+                if (consecutive === 1) penalty = -2;
+                else if (consecutive === 2) penalty = -3;
+                else penalty = -4;
+
+                scoreData.score += penalty;
+                scoreData.consecutiveWrong = consecutive;
+            }}
+
+            setQuestionScore(qNum, scoreData);
+            updateScoreIndicator(qNum);
+            updateStatsPanel();
+            updatePracticeBadge();
+        }}
+
+        // Get score indicator class based on score
+        function getScoreIndicatorClass(score) {{
+            if (score === null || score === undefined) return 'not-attempted';
+            if (score < -4) return 'struggling';
+            if (score >= -4 && score <= -1) return 'needs-work';
+            if (score >= 0 && score <= 1) return 'learning';
+            return 'mastered';
+        }}
+
+        // Get score indicator tooltip text
+        function getScoreTooltip(score) {{
+            if (score === null || score === undefined) return t('scoreNotAttempted');
+            if (score < -4) return t('scoreStruggling') + ': ' + score;
+            if (score >= -4 && score <= -1) return t('scoreNeedsWork') + ': ' + score;
+            if (score >= 0 && score <= 1) return t('scoreLearning') + ': ' + score;
+            return t('scoreMastered') + ': ' + score;
+        }}
+
+        // Update score indicator for a specific question
+        function updateScoreIndicator(qNum) {{
+            const scoreData = scoreStore.scores[String(qNum)];
+            const score = scoreData ? scoreData.score : null;
+
+            const indicator = document.getElementById('indicator' + qNum);
+            if (indicator) {{
+                // Remove all score classes
+                indicator.classList.remove('struggling', 'needs-work', 'learning', 'mastered', 'not-attempted');
+                // Add the appropriate class
+                indicator.classList.add(getScoreIndicatorClass(score));
+                // Update tooltip
+                const tooltip = indicator.querySelector('.score-tooltip');
+                if (tooltip) {{
+                    tooltip.textContent = getScoreTooltip(score);
+                }}
+                indicator.title = getScoreTooltip(score);
+            }}
+        }}
+
+        // Render all score indicators on page load
+        function renderAllIndicators() {{
+            studyList.questions.forEach(qNum => {{
+                if (getCard(qNum)) updateScoreIndicator(qNum);
+            }});
+        }}
+
+        // Update stats panel with current counts
+        function updateStatsPanel() {{
+            const {{ needsPractice, mastered, notAttempted }} = scoreStore.counts;
+
+            const needsPracticeEl = document.getElementById('statsNeedsPractice');
+            const masteredEl = document.getElementById('statsMastered');
+            const notAttemptedEl = document.getElementById('statsNotAttempted');
+
+            if (needsPracticeEl) needsPracticeEl.textContent = needsPractice;
+            if (masteredEl) masteredEl.textContent = mastered;
+            if (notAttemptedEl) notAttemptedEl.textContent = notAttempted;
+        }}
+
+        // Update practice button badge
+        function updatePracticeBadge() {{
+            const count = scoreStore.counts.needsPractice;
+
+            const badge = document.getElementById('practiceBadge');
+            if (badge) {{
+                badge.textContent = count;
+                badge.classList.toggle('empty', count === 0);
             }}
         }}
 
@@ -3222,8 +3996,12 @@ def generate_html(explanations):
         // Reset all scores with confirmation
         function resetAllScores() {{
             if (confirm(t('confirmReset'))) {{
-                // Clear scores
-                localStorage.removeItem('questionScores');
+                // Clear scores and the answer history
+                Object.keys(scoreStore.scores).forEach(qNum => markQuestionDirty(parseInt(qNum)));
+                scoreStore.scores = {{}};
+                recountScores();
+                progress.clearAttempts = true;
+                resetSpacedRepetition();
 
                 // Clear study session and reset visual state
                 clearStudySession();
@@ -3254,73 +4032,146 @@ def generate_html(explanations):
         }}
 
         // ==========================================
-        // FOCUSED PRACTICE MODE
+        // SPACED REPETITION
         // ==========================================
 
-        let practiceMode = {{
-            active: false,
-            questions: [],
-            currentIndex: 0,
-            recentQuestions: [] // Buffer to avoid showing same question repeatedly
+        // FSRS-style memory model of each answered question: stability is the
+        // number of days until the chance of recalling it drops to 90%, and
+        // difficulty runs from 1 to 10. Every graded answer (replayed from the
+        // attempt log at startup, then live) updates both and sets the question
+        // due when recall falls to 90%. Due times sit in a binary min-heap, so
+        // the most overdue question is found in O(log n); entries superseded by
+        // a later answer are skipped when they reach the top.
+        const DAY_MS = 24 * 60 * 60 * 1000;
+        const TARGET_RETENTION = 0.9;
+        const MIN_STABILITY = 0.1;   // days
+        const MAX_STABILITY = 365;   // days
+
+        const srs = {{
+            cards: new Map(),  // qNum -> {{stability, difficulty, reps, lapses, lastReview, due, version}}
+            heap: [],          // {{due, qNum, version}}
         }};
 
-        const RECENT_BUFFER_SIZE = 5; // Number of recent questions to exclude from selection
-
-        // Get questions that need practice (score < 2)
-        function getQuestionsNeedingPractice() {{
-            const scores = getQuestionScores();
-            const questions = [];
-
-            allQuestionNumbers.forEach(qNum => {{
-                const scoreData = scores[String(qNum)];
-                if (scoreData && scoreData.score < 2) {{
-                    questions.push({{
-                        qNum: qNum,
-                        score: scoreData.score,
-                        weight: Math.max(1, Math.abs(scoreData.score)) // Weight for random selection (min 1)
-                    }});
+        function heapPush(item) {{
+            const heap = srs.heap;
+            heap.push(item);
+            let i = heap.length - 1;
+            while (i > 0) {{
+                const parent = (i - 1) >> 1;
+                if (heap[parent].due <= heap[i].due) break;
+                [heap[parent], heap[i]] = [heap[i], heap[parent]];
+                i = parent;
+            }}
+        }}
+
+        function heapPop() {{
+            const heap = srs.heap;
+            const top = heap[0];
+            const last = heap.pop();
+            if (heap.length > 0) {{
+                heap[0] = last;
+                let i = 0;
+                while (true) {{
+                    const left = 2 * i + 1;
+                    const right = left + 1;
+                    let smallest = i;
+                    if (left < heap.length && heap[left].due < heap[smallest].due) smallest = left;
+                    if (right < heap.length && heap[right].due < heap[smallest].due) smallest = right;
+                    if (smallest === i) break;
+                    [heap[smallest], heap[i]] = [heap[i], heap[smallest]];
+                    i = smallest;
                 }}
-            }});
+            }}
+            return top;
+        }}
 
-            return questions;
+        // Probability of recalling a question at time now
+        function retrievability(card, now) {{
+            return Math.pow(TARGET_RETENTION, (now - card.lastReview) / DAY_MS / card.stability);
         }}
 
-        // Select a weighted random question (lower scores = higher chance)
-        function selectWeightedQuestion(questions) {{
-            if (questions.length === 0) return null;
+        // Update the memory model of a question with a graded answer
+        function srsReview(qNum, correct, timestamp) {{
+            let card = srs.cards.get(qNum);
+            if (!card) {{
+                card = {{
+                    stability: correct ? 2 : MIN_STABILITY,
+                    difficulty: correct ? 4 : 6,
+                    reps: 0, lapses: 0, lastReview: timestamp, due: timestamp, version: 0,
+                }};
+                srs.cards.set(qNum, card);
+            }} else if (correct) {{
+                // Recalling it when it was nearly forgotten strengthens it most;
+                // answering it again right away barely does
+                const r = retrievability(card, timestamp);
+                const growth = Math.exp(1.5) * (11 - card.difficulty) * Math.pow(card.stability, -0.1) * (Math.exp(1 - r) - 1);
+                card.stability = Math.min(MAX_STABILITY, card.stability * (1 + growth));
+                card.difficulty = Math.max(1, card.difficulty - 0.3);
+            }} else {{
+                card.stability = Math.max(MIN_STABILITY, card.stability * 0.2);
+                card.difficulty = Math.min(10, card.difficulty + 1);
+            }}
+            if (!correct) card.lapses++;
+            card.reps++;
+            card.lastReview = timestamp;
+            card.due = timestamp + card.stability * DAY_MS;
+            card.version++;
+
+            // Drop superseded entries once they outnumber the live ones
+            if (srs.heap.length > 4 * srs.cards.size) {{
+                srs.heap = [];
+                srs.cards.forEach((c, q) => {{ if (q !== qNum) heapPush({{ due: c.due, qNum: q, version: c.version }}); }});
+            }}
+            heapPush({{ due: card.due, qNum, version: card.version }});
+        }}
+
+        // The most overdue question not in exclude (a Set), or null if none is due
+        function nextDueQuestion(now, exclude) {{
+            const skipped = [];
+            let found = null;
+            while (srs.heap.length > 0) {{
+                const top = srs.heap[0];
+                if (top.version !== srs.cards.get(top.qNum).version) {{
+                    heapPop();
+                }} else if (top.due > now) {{
+                    break;
+                }} else if (exclude.has(top.qNum)) {{
+                    skipped.push(heapPop());
+                }} else {{
+                    found = top.qNum;
+                    break;
+                }}
+            }}
+            skipped.forEach(heapPush);
+            return found;
+        }}
 
-            // Filter out recently shown questions to avoid repetition
-            let candidates = questions.filter(q => !practiceMode.recentQuestions.includes(q.qNum));
+        function resetSpacedRepetition() {{
+            srs.cards.clear();
+            srs.heap = [];
+        }}
 
-            // If all questions are in recent buffer, use full list
-            if (candidates.length === 0) {{
-                candidates = questions;
-            }}
+        // ==========================================
+        // FOCUSED PRACTICE MODE
+        // ==========================================
 
-            // Calculate total weight
-            const totalWeight = candidates.reduce((sum, q) => sum + q.weight, 0);
+        let practiceMode = {{
+            active: false,
+            questions: [],
+            currentIndex: 0,
+            recentQuestions: new Set() // Recently shown questions, oldest first, to avoid repeats
+        }};
 
-            // Select random based on weight
-            let random = Math.random() * totalWeight;
-            for (const q of candidates) {{
-                random -= q.weight;
-                if (random <= 0) {{
-                    // Add to recent buffer
-                    practiceMode.recentQuestions.push(q.qNum);
-                    if (practiceMode.recentQuestions.length > RECENT_BUFFER_SIZE) {{
-                        practiceMode.recentQuestions.shift();
-                    }}
-                    return q.qNum;
-                }}
-            }}
+        const RECENT_BUFFER_SIZE = 5; // Number of recent questions to exclude from selection
 
-            // Fallback to first candidate
-            const fallback = candidates[0].qNum;
-            practiceMode.recentQuestions.push(fallback);
-            if (practiceMode.recentQuestions.length > RECENT_BUFFER_SIZE) {{
-                practiceMode.recentQuestions.shift();
+        // Add a question to the recent buffer
+        function rememberPracticeQuestion(qNum) {{
+            const recent = practiceMode.recentQuestions;
+            recent.delete(qNum);
+            recent.add(qNum);
+            if (recent.size > RECENT_BUFFER_SIZE) {{
+                recent.delete(recent.values().next().value);
             }}
-            return fallback;
         }}
 
         // Start focused practice mode
@@ -3331,9 +4182,7 @@ def generate_html(explanations):
                 return;
             }}
 
-            const questions = getQuestionsNeedingPractice();
-
-            if (questions.length === 0) {{
+            if (practicePool.weights.size === 0 && nextDueQuestion(Date.now(), new Set()) === null) {{
                 // Check if there are any attempted questions
                 const scores = getQuestionScores();
                 const hasAttempted = Object.keys(scores).length > 0;
@@ -3346,28 +4195,14 @@ def generate_html(explanations):
             }}
 
             practiceMode.active = true;
-            practiceMode.questions = questions;
+            practiceMode.questions = Array.from(practicePool.weights.keys());
             practiceMode.currentIndex = 0;
-            practiceMode.recentQuestions = []; // Clear recent buffer
+            practiceMode.recentQuestions = new Set(); // Clear recent buffer
 
             document.body.classList.add('practice-mode');
 
             // Hide all cards first
-            const allCards = document.querySelectorAll('.question-card');
-            allCards.forEach(card => {{
-                card.style.display = 'none';
-                card.classList.remove('practice-visible');
-                // Reset answer state for practice
-                const options = card.querySelectorAll('.option');
-                options.forEach(opt => {{
-                    opt.classList.remove('correct', 'incorrect', 'disabled');
-                }});
-                const result = card.querySelector('.result');
-                if (result) {{
-                    result.innerHTML = '';
-                    result.classList.remove('correct', 'incorrect');
-                }}
-            }});
+            setStudyList([], false);
 
             // Show first question (answeredQuestions is reset per-question in showNextPracticeQuestion)
             showNextPracticeQuestion();
@@ -3376,46 +4211,33 @@ def generate_html(explanations):
 
         // Show the next practice question
         function showNextPracticeQuestion() {{
-            // Hide current visible card
-            const currentVisible = document.querySelector('.question-card.practice-visible');
-            if (currentVisible) {{
-                currentVisible.classList.remove('practice-visible');
-                currentVisible.style.display = 'none';
+            // Questions whose recall has decayed come first, most overdue first;
+            // then low-scoring questions, picked by weighted random
+            let nextQNum = nextDueQuestion(Date.now(), practiceMode.recentQuestions);
+            if (nextQNum === null) {{
+                nextQNum = samplerDraw(practicePool, practiceMode.recentQuestions);
             }}
-
-            // Get remaining questions that still need practice
-            const remainingQuestions = getQuestionsNeedingPractice();
-
-            if (remainingQuestions.length === 0) {{
+            if (nextQNum === null) {{
+                // Nothing due and nothing weak: the recent questions can wait
+                nextQNum = nextDueQuestion(Date.now(), new Set());
+            }}
+            if (nextQNum === null) {{
                 // All questions mastered!
                 exitFocusedPractice();
                 showPracticeMessage(t('practiceCongrats'), t('practiceCongratsText'));
                 return;
             }}
+            rememberPracticeQuestion(nextQNum);
 
-            // Select next question with weighted random
-            const nextQNum = selectWeightedQuestion(remainingQuestions);
+            // Allow this question to be re-answered in practice mode
+            delete studySession[nextQNum];
+            markQuestionDirty(nextQNum);
 
-            // Show the selected card
-            const card = document.getElementById('q' + nextQNum);
+            // Show only the selected card, rendered without its previous answer
+            setStudyList([nextQNum], false);
+            const card = getCard(nextQNum);
             if (card) {{
-                card.style.display = 'block';
-                card.classList.add('practice-visible');
                 card.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-
-                // Allow this question to be re-answered in practice mode
-                delete studySession[nextQNum];
-
-                // Reset answer state
-                const options = card.querySelectorAll('.option');
-                options.forEach(opt => {{
-                    opt.classList.remove('correct', 'incorrect', 'disabled');
-                }});
-                const result = card.querySelector('.result');
-                if (result) {{
-                    result.innerHTML = '';
-                    result.classList.remove('correct', 'incorrect');
-                }}
             }}
 
             updatePracticeHeader();
@@ -3426,9 +4248,21 @@ def generate_html(explanations):
             showNextPracticeQuestion();
         }}
 
+        // Questions left to practice: the low-scoring ones plus those due for
+        // review, each counted once
+        function practiceRemaining(now) {{
+            const remaining = new Set(practicePool.weights.keys());
+            srs.heap.forEach(entry => {{
+                if (entry.due <= now && entry.version === srs.cards.get(entry.qNum).version) {{
+                    remaining.add(Number(entry.qNum));
+                }}
+            }});
+            return remaining.size;
+        }}
+
         // Update practice header with remaining count
         function updatePracticeHeader() {{
-            const remaining = getQuestionsNeedingPractice().length;
+            const remaining = practiceRemaining(Date.now());
             const progressText = document.getElementById('practiceProgressText');
             if (progressText) {{
                 progressText.textContent = t('practiceRemaining') + ': ' + remaining + ' ' + t('practiceQuestions');
@@ -3440,20 +4274,12 @@ def generate_html(explanations):
             practiceMode.active = false;
             practiceMode.questions = [];
             practiceMode.currentIndex = 0;
-            practiceMode.recentQuestions = [];
+            practiceMode.recentQuestions = new Set();
 
             document.body.classList.remove('practice-mode');
 
-            // Show all cards again
-            const allCards = document.querySelectorAll('.question-card');
-            allCards.forEach(card => {{
-                card.style.display = 'block';
-                card.classList.remove('practice-visible');
-            }});
-
-            // Show section headers again
-            const headers = document.querySelectorAll('.section-header');
-            headers.forEach(h => h.style.display = 'block');
+            // Show all cards and section headers again
+            showSearchResults();
         }}
 
         // Show a practice message (congrats or no questions)
@@ -3568,7 +4394,7 @@ def generate_html(explanations):
             if (questionSelectionLabel) questionSelectionLabel.textContent = t('questionSelection');
 
             const fullExamLabel = document.getElementById('fullExamLabel');
-            if (fullExamLabel) fullExamLabel.textContent = t('fullExam');
+            if (fullExamLabel) fullExamLabel.textContent = t('fullExam').replace('%d', totalQuestions);
 
             const bySectionLabel = document.getElementById('bySectionLabel');
             if (bySectionLabel) bySectionLabel.textContent = t('bySection');
@@ -3757,75 +4583,55 @@ def generate_html(explanations):
             }}
         }}
 
-        // Study session persistence
+        // Study mode answers (qNum -> {{selected, correctLabel, correct, timestamp}}), filled by loadProgress
         let studySession = {{}};
 
-        function loadStudySession() {{
-            try {{
-                const stored = localStorage.getItem('studySession');
-                if (stored) {{
-                    studySession = JSON.parse(stored);
-                }} else {{
-                    studySession = {{}};
+        // Show the saved study answer of a question on its card, if the card is rendered
+        function applyStudyState(qNum) {{
+            const data = studySession[qNum];
+            const card = document.getElementById('q' + qNum);
+            if (!data || !card) return;
+
+            const options = card.querySelectorAll('.option');
+            const resultDiv = document.getElementById('result' + qNum);
+
+            // Disable all options
+            options.forEach(opt => opt.classList.add('disabled'));
+
+            // Restore visual state
+            options.forEach(opt => {{
+                if (opt.dataset.label === data.selected) {{
+                    if (data.correct) {{
+                        opt.classList.add('correct');
+                    }} else {{
+                        opt.classList.add('incorrect');
+                    }}
+                }} else if (!data.correct && opt.dataset.label === data.correctLabel) {{
+                    opt.classList.add('correct');
                 }}
-            }} catch (e) {{
-                console.error('Error loading study session:', e);
-                studySession = {{}};
-            }}
-            return studySession;
-        }}
+            }});
 
-        function saveStudySession() {{
-            try {{
-                localStorage.setItem('studySession', JSON.stringify(studySession));
-            }} catch (e) {{
-                console.error('Error saving study session:', e);
+            // Restore result message only if resultDiv exists
+            if (resultDiv) {{
+                if (data.correct) {{
+                    resultDiv.innerHTML = '✓ Correcto';
+                    resultDiv.classList.add('correct');
+                }} else {{
+                    resultDiv.innerHTML = '✗ Incorrecto';
+                }}
             }}
         }}
 
         function restoreStudyState() {{
-            loadStudySession();
             let correctCount = 0;
 
             console.log('Restoring', Object.keys(studySession).length, 'answered questions');
 
             for (const [qNumStr, data] of Object.entries(studySession)) {{
                 const qNum = parseInt(qNumStr);
-                const card = document.getElementById('q' + qNum);
-                if (!card) continue;
-
-                const options = card.querySelectorAll('.option');
-                const resultDiv = document.getElementById('result' + qNum);
-
-                // Disable all options
-                options.forEach(opt => opt.classList.add('disabled'));
-
-                // Restore visual state
-                options.forEach(opt => {{
-                    if (opt.dataset.label === data.selected) {{
-                        if (data.correct) {{
-                            opt.classList.add('correct');
-                        }} else {{
-                            opt.classList.add('incorrect');
-                        }}
-                    }} else if (!data.correct && opt.dataset.label === data.correctLabel) {{
-                        opt.classList.add('correct');
-                    }}
-                }});
-
-                // Restore result message only if resultDiv exists
-                if (resultDiv) {{
-                    if (data.correct) {{
-                        resultDiv.innerHTML = '✓ Correcto';
-                        resultDiv.classList.add('correct');
-                        correctCount++;
-                    }} else {{
-                        resultDiv.innerHTML = '✗ Incorrecto';
-                    }}
-                }} else if (data.correct) {{
-                    // Still count correct answers even if resultDiv is missing
-                    correctCount++;
-                }}
+                // Cards mounted later pick up their state in restoreCardState
+                applyStudyState(qNum);
+                if (data.correct) correctCount++;
             }}
 
             // Update revealed count
@@ -3837,24 +4643,18 @@ def generate_html(explanations):
         }}
 
         function scrollToFirstUnanswered() {{
-            // Find the first unanswered question in order
-            for (const qNum of allQuestionNumbers) {{
-                if (!studySession[qNum]) {{
-                    const card = document.getElementById('q' + qNum);
-                    if (card && card.style.display !== 'none') {{
-                        // Small delay to ensure DOM is ready
-                        setTimeout(() => {{
-                            card.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-                        }}, 100);
-                        return;
-                    }}
-                }}
+            // Find the first unanswered question in list order
+            const position = studyList.questions.findIndex(qNum => !studySession[qNum]);
+            if (position >= 0) {{
+                currentQuestionIndex = position;
+                // Small delay to ensure DOM is ready
+                setTimeout(() => scrollToQuestion(studyList.questions[position]), 100);
             }}
         }}
 
         function clearStudySession() {{
+            Object.keys(studySession).forEach(qNum => markQuestionDirty(parseInt(qNum)));
             studySession = {{}};
-            localStorage.removeItem('studySession');
         }}
 
         function selectOption(button, qNum, selectedLabel, correctLabel) {{
@@ -3870,7 +4670,7 @@ def generate_html(explanations):
             }}
 
             // Get all option buttons for this question
-            const card = document.getElementById('q' + qNum);
+            const card = getCard(qNum);
             const options = card.querySelectorAll('.option');
             const resultDiv = document.getElementById('result' + qNum);
 
@@ -3887,7 +4687,8 @@ def generate_html(explanations):
                 correct: isCorrect,
                 timestamp: Date.now()
             }};
-            saveStudySession();
+            markQuestionDirty(qNum);
+            logAttempt(qNum, selectedLabel, isCorrect, practiceMode.active ? 'practice' : 'study');
 
             if (isCorrect) {{
                 button.classList.add('correct');
@@ -3923,7 +4724,7 @@ def generate_html(explanations):
             }}
         }}
 
-        function toggleTranslate(qNum, ruQ, ruOptionsJson, esOptionsJson, correctLabel) {{
+        function toggleTranslate(qNum) {{
             // Disable in quiz mode until results
             if (quizMode.active && !quizMode.results) return;
 
@@ -3931,48 +4732,49 @@ def generate_html(explanations):
             if (el.classList.contains('show')) {{
                 el.classList.remove('show');
                 el.innerHTML = '';
+                openPanels.translation.delete(qNum);
             }} else {{
-                let ruOptions = [];
-                let esOptions = [];
-                try {{
-                    // Parse the JSON directly - it's already properly escaped by Python
-                    ruOptions = JSON.parse(ruOptionsJson);
-                    esOptions = JSON.parse(esOptionsJson);
-                }} catch (e) {{
-                    console.error('Error parsing options:', e);
-                    console.error('RU JSON string:', ruOptionsJson);
-                    console.error('ES JSON string:', esOptionsJson);
-                    ruOptions = [];
-                    esOptions = [];
-                }}
-
-                // Create a map of Spanish options by label
-                const esMap = {{}};
-                esOptions.forEach(opt => {{
-                    esMap[opt.label] = opt.text;
-                }});
+                showTranslation(qNum);
+                openPanels.translation.add(qNum);
+            }}
+            scheduleStudyListRender();
+        }}
 
-                let html = '<strong>Вопрос:</strong> ' + ruQ + '<br><br>';
+        function showTranslation(qNum) {{
+            const el = document.getElementById('trans' + qNum);
+            const data = questionData[qNum];
+            const ruQ = data.ruQ;
+            const ruOptions = data.ruOptions;
+            const esOptions = data.options;
+            const correctLabel = data.correct;
+
+            // Create a map of Spanish options by label
+            const esMap = {{}};
+            esOptions.forEach(opt => {{
+                esMap[opt.label] = opt.text;
+            }});
 
-                if (ruOptions.length > 0) {{
-                    html += '<strong>Варианты:</strong><br>';
-                    ruOptions.forEach(opt => {{
-                        const isCorrect = opt.label === correctLabel;
-                        const checkmark = isCorrect ? ' ✓' : '';
-                        const spanishText = isCorrect && esMap[opt.label] ? ' <span style="color: var(--text-secondary); font-weight: 400; font-size: 0.95em;">(' + esMap[opt.label] + ')</span>' : '';
-                        const style = isCorrect ? ' style="color: var(--success); font-weight: 600;"' : '';
-                        html += opt.label + ') ' + '<span' + style + '>' + opt.text + checkmark + '</span>' + spanishText + '<br>';
-                    }});
-                }} else {{
-                    html += '<em style="color: var(--text-tertiary);">Перевод вариантов пока недоступен</em>';
-                }}
+            let html = '<strong>Вопрос:</strong> ' + escapeHtml(ruQ) + '<br><br>';
 
-                el.innerHTML = html;
-                el.classList.add('show');
+            if (ruOptions.length > 0) {{
+                html += '<strong>Варианты:</strong><br>';
+                ruOptions.forEach(opt => {{
+                    const isCorrect = opt.label === correctLabel;
+                    const checkmark = isCorrect ? ' ✓' : '';
+                    const spanishText = isCorrect && esMap[opt.label] ? ' <span style="color: var(--text-secondary); font-weight: 400; font-size: 0.95em;">(' + escapeHtml(esMap[opt.label]) + ')</span>' : '';
+                    const style = isCorrect ? ' style="color: var(--success); font-weight: 600;"' : '';
+                    html += escapeHtml(opt.label) + ') ' + '<span' + style + '>' + escapeHtml(opt.text) + checkmark + '</span>' + spanishText + '<br>';
+                }});
+            }} else {{
+                html += '<em style="color: var(--text-tertiary);">Перевод вариантов пока недоступен</em>';
             }}
+
+            el.innerHTML = html;
+            el.classList.add('show');
+            highlightMatches(el);
         }}
 
-        function toggleExplain(qNum, explanation) {{
+        function toggleExplain(qNum) {{
             // Disable in quiz mode until results
             if (quizMode.active && !quizMode.results) return;
 
@@ -3980,23 +4782,225 @@ def generate_html(explanations):
             if (el.classList.contains('show')) {{
                 el.classList.remove('show');
                 el.innerHTML = '';
+                openPanels.explanation.delete(qNum);
             }} else {{
-                el.innerHTML = explanation || 'Объяснение недоступно';
-                el.classList.add('show');
+                showExplanation(qNum);
+                openPanels.explanation.add(qNum);
             }}
+            scheduleStudyListRender();
         }}
 
-        function filterQuestions(query) {{
-            const cards = document.querySelectorAll('.question-card');
-            const q = query.toLowerCase();
-            cards.forEach(card => {{
-                const text = card.textContent.toLowerCase();
-                card.style.display = text.includes(q) ? 'block' : 'none';
+        function showExplanation(qNum) {{
+            const el = document.getElementById('expl' + qNum);
+            el.textContent = questionData[qNum].explanation || 'Объяснение недоступно';
+            el.classList.add('show');
+            highlightMatches(el);
+        }}
+
+        // ==========================================
+        // SEARCH
+        // ==========================================
+
+        // Inverted index built by the generator (see build_search_index): sorted
+        // folded terms and, per term, postings of position * 8 + field weight,
+        // where position indexes allQuestionNumbers.
+        const searchIndex = ccseData.searchIndex;
+        let trigramTable = null;  // trigram -> term indexes, decoded when the page is idle
+        const searchState = {{ terms: [], words: new Set(), timer: null }};
+
+        // Lowercase without diacritics, like fold_text in the generator
+        // ("Constitución" -> "constitucion", "ё" -> "е")
+        function foldText(text) {{
+            return text.toLowerCase().normalize('NFD').replace(/\\p{{Mn}}/gu, '');
+        }}
+
+        function searchTerms(query) {{
+            return foldText(query).match(/[\\p{{L}}\\p{{N}}]+/gu) || [];
+        }}
+
+        // Index of the first vocabulary term >= term
+        function lowerBound(vocabulary, term) {{
+            let lo = 0;
+            let hi = vocabulary.length;
+            while (lo < hi) {{
+                const mid = (lo + hi) >> 1;
+                if (vocabulary[mid] < term) lo = mid + 1;
+                else hi = mid;
+            }}
+            return lo;
+        }}
+
+        function termTrigrams(term) {{
+            const padded = '^' + term;
+            const grams = new Set();
+            for (let i = 0; i + 3 <= padded.length; i++) grams.add(padded.slice(i, i + 3));
+            return grams;
+        }}
+
+        // Edit distance between a and the closest prefix of b, or max + 1 once it exceeds max
+        function prefixDistance(a, b, max) {{
+            const n = Math.min(b.length, a.length + max);
+            let prev = [];
+            for (let j = 0; j <= n; j++) prev.push(j);
+            for (let i = 1; i <= a.length; i++) {{
+                const row = [i];
+                let rowMin = i;
+                for (let j = 1; j <= n; j++) {{
+                    const cost = a[i - 1] === b[j - 1] ? 0 : 1;
+                    row.push(Math.min(prev[j] + 1, row[j - 1] + 1, prev[j - 1] + cost));
+                    if (row[j] < rowMin) rowMin = row[j];
+                }}
+                if (rowMin > max) return max + 1;
+                prev = row;
+            }}
+            return Math.min(...prev);
+        }}
+
+        function decodeTrigramTable() {{
+            if (trigramTable) return;
+            trigramTable = new Map();
+            for (const gram in searchIndex.trigrams) {{
+                const deltas = searchIndex.trigrams[gram];
+                const ids = new Int32Array(deltas.length);
+                let idx = 0;
+                for (let i = 0; i < deltas.length; i++) ids[i] = (idx += deltas[i]);
+                trigramTable.set(gram, ids);
+            }}
+        }}
+
+        // Decode the table before the first search needs it, while the page is idle
+        if ('requestIdleCallback' in window) requestIdleCallback(decodeTrigramTable, {{ timeout: 3000 }});
+        else setTimeout(decodeTrigramTable, 1000);
+
+        // Vocabulary indexes of the words a term could be a misspelling of (or of the start of)
+        function fuzzyMatches(term) {{
+            if (term.length < 4 || /^\\d+$/.test(term)) return [];
+            decodeTrigramTable();
+
+            // Every edit destroys at most three trigrams, so candidates must share the rest
+            const maxDistance = term.length >= 7 ? 2 : 1;
+            const grams = termTrigrams(term);
+            const needed = Math.max(1, grams.size - 3 * maxDistance);
+            const shared = new Map();
+            grams.forEach(gram => {{
+                (trigramTable.get(gram) || []).forEach(i => shared.set(i, (shared.get(i) || 0) + 1));
             }});
+
+            const matches = [];
+            shared.forEach((count, i) => {{
+                if (count >= needed && prefixDistance(term, searchIndex.terms[i], maxDistance) <= maxDistance) {{
+                    matches.push(i);
+                }}
+            }});
+            return matches;
+        }}
+
+        // Questions matching every term, most relevant first. A term matches the
+        // words it starts, or, if there are none, the words within one or two
+        // typos of it. A question scores the weight of the best field matching
+        // each term, doubled when the word is exactly the term.
+        function searchQuestions(terms) {{
+            const vocabulary = searchIndex.terms;
+            const words = new Set();
+            let scores = null;
+
+            for (const term of terms) {{
+                let matches = [];
+                for (let i = lowerBound(vocabulary, term); i < vocabulary.length && vocabulary[i].startsWith(term); i++) {{
+                    matches.push(i);
+                }}
+                if (matches.length === 0) matches = fuzzyMatches(term);
+
+                const termScores = new Map();
+                for (const i of matches) {{
+                    words.add(vocabulary[i]);
+                    const factor = vocabulary[i] === term ? 2 : 1;
+                    for (const code of searchIndex.postings[i]) {{
+                        const position = code >> 3;
+                        const score = (code & 7) * factor;
+                        if (score > (termScores.get(position) || 0)) termScores.set(position, score);
+                    }}
+                }}
+
+                if (scores === null) {{
+                    scores = termScores;
+                }} else {{
+                    const both = new Map();
+                    scores.forEach((score, position) => {{
+                        if (termScores.has(position)) both.set(position, score + termScores.get(position));
+                    }});
+                    scores = both;
+                }}
+                if (scores.size === 0) break;
+            }}
+
+            searchState.words = words;
+            return Array.from(scores.entries())
+                .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+                .map(([position]) => allQuestionNumbers[position]);
+        }}
+
+        // Wrap the words under el that matched the search in <mark>
+        function highlightMatches(el) {{
+            if (!el || searchState.words.size === 0) return;
+            const textNodes = [];
+            const collect = node => node.childNodes.forEach(child => {{
+                if (child.nodeType === 1 && child.tagName !== 'MARK') collect(child);
+                else if (child.nodeType === 3) textNodes.push(child);
+            }});
+            collect(el);
+
+            textNodes.forEach(node => {{
+                const text = node.textContent;
+                const pieces = [];
+                let last = 0;
+                for (const match of text.matchAll(/[\\p{{L}}\\p{{N}}]+/gu)) {{
+                    if (!searchState.words.has(foldText(match[0]))) continue;
+                    if (match.index > last) pieces.push(document.createTextNode(text.slice(last, match.index)));
+                    const mark = document.createElement('mark');
+                    mark.className = 'search-hit';
+                    mark.textContent = match[0];
+                    pieces.push(mark);
+                    last = match.index + match[0].length;
+                }}
+                if (pieces.length === 0) return;
+                if (last < text.length) pieces.push(document.createTextNode(text.slice(last)));
+                pieces.forEach(piece => node.parentNode.insertBefore(piece, node));
+                node.remove();
+            }});
+        }}
+
+        // Fill the study list with the results of the search box (all questions if it is empty)
+        function showSearchResults() {{
+            searchState.terms = searchTerms(document.querySelector('.search-box').value);
+            if (searchState.terms.length === 0) {{
+                searchState.words = new Set();
+                setStudyList(allQuestionNumbers);
+            }} else {{
+                // Ranked results, without section headers
+                setStudyList(searchQuestions(searchState.terms), false);
+            }}
+        }}
+
+        function runSearch() {{
+            showSearchResults();
+            currentQuestionIndex = 0;
+            updateNavButtons();
+
+            // Bring the top of the results into view if the list starts above the viewport
+            const listTop = document.getElementById('questionList').getBoundingClientRect().top;
+            if (listTop < 0) window.scrollBy(0, listTop - 80);
+        }}
+
+        // Search box input; waits for a pause in typing
+        function filterQuestions() {{
+            clearTimeout(searchState.timer);
+            searchState.timer = setTimeout(runSearch, 150);
         }}
 
         // Print unanswered questions only
         function printUnanswered() {{
+            mountAllForPrint();
             const cards = document.querySelectorAll('.question-card');
             cards.forEach(card => {{
                 const answer = card.querySelector('.answer');
@@ -4013,29 +5017,27 @@ def generate_html(explanations):
             }}, 1000);
         }}
 
-        // Navigation functions
+        // Navigation functions; positions are indexes into the current list of questions
         let currentQuestionIndex = 0;
-        const allCards = Array.from(document.querySelectorAll('.question-card'));
 
         function navigateQuestion(direction) {{
-            const visibleCards = allCards.filter(card => card.style.display !== 'none');
-            if (visibleCards.length === 0) return;
+            const visible = studyList.questions;
+            if (visible.length === 0) return;
 
             currentQuestionIndex += direction;
             if (currentQuestionIndex < 0) currentQuestionIndex = 0;
-            if (currentQuestionIndex >= visibleCards.length) currentQuestionIndex = visibleCards.length - 1;
+            if (currentQuestionIndex >= visible.length) currentQuestionIndex = visible.length - 1;
 
-            visibleCards[currentQuestionIndex].scrollIntoView({{ behavior: 'smooth', block: 'center' }});
+            scrollToQuestion(visible[currentQuestionIndex]);
             updateNavButtons();
         }}
 
         function updateNavButtons() {{
-            const visibleCards = allCards.filter(card => card.style.display !== 'none');
             const prevBtn = document.getElementById('prevBtn');
             const nextBtn = document.getElementById('nextBtn');
 
             if (prevBtn) prevBtn.disabled = currentQuestionIndex === 0;
-            if (nextBtn) nextBtn.disabled = currentQuestionIndex >= visibleCards.length - 1;
+            if (nextBtn) nextBtn.disabled = currentQuestionIndex >= studyList.questions.length - 1;
         }}
 
         function scrollToTop() {{
@@ -4043,31 +5045,16 @@ def generate_html(explanations):
         }}
 
         function scrollToNextUnanswered() {{
-            const unanswered = allCards.find((card, index) => {{
-                const answer = card.querySelector('.answer');
-                return index > currentQuestionIndex &&
-                       answer &&
-                       !answer.classList.contains('revealed') &&
-                       card.style.display !== 'none';
-            }});
-
-            if (unanswered) {{
-                currentQuestionIndex = allCards.indexOf(unanswered);
-                unanswered.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-                updateNavButtons();
-            }} else {{
+            const visible = studyList.questions;
+            let position = visible.findIndex((qNum, index) => index > currentQuestionIndex && !studySession[qNum]);
+            if (position < 0) {{
                 // Wrap around to first unanswered
-                const firstUnanswered = allCards.find(card => {{
-                    const answer = card.querySelector('.answer');
-                    return answer &&
-                           !answer.classList.contains('revealed') &&
-                           card.style.display !== 'none';
-                }});
-                if (firstUnanswered) {{
-                    currentQuestionIndex = allCards.indexOf(firstUnanswered);
-                    firstUnanswered.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-                    updateNavButtons();
-                }}
+                position = visible.findIndex(qNum => !studySession[qNum]);
+            }}
+            if (position >= 0) {{
+                currentQuestionIndex = position;
+                scrollToQuestion(visible[position]);
+                updateNavButtons();
             }}
         }}
 
@@ -4110,23 +5097,12 @@ def generate_html(explanations):
         window.addEventListener('scroll', () => {{
             clearTimeout(scrollTimeout);
             scrollTimeout = setTimeout(() => {{
-                const visibleCards = allCards.filter(card => card.style.display !== 'none');
-                const viewportCenter = window.innerHeight / 2;
-
-                let closestCard = null;
-                let closestDistance = Infinity;
-
-                visibleCards.forEach((card, index) => {{
-                    const rect = card.getBoundingClientRect();
-                    const cardCenter = rect.top + rect.height / 2;
-                    const distance = Math.abs(cardCenter - viewportCenter);
-
-                    if (distance < closestDistance) {{
-                        closestDistance = distance;
-                        closestCard = card;
-                        currentQuestionIndex = allCards.indexOf(card);
-                    }}
-                }});
+                // The entry under the middle of the viewport (or the first question after a header)
+                const list = document.getElementById('questionList');
+                const index = findEntry(window.innerHeight / 2 - list.getBoundingClientRect().top);
+                const entry = studyList.entries[index];
+                const question = entry && entry.type === 'section' ? studyList.entries[index + 1] : entry;
+                if (question) currentQuestionIndex = question.position;
 
                 updateNavButtons();
             }}, 100);
@@ -4149,7 +5125,7 @@ def generate_html(explanations):
         // Build index/table of contents
         function buildIndex() {{
             console.log('buildIndex() called');
-            const sections = document.querySelectorAll('.section-header');
+            const sections = Object.keys(sectionTitles);
             const indexContent = document.getElementById('indexContent');
             console.log('Found sections:', sections.length);
             console.log('indexContent element:', indexContent);
@@ -4159,14 +5135,13 @@ def generate_html(explanations):
                 return;
             }}
 
-            sections.forEach((section, idx) => {{
-                const sectionTitle = section.querySelector('h2').textContent;
+            sections.forEach(section => {{
                 const sectionDiv = document.createElement('div');
                 sectionDiv.className = 'index-section';
 
                 const titleDiv = document.createElement('div');
                 titleDiv.className = 'index-section-title collapsed';
-                titleDiv.textContent = sectionTitle;
+                titleDiv.textContent = sectionTitles[section][0];
 
                 const contentDiv = document.createElement('div');
                 contentDiv.className = 'index-section-content collapsed';
@@ -4179,43 +5154,38 @@ def generate_html(explanations):
 
                 sectionDiv.appendChild(titleDiv);
 
-                // Find all question cards in this section
-                let nextEl = section.nextElementSibling;
-                while (nextEl && !nextEl.classList.contains('section-header')) {{
-                    if (nextEl.classList.contains('question-card')) {{
-                        const qNum = nextEl.querySelector('.q-number').textContent;
-                        const question = nextEl.querySelector('.question').textContent;
-                        const answer = nextEl.querySelector('.answer');
-                        const cardId = nextEl.id; // Capture the card ID
-
-                        const link = document.createElement('a');
-                        link.href = '#';
-                        link.className = 'index-link';
-                        if (answer && answer.classList.contains('revealed')) {{
-                            link.classList.add('answered');
-                        }}
-                        link.textContent = qNum + ' ' + (question.length > 40 ? question.substring(0, 40) + '...' : question);
-                        link.onclick = (e) => {{
-                            e.preventDefault();
-                            const targetCard = document.getElementById(cardId);
-                            if (targetCard) {{
-                                targetCard.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-                            }}
-                            // Close menu only on mobile
-                            if (window.innerWidth <= 768) {{
-                                toggleMenu();
-                            }}
-                        }};
-                        contentDiv.appendChild(link);
+                // One link per question of the section
+                sectionQuestions[section].forEach(qNum => {{
+                    const question = questionData[qNum].q;
+
+                    const link = document.createElement('a');
+                    link.href = '#';
+                    link.className = 'index-link';
+                    if (studySession[qNum]) {{
+                        link.classList.add('answered');
                     }}
-                    nextEl = nextEl.nextElementSibling;
-                }}
+                    link.textContent = '#' + qNum + ' ' + (question.length > 40 ? question.substring(0, 40) + '...' : question);
+                    link.onclick = (e) => {{
+                        e.preventDefault();
+                        scrollToQuestion(qNum);
+                        const position = studyList.questions.indexOf(qNum);
+                        if (position >= 0) currentQuestionIndex = position;
+                        // Close menu only on mobile
+                        if (window.innerWidth <= 768) {{
+                            toggleMenu();
+                        }}
+                    }};
+                    contentDiv.appendChild(link);
+                }});
 
                 sectionDiv.appendChild(contentDiv);
                 indexContent.appendChild(sectionDiv);
             }});
         }}
 
+        // Time allowed for the full exam; shorter quizzes get a proportional share
+        const FULL_EXAM_MINUTES = 45;
+
         // Quiz Mode Implementation
         let quizMode = {{
             active: false,
@@ -4225,7 +5195,7 @@ def generate_html(explanations):
                 sections: [],
                 randomOrder: false,
                 timerEnabled: false,
-                timerMinutes: 45
+                timerMinutes: FULL_EXAM_MINUTES
             }},
             session: {{
                 questions: [],
@@ -4263,18 +5233,17 @@ def generate_html(explanations):
             const config = {{
                 randomOrder: randomOrder,
                 timerEnabled: timerMode !== 'none',
-                timerMinutes: 45
+                timerMinutes: FULL_EXAM_MINUTES
             }};
 
             // Determine question selection
             if (questionMode === 'all') {{
-                config.questionCount = {len(questions)};
+                config.questionCount = allQuestionNumbers.length;
                 config.sections = [];
             }} else if (questionMode === 'section') {{
                 const section = parseInt(document.getElementById('sectionSelect').value);
                 config.sections = [section];
-                const ranges = {{1:[1001,1120], 2:[2001,2036], 3:[3001,3024], 4:[4001,4036], 5:[5001,5084]}};
-                config.questionCount = ranges[section][1] - ranges[section][0] + 1;
+                config.questionCount = sectionQuestions[section].length;
             }} else {{
                 config.questionCount = parseInt(document.getElementById('customCount').value) || 25;
                 config.sections = [];
@@ -4282,9 +5251,9 @@ def generate_html(explanations):
 
             // Adjust timer for proportional mode
             if (timerMode === 'proportional') {{
-                config.timerMinutes = Math.ceil(config.questionCount * 45 / 300);
+                config.timerMinutes = Math.ceil(config.questionCount * FULL_EXAM_MINUTES / totalQuestions);
             }} else if (timerMode === 'full') {{
-                config.timerMinutes = 45;
+                config.timerMinutes = FULL_EXAM_MINUTES;
             }}
 
             closeQuizConfig();
@@ -4299,17 +5268,13 @@ def generate_html(explanations):
                 pool = [...allQuestionNumbers];
             }} else {{
                 // Specific sections
-                const ranges = {{1:[1001,1120], 2:[2001,2036], 3:[3001,3024], 4:[4001,4036], 5:[5001,5084]}};
                 config.sections.forEach(s => {{
-                    const [start, end] = ranges[s];
-                    for (let i = start; i <= end; i++) {{
-                        pool.push(i);
-                    }}
+                    pool.push(...sectionQuestions[s]);
                 }});
             }}
 
             if (config.randomOrder) {{
-                pool = pool.sort(() => Math.random() - 0.5);
+                return sampleWithoutReplacement(pool, config.questionCount);
             }}
 
             return pool.slice(0, config.questionCount);
@@ -4333,39 +5298,8 @@ def generate_html(explanations):
             // Add quiz mode class to body
             document.body.classList.add('quiz-mode');
 
-            // Reset all study mode selections
-            allCards.forEach(card => {{
-                // Remove all selection states from options
-                const options = card.querySelectorAll('.option');
-                options.forEach(option => {{
-                    option.classList.remove('selected', 'correct', 'incorrect', 'selected-quiz', 'disabled');
-                    option.style.borderColor = '';
-                    option.style.background = '';
-                }});
-
-                // Clear result text (✓ Correcto / ✗ Incorrecto)
-                const resultDiv = card.querySelector('.result');
-                if (resultDiv) {{
-                    resultDiv.innerHTML = '';
-                    resultDiv.classList.remove('correct', 'incorrect');
-                }}
-
-                // Hide answer section
-                const answer = card.querySelector('.answer');
-                if (answer) {{
-                    answer.classList.remove('revealed');
-                    answer.style.display = 'none';
-                }}
-
-                // Remove any quiz next buttons from previous sessions
-                const quizNextBtn = card.querySelector('.quiz-next-card-btn');
-                if (quizNextBtn) quizNextBtn.remove();
-
-                // Hide card initially
-                card.style.display = 'none';
-            }});
-
-            // Show only the current question
+            // Show only the current question; cards are re-rendered in quiz mode,
+            // so no study mode selections carry over
             showQuizQuestion(0);
 
             // Update progress and navigation buttons
@@ -4379,7 +5313,7 @@ def generate_html(explanations):
                 document.getElementById('quizTimer').textContent = '';
             }}
 
-            // Save session to localStorage
+            // Save the session so it can be resumed after a reload
             saveQuizSession();
 
             // Update toggle button
@@ -4387,17 +5321,12 @@ def generate_html(explanations):
         }}
 
         function showQuizQuestion(index) {{
-            // Hide all cards
-            allCards.forEach(card => {{
-                card.style.display = 'none';
-            }});
-
             // Show only the current quiz question
             if (index >= 0 && index < quizMode.session.questions.length) {{
                 const qNum = quizMode.session.questions[index];
-                const card = document.getElementById('q' + qNum);
+                setStudyList([qNum], false);
+                const card = getCard(qNum);
                 if (card) {{
-                    card.style.display = 'block';
                     card.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
 
                     // Show next/end button if question is already answered
@@ -4449,9 +5378,10 @@ def generate_html(explanations):
 
         function selectQuizAnswer(qNum, label) {{
             quizMode.session.answers[qNum] = label;
+            progress.quizLatency.set(qNum, answerLatency(qNum));
 
             // Update visual state
-            const card = document.getElementById('q' + qNum);
+            const card = getCard(qNum);
             const options = card.querySelectorAll('.option');
             options.forEach(opt => {{
                 opt.classList.remove('selected-quiz');
@@ -4564,15 +5494,14 @@ def generate_html(explanations):
 
             quizMode.session.questions.forEach(qNum => {{
                 const userAnswer = quizMode.session.answers[qNum];
-                const card = document.getElementById('q' + qNum);
-                const correctLabel = card.dataset.correct;
+                const correctLabel = questionData[qNum].correct;
                 console.log(`Question ${{qNum}}: user=${{userAnswer}}, correct=${{correctLabel}}`);
 
                 const isCorrect = userAnswer === correctLabel;
 
                 if (isCorrect) results.correct++;
 
-                const section = Math.floor(qNum / 1000);
+                const section = questionSection[qNum];
                 if (!results.bySection[section]) {{
                     results.bySection[section] = {{correct: 0, total: 0}};
                 }}
@@ -4584,12 +5513,15 @@ def generate_html(explanations):
                 // Update question score for spaced repetition
                 if (userAnswer !== undefined) {{
                     updateQuestionScore(qNum, isCorrect);
+                    logAttempt(qNum, userAnswer, isCorrect, 'quiz', progress.quizLatency.get(qNum) ?? null);
                 }}
             }});
 
             results.percentage = (results.correct / results.total * 100).toFixed(1);
             results.passed = results.percentage >= 60;
 
+            progress.quizLatency.clear();
+
             // Calculate time taken
             const timeMs = quizMode.session.endTime - quizMode.session.startTime;
             const mins = Math.floor(timeMs / 60000);
@@ -4598,8 +5530,8 @@ def generate_html(explanations):
 
             quizMode.results = results;
 
-            // Clear quiz session from localStorage
-            localStorage.removeItem('quizSession');
+            // Clear the saved quiz session
+            setProgressMeta('quizSession', undefined);
 
             // Show results
             showQuizResults();
@@ -4612,14 +5544,6 @@ def generate_html(explanations):
 
             const results = quizMode.results;
             console.log('Body classes:', document.body.className);
-            const sectionTitles = {{
-                1: 'TAREA 1: Gobierno y legislación',
-                2: 'TAREA 2: Derechos y deberes',
-                3: 'TAREA 3: Geografía',
-                4: 'TAREA 4: Cultura e historia',
-                5: 'TAREA 5: Sociedad'
-            }};
-
             // Build section performance HTML
             let sectionHTML = '';
             Object.keys(results.bySection).sort().forEach(section => {{
@@ -4627,7 +5551,7 @@ def generate_html(explanations):
                 const pct = (data.correct / data.total * 100).toFixed(0);
                 sectionHTML += `
                     <div class="performance-bar">
-                        <div class="performance-label">${{sectionTitles[section] || 'Sección ' + section}}</div>
+                        <div class="performance-label">${{escapeHtml(sectionTitles[section] ? sectionTitles[section][0] : 'Sección ' + section)}}</div>
                         <div class="performance-track">
                             <div class="performance-fill" style="width: ${{pct}}%"></div>
                         </div>
@@ -4737,12 +5661,15 @@ def generate_html(explanations):
 
             quizMode.results.details.forEach(detail => {{
                 const qNum = detail.qNum;
-                const card = document.getElementById('q' + qNum);
-                const question = card.querySelector('.question').textContent;
-                const options = Array.from(card.querySelectorAll('.option'));
+                const data = questionData[qNum];
+                const question = escapeHtml(data.q);
+                const optionText = label => {{
+                    const opt = data.options.find(o => o.label === label);
+                    return opt ? escapeHtml(opt.label + ') ' + opt.text) : null;
+                }};
 
-                const userOption = options.find(opt => opt.dataset.label === detail.userAnswer);
-                const correctOption = options.find(opt => opt.dataset.label === detail.correctLabel);
+                const userOption = optionText(detail.userAnswer);
+                const correctOption = optionText(detail.correctLabel);
 
                 html += `
                     <div class="question-review">
@@ -4756,12 +5683,12 @@ def generate_html(explanations):
                         <div class="review-answers">
                             ${{detail.userAnswer ? `
                                 <div class="review-answer ${{detail.isCorrect ? 'user-correct' : 'user-incorrect'}}">
-                                    ${{t('yourAnswer')}} ${{userOption ? userOption.textContent : t('notAnswered')}}
+                                    ${{t('yourAnswer')}} ${{userOption || t('notAnswered')}}
                                 </div>
                             ` : `<div class="review-answer user-incorrect">${{t('notAnswered')}}</div>`}}
                             ${{!detail.isCorrect ? `
                                 <div class="review-answer correct-answer">
-                                    ${{t('correctAnswer')}} ${{correctOption ? correctOption.textContent : 'N/A'}}
+                                    ${{t('correctAnswer')}} ${{correctOption || 'N/A'}}
                                 </div>
                             ` : ''}}
                         </div>
@@ -4793,17 +5720,8 @@ def generate_html(explanations):
                 timerInterval: null
             }};
 
-            // Show all cards and clean up quiz state
-            allCards.forEach(card => {{
-                card.style.display = 'block';
-                // Remove quiz next button if it exists
-                const quizNextBtn = card.querySelector('.quiz-next-card-btn');
-                if (quizNextBtn) quizNextBtn.remove();
-                // Remove quiz selection state
-                card.querySelectorAll('.option').forEach(opt => {{
-                    opt.classList.remove('selected-quiz');
-                }});
-            }});
+            // Show all cards again, re-rendered without quiz state
+            showSearchResults();
 
             // Open quiz config
             openQuizConfig();
@@ -4824,17 +5742,8 @@ def generate_html(explanations):
                 timerInterval: null
             }};
 
-            // Show all cards and clean up quiz state
-            allCards.forEach(card => {{
-                card.style.display = 'block';
-                // Remove quiz next button if it exists
-                const quizNextBtn = card.querySelector('.quiz-next-card-btn');
-                if (quizNextBtn) quizNextBtn.remove();
-                // Remove quiz selection state
-                card.querySelectorAll('.option').forEach(opt => {{
-                    opt.classList.remove('selected-quiz');
-                }});
-            }});
+            // Show all cards again, re-rendered without quiz state
+            showSearchResults();
 
             // Scroll to top
             window.scrollTo({{ top: 0, behavior: 'smooth' }});
@@ -4850,14 +5759,10 @@ def generate_html(explanations):
                 quizMode.active = false;
 
                 // Clear session
-                localStorage.removeItem('quizSession');
+                setProgressMeta('quizSession', undefined);
 
-                // Remove quiz option states
-                allCards.forEach(card => {{
-                    const options = card.querySelectorAll('.option');
-                    options.forEach(opt => opt.classList.remove('selected-quiz'));
-                    card.style.display = 'block';
-                }});
+                // Show all cards again, re-rendered without quiz state
+                showSearchResults();
 
                 // Scroll to top
                 window.scrollTo({{ top: 0, behavior: 'smooth' }});
@@ -4926,15 +5831,14 @@ def generate_html(explanations):
                     flagged: Array.from(quizMode.session.flagged),
                     startTime: quizMode.session.startTime
                 }};
-                localStorage.setItem('quizSession', JSON.stringify(session));
+                setProgressMeta('quizSession', session);
             }}
         }}
 
         function restoreQuizSession() {{
-            const saved = localStorage.getItem('quizSession');
-            if (saved) {{
+            const session = progress.meta.get('quizSession');
+            if (session) {{
                 try {{
-                    const session = JSON.parse(saved);
 
                     // Show custom confirmation dialog
                     showConfirmDialog(
@@ -4953,51 +5857,6 @@ def generate_html(explanations):
 
                             document.body.classList.add('quiz-mode');
 
-                            // Reset all study mode selections
-                            allCards.forEach(card => {{
-                                // Remove all selection states from options
-                                const options = card.querySelectorAll('.option');
-                                options.forEach(option => {{
-                                    option.classList.remove('selected', 'correct', 'incorrect', 'selected-quiz', 'disabled');
-                                    option.style.borderColor = '';
-                                    option.style.background = '';
-                                }});
-
-                                // Clear result text (✓ Correcto / ✗ Incorrecto)
-                                const resultDiv = card.querySelector('.result');
-                                if (resultDiv) {{
-                                    resultDiv.innerHTML = '';
-                                    resultDiv.classList.remove('correct', 'incorrect');
-                                }}
-
-                                // Hide answer section
-                                const answer = card.querySelector('.answer');
-                                if (answer) {{
-                                    answer.classList.remove('revealed');
-                                    answer.style.display = 'none';
-                                }}
-
-                                // Remove any quiz next buttons
-                                const quizNextBtn = card.querySelector('.quiz-next-card-btn');
-                                if (quizNextBtn) quizNextBtn.remove();
-
-                                // Hide card initially
-                                card.style.display = 'none';
-                            }});
-
-                            // Restore answer state for all quiz questions
-                            session.questions.forEach(qNum => {{
-                                const card = document.getElementById('q' + qNum);
-                                if (card && session.answers[qNum]) {{
-                                    const options = card.querySelectorAll('.option');
-                                    options.forEach(opt => {{
-                                        if (opt.dataset.label === session.answers[qNum]) {{
-                                            opt.classList.add('selected-quiz');
-                                        }}
-                                    }});
-                                }}
-                            }});
-
                             // Show only the current question
                             showQuizQuestion(quizMode.currentQuestionIndex);
 
@@ -5021,12 +5880,12 @@ def generate_html(explanations):
                         }},
                         // On Start New
                         () => {{
-                            localStorage.removeItem('quizSession');
+                            setProgressMeta('quizSession', undefined);
                         }}
                     );
                 }} catch (e) {{
                     console.error('Error restoring quiz session:', e);
-                    localStorage.removeItem('quizSession');
+                    setProgressMeta('quizSession', undefined);
                 }}
             }}
         }}
@@ -5039,39 +5898,45 @@ def generate_html(explanations):
             }}
         }});
 
-        // Try to restore quiz session on page load
-        setTimeout(restoreQuizSession, 500);
+        // Mount the cards around the top of the page
+        showSearchResults();
 
-        // Restore study session on page load
-        try {{
-            restoreStudyState();
-            console.log('Study session restored');
-        }} catch (error) {{
-            console.error('Error restoring study session:', error);
-        }}
+        // Load saved progress, then restore it on the page
+        loadProgress().then(() => {{
+            // Try to restore quiz session on page load
+            setTimeout(restoreQuizSession, 500);
 
-        // Build index on load
-        console.log('About to call buildIndex()');
-        try {{
-            buildIndex();
-            console.log('buildIndex() completed');
-        }} catch (error) {{
-            console.error('Error in buildIndex():', error);
-        }}
+            // Restore study session on page load
+            try {{
+                restoreStudyState();
+                console.log('Study session restored');
+            }} catch (error) {{
+                console.error('Error restoring study session:', error);
+            }}
 
-        // Initialize scoring system on page load
-        try {{
-            renderAllIndicators();
-            updateStatsPanel();
-            updatePracticeBadge();
-            console.log('Scoring system initialized');
-        }} catch (error) {{
-            console.error('Error initializing scoring system:', error);
-        }}
+            // Build index on load
+            console.log('About to call buildIndex()');
+            try {{
+                buildIndex();
+                console.log('buildIndex() completed');
+            }} catch (error) {{
+                console.error('Error in buildIndex():', error);
+            }}
+
+            // Initialize scoring system on page load
+            try {{
+                renderAllIndicators();
+                updateStatsPanel();
+                updatePracticeBadge();
+                console.log('Scoring system initialized');
+            }} catch (error) {{
+                console.error('Error initializing scoring system:', error);
+            }}
+        }});
 
         // Register Service Worker for offline support
         if ('serviceWorker' in navigator) {{
-            window.addEventListener('load', () => {{
+            const registerServiceWorker = () => {{
                 navigator.serviceWorker.register('./sw.js')
                     .then(registration => {{
                         console.log('SW registered:', registration.scope);
@@ -5095,29 +5960,157 @@ def generate_html(explanations):
                     .catch(error => {{
                         console.log('SW registration failed:', error);
                     }});
-            }});
-        }}
-    </script>
+            }};
+            // In the bundled build this script runs once the data file has
+            // arrived, which may be after the load event
+            if (document.readyState === 'complete') registerServiceWorker();
+            else window.addEventListener('load', registerServiceWorker);
+        }}
+'''
+
+    data = {
+        'questionData': question_data,
+        'searchIndex': search_index,
+        'allQuestionNumbers': sorted(questions.keys()),
+        'sectionQuestions': section_questions,
+        'sectionTitles': section_titles,
+    }
+    return {'head': head, 'css': css, 'body': body, 'js': js, 'data': data}
+
+def single_file_page(page):
+    """The whole app as one self-contained HTML file"""
+    return f'''{page['head']}
+    <style>{page['css']}    </style>
+</head>
+<body>{page['body']}
+    <script type="application/json" id="appData">{script_json(page['data'])}</script>
+    <script>window.ccseData = JSON.parse(document.getElementById('appData').textContent);</script>
+    <script>{page['js']}    </script>
 </body>
 </html>'''
 
-    return html
+def hashed_name(name, content):
+    """app.js -> app.<first 10 hex digits of the content hash>.js"""
+    stem, ext = name.rsplit('.', 1)
+    return f"{stem}.{hashlib.sha256(content).hexdigest()[:10]}.{ext}"
+
+def bundle_page(page, manifest):
+    """Thin index.html that links the hashed stylesheet and starts the app once the data has loaded"""
+    return f'''{page['head']}
+    <link rel="stylesheet" href="{manifest['app.css']}">
+    <link rel="preload" href="{manifest['app.js']}" as="script">
+    <link rel="preload" href="{manifest['data.json']}" as="fetch" crossorigin>
+</head>
+<body>{page['body']}
+    <script>
+        fetch('{manifest['data.json']}')
+            .then(response => response.json())
+            .then(data => {{
+                window.ccseData = data;
+                const app = document.createElement('script');
+                app.src = '{manifest['app.js']}';
+                document.body.appendChild(app);
+            }})
+            .catch(error => console.error('Error loading question data:', error));
+    </script>
+</body>
+</html>'''
 
-async def main():
+def write_file(path, content):
+    """Write bytes atomically so a half-written asset is never served"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+
+def copy_static_files(out_dir):
+    """Copy STATIC_FILES into out_dir unless it is this script's own directory"""
+    source_dir = Path(__file__).resolve().parent
+    if out_dir.resolve() == source_dir:
+        return
+    for name in STATIC_FILES:
+        target = out_dir / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        write_file(target, (source_dir / name).read_bytes())
+
+def write_bundle(page, out_dir='.'):
+    """Write index.html and the content-hashed app.css, app.js and data.json to out_dir
+
+    A content-only change produces a new data file and index.html but the
+    same app.css / app.js names, so browsers and the service worker keep
+    those. The build manifest {name: hashed name} goes to BUILD_MANIFEST_FILE
+    and, as the service worker's precache list, to PRECACHE_MANIFEST_FILE.
+    Hashed files of earlier builds are removed. The service worker, web app
+    manifest and icons are copied along, so out_dir can be served on its own.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    copy_static_files(out_dir)
+    contents = {
+        'app.css': page['css'].encode('utf-8'),
+        'app.js': page['js'].encode('utf-8'),
+        'data.json': json.dumps(page['data'], ensure_ascii=False, separators=(',', ':')).encode('utf-8'),
+    }
+    manifest = {name: hashed_name(name, content) for name, content in contents.items()}
+    for name, content in contents.items():
+        path = out_dir / manifest[name]
+        if not path.exists():
+            write_file(path, content)
+
+    index = bundle_page(page, manifest).encode('utf-8')
+    write_file(out_dir / 'index.html', index)
+    write_file(out_dir / BUILD_MANIFEST_FILE, json.dumps(manifest, indent=2).encode('utf-8'))
+    precache = {
+        'version': hashlib.sha256(index).hexdigest()[:10],
+        'assets': list(SHELL_FILES) + [f'./{hashed}' for hashed in manifest.values()],
+    }
+    write_file(out_dir / PRECACHE_MANIFEST_FILE, (
+        '// Written by generate_html.py: the files of the current build, precached by sw.js\n'
+        f'self.PRECACHE_MANIFEST = {json.dumps(precache, indent=2)};\n'
+    ).encode('utf-8'))
+
+    current = set(manifest.values())
+    for path in out_dir.iterdir():
+        if HASHED_ASSET_RE.match(path.name) and path.name not in current:
+            path.unlink()
+    return manifest
+
+async def main(full_rebuild=False, batch_backend=None, single_file=False, out_dir='.'):
     print("Starting CCSE HTML generator...")
 
     # Generate explanations
-    explanations = await generate_all_explanations()
+    explanations = await generate_all_explanations(batch_backend)
     print(f"Total explanations: {len(explanations)}")
 
-    # Generate HTML
-    html = generate_html(explanations)
+    # Generate HTML (reusing unchanged content unless a full rebuild was requested)
+    page = generate_html(explanations, incremental=not full_rebuild)
 
-    output_file = "ccse_study.html"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html)
-
-    print(f"Generated {output_file}")
+    if single_file:
+        with open(SINGLE_FILE_OUTPUT, 'w', encoding='utf-8') as f:
+            f.write(single_file_page(page))
+        print(f"Generated {SINGLE_FILE_OUTPUT}")
+    else:
+        manifest = write_bundle(page, out_dir)
+        print(f"Generated {Path(out_dir) / 'index.html'} with {', '.join(manifest.values())}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--full", action="store_true",
+                        help="ignore the build cache and rebuild the question data and search index")
+    parser.add_argument("--batch", action="store_true",
+                        help="generate missing explanations as one Batch API job")
+    parser.add_argument("--batch-base-url",
+                        help="API base URL for batch mode (e.g. a local batch_stub_server.py)")
+    parser.add_argument("--single-file", action="store_true",
+                        help=f"write everything inline to {SINGLE_FILE_OUTPUT} instead of hashed assets")
+    parser.add_argument("--out-dir", default=".",
+                        help="directory to publish the app to: index.html, the hashed assets, sw.js, "
+                             "manifest.json and icons (default: current directory)")
+    args = parser.parse_args()
+
+    batch_backend = None
+    if args.batch:
+        from batch_backend import BatchBackend
+        batch_backend = BatchBackend(base_url=args.batch_base_url)
+
+    asyncio.run(main(full_rebuild=args.full, batch_backend=batch_backend,
+                     single_file=args.single_file, out_dir=args.out_dir))
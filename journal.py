@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Append-only JSONL journal backing a canonical JSON snapshot.
+
+Each completed item is appended as one `{"key": ..., "value": ...}` line,
+so saving progress costs O(1) per item instead of re-serialising the
+whole dictionary. On open (and on close) the journal is compacted into
+the snapshot with an atomic rename, so the snapshot is never torn.
+"""
+
+import json
+import os
+from pathlib import Path
+
+
+def atomic_write_json(path, data, indent=2):
+    """Write JSON to a temp file, fsync it and rename it over `path`"""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class Journal:
+    """Dictionary persisted as snapshot + append-only journal.
+
+    Appends are flushed to the OS immediately (a crashed process loses
+    nothing) and fsynced every `fsync_every` records (a power loss costs at
+    most that many records).
+    """
+
+    def __init__(self, snapshot_path, journal_path=None, fsync_every=10):
+        self.snapshot_path = Path(snapshot_path)
+        if journal_path is None:
+            journal_path = self.snapshot_path.with_suffix('.journal.jsonl')
+        self.journal_path = Path(journal_path)
+        self.fsync_every = fsync_every
+        self.data = {}
+        self._file = None
+        self._pending = 0
+        self._dirty = False
+
+    def load(self):
+        """Read the snapshot, replay the journal on top and compact both"""
+        self.data = {}
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                self.data = json.load(f)
+
+        replayed = 0
+        if self.journal_path.exists():
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Torn final line from a crash mid-append
+                        continue
+                    self.data[record['key']] = record['value']
+                    replayed += 1
+
+        if replayed:
+            print(f"Recovered {replayed} journal records into {self.snapshot_path}")
+            self._dirty = True
+        self.compact()
+        return self.data
+
+    def compact(self):
+        """Write the current data as the snapshot and truncate the journal"""
+        self._close_file()
+        if self._dirty:
+            atomic_write_json(self.snapshot_path, self.data)
+            self._dirty = False
+        if self.journal_path.exists():
+            self.journal_path.unlink()
+
+    def append(self, key, value):
+        """Record one completed item"""
+        key = str(key)
+        self.data[key] = value
+        self._dirty = True
+        if self._file is None:
+            self._file = open(self.journal_path, 'a', encoding='utf-8')
+        self._file.write(json.dumps({'key': key, 'value': value}, ensure_ascii=False) + '\n')
+        self._file.flush()
+        self._pending += 1
+        if self._pending >= self.fsync_every:
+            self.sync()
+
+    def sync(self):
+        """fsync any appended records"""
+        if self._file is not None and self._pending:
+            os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def _close_file(self):
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def close(self):
+        """Fold the journal into the snapshot"""
+        self.compact()
+
+    def __enter__(self):
+        self.load()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Leave the journal in place; the next load() recovers it
+            self._close_file()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Bounded-concurrency worker pool for OpenAI API calls with adaptive
+(AIMD) rate limiting, per-request retries and jittered backoff.
+"""
+
+import asyncio
+import random
+import re
+import time
+
+
+class RateLimitError(Exception):
+    """The API answered 429 - back off and retry"""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TransientError(Exception):
+    """A failure worth retrying (5xx, timeouts, dropped connections)"""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def parse_duration(value):
+    """Parse retry-after / x-ratelimit-reset values ('2', '1.5', '6m0s', '20ms') into seconds"""
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    total = 0.0
+    matched = False
+    for amount, unit in re.findall(r'(\d+(?:\.\d+)?)(ms|h|m|s)', value):
+        matched = True
+        amount = float(amount)
+        total += {'ms': amount / 1000, 's': amount, 'm': amount * 60, 'h': amount * 3600}[unit]
+    return total if matched else None
+
+
+class AdaptivePool:
+    """Keeps up to `limit` requests in flight, adjusting the limit AIMD-style.
+
+    Every success raises the limit by 1/limit (about +1 per round trip of
+    the whole window); every 429 halves it and pauses all workers until the
+    server's retry-after has passed. Rate-limit headers reported by the API
+    clamp the limit to the remaining request budget.
+    """
+
+    def __init__(self, max_concurrency=16, initial_concurrency=4, min_concurrency=1,
+                 max_retries=5, base_delay=1.0, max_delay=60.0):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.limit = float(min(initial_concurrency, max_concurrency))
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self._cond = None
+
+    def _decrease(self):
+        self.limit = max(self.min_concurrency, self.limit / 2)
+
+    def _increase(self):
+        self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+
+    def _pause(self, seconds):
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def observe_headers(self, headers):
+        """Adjust concurrency from x-ratelimit-* response headers"""
+        remaining = headers.get('x-ratelimit-remaining-requests')
+        if remaining is None:
+            return
+        try:
+            remaining = int(remaining)
+        except ValueError:
+            return
+
+        if remaining <= 0:
+            reset = parse_duration(headers.get('x-ratelimit-reset-requests'))
+            self._pause(reset if reset is not None else self.base_delay)
+        if remaining < self.limit:
+            self.limit = max(self.min_concurrency, float(remaining))
+
+    def _backoff(self, attempt, retry_after=None):
+        if retry_after is not None:
+            # Honour the server, plus a little jitter so workers don't stampede together
+            return retry_after + random.uniform(0, self.base_delay)
+        # Full jitter exponential backoff
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    async def _acquire(self):
+        async with self._cond:
+            while True:
+                wait = self.paused_until - time.monotonic()
+                if wait > 0:
+                    self._cond.release()
+                    try:
+                        await asyncio.sleep(wait)
+                    finally:
+                        await self._cond.acquire()
+                    continue
+                if self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                await self._cond.wait()
+
+    async def _release(self):
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    async def _call(self, worker, item):
+        """Run worker(item) with retries; returns (ok, result_or_error)"""
+        for attempt in range(self.max_retries + 1):
+            await self._acquire()
+            try:
+                result = await worker(item)
+            except RateLimitError as e:
+                self._decrease()
+                delay = self._backoff(attempt, e.retry_after)
+                self._pause(delay)
+                error = e
+            except (TransientError, asyncio.TimeoutError, ConnectionError) as e:
+                delay = self._backoff(attempt, getattr(e, 'retry_after', None))
+                error = e
+            except Exception as e:
+                # Bad request, unparsable response... retrying won't help
+                return False, e
+            else:
+                self._increase()
+                return True, result
+            finally:
+                await self._release()
+
+            if attempt < self.max_retries:
+                await asyncio.sleep(delay)
+        return False, error
+
+    async def run(self, items, worker, on_result=None):
+        """Process every item with `worker`, keeping the pool full.
+
+        on_result(item, ok, result) is called as soon as each item finishes,
+        in completion order. Returns {item: result} for the successful items.
+        """
+        self._cond = asyncio.Condition()
+        queue = asyncio.Queue()
+        for item in items:
+            queue.put_nowait(item)
+        results = {}
+
+        async def drain():
+            while True:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                ok, result = await self._call(worker, item)
+                if ok:
+                    results[item] = result
+                if on_result:
+                    on_result(item, ok, result)
+
+        workers = [asyncio.create_task(drain()) for _ in range(min(self.max_concurrency, queue.qsize()))]
+        await asyncio.gather(*workers)
+        return results
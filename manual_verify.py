@@ -3,12 +3,7 @@
 Manual verification - print specific questions in detail for human review against PDF.
 """
 
-import json
-from ccse_questions import questions, translations
-
-# Load official options
-with open('official_options.json', 'r', encoding='utf-8') as f:
-    official_options = json.load(f)
+from ccse_verify import OFFICIAL_OPTIONS_FILE, check_answer_text, load_model
 
 # Questions to verify manually (sample from each Tarea)
 VERIFY_QUESTIONS = [
@@ -24,40 +19,46 @@ VERIFY_QUESTIONS = [
     5001, 5041, 5084,
 ]
 
-print('=' * 80)
-print('  MANUAL VERIFICATION - Compare these against the PDF')
-print('=' * 80)
-
-for q_num in VERIFY_QUESTIONS:
-    q_str = str(q_num)
-
-    # Get data from ccse_questions.py
-    es_q, es_a = questions[q_num]
-
-    # Get data from official_options.json
-    opts_data = official_options.get(q_str, {})
-    options = opts_data.get('options', [])
-    correct_label = opts_data.get('correct')
-
-    print(f'\n{"=" * 80}')
-    print(f'QUESTION {q_num}')
-    print(f'{"=" * 80}')
-    print(f'Question: {es_q}')
-    print(f'Expected answer (ccse_questions.py): {es_a}')
-    print(f'Correct label: {correct_label}')
-    print('Options:')
-    for opt in options:
-        marker = ' ✓' if opt['label'] == correct_label else ''
-        print(f"  {opt['label']}) {opt['text']}{marker}")
-
-    # Verify the correct option matches the expected answer
-    correct_opt = next((opt for opt in options if opt['label'] == correct_label), None)
-    if correct_opt:
-        # Simple check - answer should be similar to correct option
-        answer_in_option = es_a.lower().rstrip('.') in correct_opt['text'].lower()
-        if not answer_in_option:
-            print(f'\n  ⚠ WARNING: Answer "{es_a}" may not match option {correct_label}: "{correct_opt["text"]}"')
-
-print('\n' + '=' * 80)
-print('  Please verify the above against the PDF manually')
-print('=' * 80)
+
+def main():
+    model = load_model()
+    warnings = {issue['q_num']: issue for issue in check_answer_text(model, VERIFY_QUESTIONS)}
+
+    print('=' * 80)
+    print('  MANUAL VERIFICATION - Compare these against the PDF')
+    print('=' * 80)
+
+    missing = [q_num for q_num in VERIFY_QUESTIONS if not model.records[q_num]['official']]
+    if missing:
+        print(f'\n⚠ WARNING: {len(missing)} of {len(VERIFY_QUESTIONS)} questions have no record in {OFFICIAL_OPTIONS_FILE}: {missing}')
+
+    for q_num in VERIFY_QUESTIONS:
+        record = model.records[q_num]
+        opts_data = record['official'] or {}
+        options = opts_data.get('options', [])
+        correct_label = opts_data.get('correct')
+
+        print(f'\n{"=" * 80}')
+        print(f'QUESTION {q_num}')
+        print(f'{"=" * 80}')
+        print(f"Question: {record['question']}")
+        print(f"Expected answer (ccse_questions.py): {record['answer']}")
+        if not record['official']:
+            print(f'⚠ No official data in {OFFICIAL_OPTIONS_FILE}: options and correct label are unknown')
+            continue
+        print(f'Correct label: {correct_label}')
+        print('Options:')
+        for opt in options:
+            marker = ' ✓' if opt['label'] == correct_label else ''
+            print(f"  {opt['label']}) {opt['text']}{marker}")
+
+        if q_num in warnings:
+            print(f"\n  ⚠ WARNING: Answer \"{record['answer']}\" may not match option {correct_label}: \"{warnings[q_num]['expected']}\"")
+
+    print('\n' + '=' * 80)
+    print('  Please verify the above against the PDF manually')
+    print('=' * 80)
+
+
+if __name__ == '__main__':
+    main()
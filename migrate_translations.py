@@ -5,6 +5,8 @@ import json
 from pathlib import Path
 
 from ccse_questions import translations as old_translations
+from overrides import load_options
+from question_bank import BANK_FILE, update_translations
 
 INPUT_FILE = Path('options_translations.json')
 
@@ -19,8 +21,7 @@ def main() -> None:
         print('Ejecuta primero translate_options.py')
         return
 
-    with open(INPUT_FILE, 'r', encoding='utf-8') as f:
-        options_trans = json.load(f)
+    options_trans = load_options(INPUT_FILE)
 
     print(f'📄 Cargadas {len(options_trans)} traducciones de opciones')
     print(f'📄 Traducciones existentes: {len(old_translations)} preguntas\n')
@@ -56,24 +57,9 @@ def main() -> None:
 
     print(f'✅ Guardado en JSON: {json_output}')
 
-    # Now generate Python code using repr for safe escaping
-    output_file = Path('translations_migrated.py')
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('translations = {\n')
-        for q_num in sorted(new_translations.keys()):
-            data = new_translations[q_num]
-            # Use repr() for automatic and safe escaping
-            f.write(f'    {q_num}: {{\n')
-            f.write(f'        "question": {repr(data["question"])},\n')
-            f.write(f'        "answer": {repr(data["answer"])},\n')
-            f.write(f'        "options": [\n')
-            for opt in data['options']:
-                f.write(f'            {{"label": {repr(opt["label"])}, "text": {repr(opt["text"])}}},\n')
-            f.write(f'        ],\n')
-            f.write(f'    }},\n')
-        f.write('}\n')
-
-    print(f'✅ Generado código Python: {output_file}')
+    # Write the merged translations into the question bank
+    update_translations(new_translations)
+    print(f'✅ Actualizado el banco de preguntas: {BANK_FILE}')
     print(f'📊 Total: {len(new_translations)} preguntas con opciones traducidas')
 
 
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Declarative corrections layered over the extracted question data.
+
+WARNING: official_options.json, official_options_raw.json and
+options_translations.json hold the entries exactly as extracted, including
+the ones known to be wrong: 1059, for instance, carries the question and
+options of 1015. They are only correct once overrides.json is applied, so
+never json.load them directly. Read them with load_options(), or with
+read_extracted() where the extracted base itself is wanted (translating it,
+fingerprinting it). tests/test_overrides.py fails on any other reader.
+
+overrides.json maps a question number to the fields the extraction got
+wrong: 'question', 'options' and 'correct' (official_options.json and
+official_options_raw.json) and 'ru_options' (options_translations.json).
+They are applied whenever those files are loaded through load_options(), so
+a correction survives re-extraction and nothing rewrites the JSON files.
+
+Each override keeps, under 'base', a fingerprint of the extracted entry it
+was written against in every file it changes ('missing' where the file had
+no entry, e.g. official_options.json before it is first extracted). When a
+new extraction changes that entry, override_status() reports a conflict
+until the override is reviewed and rebased (python fix_options.py --rebase N).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+OVERRIDES_FILE = Path('overrides.json')
+
+# Override field -> entry field, for each file the overrides apply to
+SOURCE_FIELDS = {
+    'official_options.json': {'question': 'question', 'options': 'options', 'correct': 'correct'},
+    'official_options_raw.json': {'question': 'question', 'options': 'options'},
+    'options_translations.json': {'ru_options': 'options'},
+}
+# Entry fields an override must give to create an entry missing from a file
+REQUIRED_FIELDS = {
+    'official_options.json': {'question', 'options', 'correct'},
+    'official_options_raw.json': {'question', 'options'},
+    'options_translations.json': {'options'},
+}
+
+
+def entry_fingerprint(entry: Optional[dict]) -> str:
+    """Short content hash of one extracted entry ('missing' if there is none)"""
+    if entry is None:
+        return 'missing'
+    payload = json.dumps(entry, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+@lru_cache(maxsize=None)
+def _read_overrides(path: Path, mtime: float) -> Dict[int, dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return {int(q_num): override for q_num, override in json.load(f).items()}
+
+
+def load_overrides(path: Path = OVERRIDES_FILE) -> Dict[int, dict]:
+    """{q_num: override}, re-read only when the file changes; {} without one"""
+    if not path.exists():
+        return {}
+    return _read_overrides(path, path.stat().st_mtime)
+
+
+def save_overrides(overrides: Dict[int, dict], path: Path = OVERRIDES_FILE) -> None:
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({str(q_num): overrides[q_num] for q_num in sorted(overrides)}, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    tmp_path.replace(path)
+
+
+def touched_sources(override: dict) -> List[str]:
+    """The files an override changes"""
+    return [source for source, fields in SOURCE_FIELDS.items() if any(field in override for field in fields)]
+
+
+def patched_entry(entry: Optional[dict], override: dict, source: str) -> Optional[dict]:
+    """entry with the override's fields for source applied (entry itself if none apply)"""
+    fields = {target: override[field] for field, target in SOURCE_FIELDS[source].items() if field in override}
+    if not fields:
+        return entry
+    if entry is None and not REQUIRED_FIELDS[source] <= set(fields):
+        return None
+    return {**(entry or {}), **fields}
+
+
+def apply_overrides(data: Dict[str, dict], source: str, overrides: Optional[Dict[int, dict]] = None) -> Dict[str, dict]:
+    """data (keyed by question number strings, as in the files) with the overrides for source applied.
+
+    Only the overridden entries are replaced; everything else is shared with data.
+    """
+    overrides = load_overrides() if overrides is None else overrides
+    if source not in SOURCE_FIELDS or not overrides:
+        return data
+    patched = dict(data)
+    for q_num, override in overrides.items():
+        key = str(q_num)
+        entry = patched_entry(data.get(key), override, source)
+        if entry is not None:
+            patched[key] = entry
+    return patched
+
+
+def read_extracted(path: Path) -> Dict[str, dict]:
+    """One of the per-question JSON files as extracted, or {} if it doesn't exist"""
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_options(path: Path) -> Dict[str, dict]:
+    """One of the per-question JSON files with the overrides applied"""
+    return apply_overrides(read_extracted(path), Path(path).name)
+
+
+def read_sources() -> Dict[str, Dict[str, dict]]:
+    """{file name: extracted data} of every file the overrides apply to ({} if missing)"""
+    return {source: read_extracted(Path(source)) for source in SOURCE_FIELDS}
+
+
+def override_status(
+    extracted: Dict[str, Dict[str, dict]], overrides: Optional[Dict[int, dict]] = None,
+) -> List[dict]:
+    """State of every override against the extracted data of each file ({file name: data}).
+
+    One {'q_num', 'source', 'status', 'base', 'current'} per override and
+    file it touches (files without data are skipped), where status is:
+      ok         the extracted entry is the one the override was written against
+      redundant  the extracted entry already has the override's values
+      conflict   the extracted entry changed since the override was written
+      unbased    the override has no fingerprint for this file yet
+    """
+    overrides = load_overrides() if overrides is None else overrides
+    statuses = []
+    for q_num, override in sorted(overrides.items()):
+        for source in touched_sources(override):
+            data = extracted.get(source)
+            if not data:
+                continue
+            entry = data.get(str(q_num))
+            base = override.get('base', {}).get(source)
+            current = entry_fingerprint(entry)
+            if entry is not None and patched_entry(entry, override, source) == entry:
+                status = 'redundant'
+            elif base is None:
+                status = 'unbased'
+            elif base != current:
+                status = 'conflict'
+            else:
+                status = 'ok'
+            statuses.append({'q_num': q_num, 'source': source, 'status': status, 'base': base, 'current': current})
+    return statuses
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Extract CCSE questions, options and the solution key from the PDF text layer.
+
+The official PDF has a real text layer, so most questions can be segmented
+deterministically (question number, then options a/b/c) without any API
+call. Every question gets a confidence verdict; only the ones that fail it
+are left for the LLM path in extract_official_options.py.
+
+Requires pypdf (`pip install pypdf`).
+
+Usage:
+    python pdf_text_extract.py [ruta/al/pdf]
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # optional dependency, only needed for the local engine
+    PdfReader = None
+
+PDF_PATH = Path.home() / 'Downloads' / 'Preguntas ccse 2026.pdf'
+SOLUTIONS_OUTPUT = Path('official_solutions.json')
+
+# How many question numbers may be missing between two detected questions
+# before a numbered line is treated as body text (e.g. a year like "2010").
+MAX_SKIP = 3
+
+QUESTION_RE = re.compile(r'^(\d{4})\s*[.)]?\s+(\S.*)$')
+OPTION_RE = re.compile(r'^([a-c])\s*[.)]\s*(.*)$')
+SOLUTION_PAIR_RE = re.compile(r'\b(\d{4})\s*[.:)\-]?\s*([abc])\b')
+SOLUTION_HEADING_RE = re.compile(r'soluci[oó]n|respuestas correctas|clave de respuestas', re.IGNORECASE)
+PAGE_NUMBER_RE = re.compile(r'^(p[aá]gina\s*)?\d{1,3}(\s*(/|de)\s*\d{1,3})?$', re.IGNORECASE)
+TRUE_FALSE = {'verdadero', 'falso'}
+
+
+def read_pages(pdf_path: Path = PDF_PATH) -> List[str]:
+    """Return the text layer of every page"""
+    if PdfReader is None:
+        raise RuntimeError('pypdf no está instalado: pip install pypdf')
+    reader = PdfReader(str(pdf_path))
+    return [page.extract_text() or '' for page in reader.pages]
+
+
+def page_lines(pages: List[str]) -> List[List[str]]:
+    """Split pages into stripped lines, dropping page numbers and running headers/footers.
+
+    A line is page furniture if it is a bare page number or repeats on more
+    than half of the pages.
+    """
+    split = [[' '.join(line.split()) for line in page.splitlines()] for page in pages]
+    split = [[line for line in lines if line] for lines in split]
+    counts = Counter(line for lines in split for line in set(lines))
+    repeated = {line for line, n in counts.items() if len(pages) > 2 and n > len(pages) / 2}
+    return [
+        [line for line in lines if line not in repeated and not PAGE_NUMBER_RE.match(line)]
+        for lines in split
+    ]
+
+
+def join_text(parts: List[str]) -> str:
+    """Join wrapped lines, re-attaching words hyphenated across a line break"""
+    text = ''
+    for part in parts:
+        if text.endswith('-') and part[:1].islower():
+            text = text[:-1] + part
+        elif text.endswith('-') and part[:1].isupper():
+            # Compound like "Al-Ándalus" broken at its own hyphen
+            text += part
+        elif text:
+            text += ' ' + part
+        else:
+            text = part
+    return text.strip()
+
+
+def solution_pages(lines: List[List[str]]) -> List[int]:
+    """Indexes of the pages holding the solution key (from the first heading to the end)"""
+    for idx, page in enumerate(lines):
+        headed = any(SOLUTION_HEADING_RE.search(line) and len(line) < 60 for line in page[:5])
+        if headed and sum(len(SOLUTION_PAIR_RE.findall(line)) for line in page) >= 10:
+            return list(range(idx, len(lines)))
+    return []
+
+
+def parse_solution_key(lines: Iterable[str], expected_ids: Iterable[int]) -> Dict[int, str]:
+    """Parse "1001 a 1002 b ..." style solution tables into {question: label}"""
+    expected = set(expected_ids)
+    solutions: Dict[int, str] = {}
+    for line in lines:
+        for number, label in SOLUTION_PAIR_RE.findall(line):
+            q_num = int(number)
+            if q_num in expected:
+                solutions.setdefault(q_num, label)
+    return solutions
+
+
+def is_confident(record: Dict[str, object]) -> bool:
+    """True if a segmented question looks exactly like a well-formed PDF entry"""
+    options = record.get('options') or []
+    labels = [opt['label'] for opt in options]
+    if not record.get('question') or not all(opt['text'] for opt in options):
+        return False
+    if labels == ['a', 'b', 'c']:
+        return True
+    # Two-option questions are only the true/false ones
+    return labels == ['a', 'b'] and {opt['text'].rstrip('.').lower() for opt in options} == TRUE_FALSE
+
+
+def segment_questions(lines: Iterable[str], expected_ids: Iterable[int]) -> Dict[int, Dict[str, object]]:
+    """Segment the question pages into {question: {"question", "options"}}.
+
+    A numbered line only starts a question if its number is one of the next
+    MAX_SKIP expected ids, so years and other numbers that happen to start a
+    wrapped line stay part of the text.
+    """
+    order = sorted(expected_ids)
+    position = {q_num: idx for idx, q_num in enumerate(order)}
+    records: Dict[int, Dict[str, object]] = {}
+    next_idx = 0
+    current: Optional[int] = None
+    question_parts: List[str] = []
+    options: List[Tuple[str, List[str]]] = []
+
+    def flush() -> None:
+        if current is not None:
+            records[current] = {
+                'question': join_text(question_parts),
+                'options': [{'label': label, 'text': join_text(parts)} for label, parts in options],
+            }
+
+    for line in lines:
+        match = QUESTION_RE.match(line)
+        if match and int(match.group(1)) in position:
+            idx = position[int(match.group(1))]
+            if next_idx <= idx < next_idx + MAX_SKIP:
+                flush()
+                current = int(match.group(1))
+                next_idx = idx + 1
+                question_parts = [match.group(2)]
+                options = []
+                continue
+        if current is None:
+            continue
+        match = OPTION_RE.match(line)
+        if match:
+            options.append((match.group(1), [match.group(2)] if match.group(2) else []))
+        elif options:
+            options[-1][1].append(line)
+        else:
+            question_parts.append(line)
+    flush()
+    return records
+
+
+def extract_local(
+    pdf_path: Path = PDF_PATH, expected_ids: Iterable[int] = (),
+) -> Tuple[Dict[str, Dict[str, object]], List[int], Dict[int, str]]:
+    """Read the PDF once and return (confident records, low-confidence ids, solution key)"""
+    expected_ids = sorted(expected_ids)
+    lines = page_lines(read_pages(pdf_path))
+    key_pages = set(solution_pages(lines))
+    body = [line for idx, page in enumerate(lines) if idx not in key_pages for line in page]
+    key = [line for idx in sorted(key_pages) for line in lines[idx]]
+
+    segmented = segment_questions(body, expected_ids)
+    records = {str(n): rec for n, rec in segmented.items() if is_confident(rec)}
+    uncertain = [n for n in expected_ids if str(n) not in records]
+    return records, uncertain, parse_solution_key(key, expected_ids)
+
+
+def save_solutions(solutions: Dict[int, str], path: Path = SOLUTIONS_OUTPUT) -> None:
+    with open(path, 'w', encoding='utf-8') as fh:
+        json.dump({str(n): solutions[n] for n in sorted(solutions)}, fh, ensure_ascii=False, indent=2)
+
+
+def load_solutions(path: Path = SOLUTIONS_OUTPUT) -> Dict[int, str]:
+    """Parsed solution key, or {} if pdf_text_extract.py hasn't been run"""
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as fh:
+        return {int(n): label for n, label in json.load(fh).items()}
+
+
+def main() -> None:
+    from ccse_questions import questions
+
+    pdf_path = Path(sys.argv[1]) if len(sys.argv) > 1 else PDF_PATH
+    if not pdf_path.exists():
+        sys.exit(f'No se encuentra el PDF en {pdf_path}')
+
+    question_ids = sorted(questions.keys())
+    records, uncertain, solutions = extract_local(pdf_path, question_ids)
+    print(f'📄 {pdf_path.name}: {len(records)}/{len(question_ids)} preguntas extraídas del texto')
+    if uncertain:
+        print(f'⚠ {len(uncertain)} pregunta(s) con baja confianza (usar --engine llm): {uncertain}')
+    print(f'🔑 Clave de soluciones: {len(solutions)}/{len(question_ids)} respuestas')
+    if solutions:
+        save_solutions(solutions)
+        print(f'💾 Guardada en {SOLUTIONS_OUTPUT}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,14 @@
+// Written by generate_html.py: the files of the current build, precached by sw.js
+self.PRECACHE_MANIFEST = {
+  "version": "e751cd16be",
+  "assets": [
+    "./",
+    "./index.html",
+    "./manifest.json",
+    "./icons/icon-192.png",
+    "./icons/icon-512.png",
+    "./app.87e17bb362.css",
+    "./app.7c66bcac5c.js",
+    "./data.28803874dc.json"
+  ]
+};
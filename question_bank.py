@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Loader for the CCSE question bank stored in question_bank.sqlite.
+
+Each question is one row keyed by its number (the primary-key index makes a
+single lookup O(log n)) with a secondary index on the section, so tools can
+load one question, one section or the whole bank without parsing anything
+else. ccse_questions.py exposes the bank through lazy read-only mappings.
+
+The data file is edited by exporting it to JSON and importing it back:
+
+Usage:
+    python question_bank.py export question_bank.json
+    python question_bank.py import question_bank.json
+    python question_bank.py stats
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+
+BANK_FILE = Path(__file__).with_name('question_bank.sqlite')
+
+SCHEMA = """
+CREATE TABLE sections (
+    id INTEGER PRIMARY KEY,
+    es_title TEXT NOT NULL,
+    ru_title TEXT NOT NULL
+);
+CREATE TABLE questions (
+    q_num INTEGER PRIMARY KEY,
+    section INTEGER NOT NULL REFERENCES sections(id),
+    es_question TEXT NOT NULL,
+    es_answer TEXT NOT NULL,
+    ru_question TEXT NOT NULL,
+    ru_answer TEXT NOT NULL,
+    ru_options TEXT NOT NULL
+);
+CREATE INDEX questions_section ON questions(section);
+"""
+
+COLUMNS = 'q_num, section, es_question, es_answer, ru_question, ru_answer, ru_options'
+
+_conn = None
+_lock = threading.Lock()
+
+
+def _query(sql, params=()):
+    """Run a read query on the shared read-only connection"""
+    global _conn
+    with _lock:
+        if _conn is None:
+            _conn = sqlite3.connect(f'file:{BANK_FILE}?mode=ro', uri=True, check_same_thread=False)
+        return _conn.execute(sql, params).fetchall()
+
+
+def _record(row):
+    q_num, section, es_q, es_a, ru_q, ru_a, ru_options = row
+    return q_num, {
+        'section': section,
+        'question': es_q,
+        'answer': es_a,
+        'translation': {'question': ru_q, 'answer': ru_a, 'options': json.loads(ru_options)},
+    }
+
+
+def question_ids(section=None):
+    """Sorted question numbers, optionally of one section"""
+    if section is None:
+        rows = _query('SELECT q_num FROM questions ORDER BY q_num')
+    else:
+        rows = _query('SELECT q_num FROM questions WHERE section = ? ORDER BY q_num', (section,))
+    return [q_num for (q_num,) in rows]
+
+
+def load_question(q_num):
+    """Record of one question; raises KeyError if it isn't in the bank"""
+    if not isinstance(q_num, int):
+        raise KeyError(q_num)
+    rows = _query(f'SELECT {COLUMNS} FROM questions WHERE q_num = ?', (q_num,))
+    if not rows:
+        raise KeyError(q_num)
+    return _record(rows[0])[1]
+
+
+def load_section(section):
+    """{q_num: record} for one section"""
+    rows = _query(f'SELECT {COLUMNS} FROM questions WHERE section = ? ORDER BY q_num', (section,))
+    return dict(_record(row) for row in rows)
+
+
+def load_all():
+    """{q_num: record} for the whole bank"""
+    return dict(_record(row) for row in _query(f'SELECT {COLUMNS} FROM questions ORDER BY q_num'))
+
+
+def load_sections():
+    """{section: (spanish_title, russian_title)}"""
+    return {row[0]: (row[1], row[2]) for row in _query('SELECT id, es_title, ru_title FROM sections ORDER BY id')}
+
+
+class SectionRegistry:
+    """Which questions make up each section of the exam edition in the bank.
+
+    Question -> section lookups are a dict hit and every section's sorted
+    question list is precomputed, so nothing has to scan numeric ranges.
+    """
+
+    def __init__(self, memberships, titles):
+        self.titles = titles
+        self.section_of = {}
+        self.questions_by_section = {section: [] for section in titles}
+        for q_num, section in memberships:
+            self.section_of[q_num] = section
+            self.questions_by_section[section].append(q_num)
+
+    def section(self, q_num):
+        """Section of a question, or 0 if it isn't in the bank"""
+        return self.section_of.get(q_num, 0)
+
+    def all_questions(self):
+        return [q_num for nums in self.questions_by_section.values() for q_num in nums]
+
+    def bounds(self, section):
+        """(first, last) question number of a section"""
+        nums = self.questions_by_section[section]
+        return nums[0], nums[-1]
+
+
+@lru_cache(maxsize=None)
+def section_registry():
+    """The SectionRegistry of the bank, loaded once"""
+    return SectionRegistry(
+        _query('SELECT q_num, section FROM questions ORDER BY section, q_num'),
+        load_sections(),
+    )
+
+
+class LazyMapping(Mapping):
+    """Read-only mapping whose values are fetched from the bank on first access.
+
+    Single lookups load one row; iterating values() or items() loads the rest
+    in one query. Values are memoised either way.
+    """
+
+    def __init__(self, load_one, load_all, keys):
+        self._load_one = load_one
+        self._load_all = load_all
+        self._keys_fn = keys
+        self._keys = None
+        self._key_set = None
+        self._values = {}
+        self._complete = False
+
+    def _key_list(self):
+        if self._keys is None:
+            self._keys = self._keys_fn()
+            self._key_set = set(self._keys)
+        return self._keys
+
+    def _fill(self):
+        if not self._complete:
+            self._values.update(self._load_all())
+            self._complete = True
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            if self._complete:
+                raise
+        value = self._values[key] = self._load_one(key)
+        return value
+
+    def __iter__(self):
+        return iter(self._key_list())
+
+    def __len__(self):
+        return len(self._key_list())
+
+    def __contains__(self, key):
+        if key in self._values:
+            return True
+        self._key_list()
+        return key in self._key_set
+
+    def values(self):
+        self._fill()
+        return super().values()
+
+    def items(self):
+        self._fill()
+        return super().items()
+
+    def __repr__(self):
+        return f'<{type(self).__name__} of {len(self)} entries>'
+
+
+def bank_view(project):
+    """LazyMapping of q_num -> project(record)"""
+    return LazyMapping(
+        lambda q_num: project(load_question(q_num)),
+        lambda: {q_num: project(record) for q_num, record in load_all().items()},
+        question_ids,
+    )
+
+
+def write_bank(records, sections, path=BANK_FILE):
+    """Write a complete bank to path, replacing it atomically"""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    if tmp_path.exists():
+        tmp_path.unlink()
+    conn = sqlite3.connect(tmp_path)
+    conn.executescript(SCHEMA)
+    conn.executemany(
+        'INSERT INTO sections VALUES (?, ?, ?)',
+        [(int(section), titles[0], titles[1]) for section, titles in sorted(sections.items())],
+    )
+    conn.executemany(
+        f'INSERT INTO questions ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)',
+        [
+            (
+                int(q_num), record['section'], record['question'], record['answer'],
+                record['translation']['question'], record['translation']['answer'],
+                json.dumps(record['translation']['options'], ensure_ascii=False),
+            )
+            for q_num, record in sorted(records.items(), key=lambda item: int(item[0]))
+        ],
+    )
+    conn.commit()
+    conn.execute('VACUUM')
+    conn.close()
+    os.replace(tmp_path, path)
+    _reset()
+
+
+def _reset():
+    global _conn
+    with _lock:
+        if _conn is not None:
+            _conn.close()
+            _conn = None
+    section_registry.cache_clear()
+
+
+def update_translations(translations, path=BANK_FILE):
+    """Replace the Russian question/answer/options of the given questions"""
+    records = load_all()
+    for q_num, translation in translations.items():
+        records[int(q_num)]['translation'] = {
+            'question': translation['question'],
+            'answer': translation['answer'],
+            'options': translation['options'],
+        }
+    write_bank(records, load_sections(), path)
+
+
+def export_json(path):
+    data = {
+        'sections': {str(s): {'es': es, 'ru': ru} for s, (es, ru) in load_sections().items()},
+        'questions': {str(q_num): record for q_num, record in load_all().items()},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def import_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    sections = {int(s): (titles['es'], titles['ru']) for s, titles in data['sections'].items()}
+    records = data['questions']
+    for q_num, record in records.items():
+        if record['section'] not in sections:
+            sys.exit(f'Pregunta {q_num}: sección desconocida {record["section"]}')
+    write_bank(records, sections)
+    return len(records)
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    if command == 'export' and len(sys.argv) == 3:
+        export_json(sys.argv[2])
+        print(f'✅ Exportado {BANK_FILE.name} → {sys.argv[2]}')
+    elif command == 'import' and len(sys.argv) == 3:
+        total = import_json(sys.argv[2])
+        print(f'✅ Importadas {total} preguntas → {BANK_FILE.name}')
+    elif command == 'stats':
+        for section, (es_title, _) in load_sections().items():
+            print(f'{section}: {len(question_ids(section)):4d}  {es_title}')
+        print(f'Total: {len(question_ids())} preguntas')
+    else:
+        sys.exit(__doc__)
+
+
+if __name__ == '__main__':
+    main()
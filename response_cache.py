@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk cache for OpenAI responses.
+
+Entries are keyed by a SHA-256 of everything that determines the answer
+(model, prompt/messages, sampling parameters, attached file), so re-runs
+after partial failures or prompt tweaks to *other* questions cost zero
+tokens. Backed by SQLite with optional TTL and size-bounded LRU eviction.
+Usable from sync code (get/put) and asyncio code (aget/aput).
+
+Usage:
+    python response_cache.py stats
+    python response_cache.py evict
+    python response_cache.py clear
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_CACHE_FILE = Path('.llm_cache.sqlite')
+DEFAULT_MAX_ENTRIES = 20000
+
+
+def make_key(**parts) -> str:
+    """Stable hash of the request parts (model, messages, parameters, file...)"""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def chat_key(body, base_url=None) -> str:
+    """Key of a chat completion request body.
+
+    Requests sent to another server (base_url, e.g. batch_stub_server.py)
+    are keyed apart, so their replies never answer requests to the real API.
+    """
+    if base_url:
+        return make_key(endpoint='chat.completions', base_url=base_url, **body)
+    return make_key(endpoint='chat.completions', **body)
+
+
+def file_digest(path) -> str:
+    """SHA-256 of a file's content, for keying requests that attach that file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed response cache with TTL and LRU eviction"""
+
+    def __init__(self, path=DEFAULT_CACHE_FILE, ttl=None, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                ' key TEXT PRIMARY KEY,'
+                ' value TEXT NOT NULL,'
+                ' created REAL NOT NULL,'
+                ' accessed REAL NOT NULL)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)')
+        return self._conn
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired"""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute('SELECT value, created FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None or (self.ttl is not None and now - row[1] > self.ttl):
+                self.misses += 1
+                return None
+            conn.execute('UPDATE responses SET accessed = ? WHERE key = ?', (now, key))
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key, value):
+        """Store a JSON-serialisable value, evicting the least recently used entries if full"""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                'INSERT OR REPLACE INTO responses (key, value, created, accessed) VALUES (?, ?, ?, ?)',
+                (key, json.dumps(value, ensure_ascii=False), now, now),
+            )
+            self._evict(conn)
+
+    def _evict(self, conn):
+        if self.ttl is not None:
+            conn.execute('DELETE FROM responses WHERE created < ?', (time.time() - self.ttl,))
+        if self.max_entries is not None:
+            (count,) = conn.execute('SELECT COUNT(*) FROM responses').fetchone()
+            excess = count - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    'DELETE FROM responses WHERE key IN '
+                    '(SELECT key FROM responses ORDER BY accessed LIMIT ?)',
+                    (excess,),
+                )
+
+    def delete(self, key):
+        """Forget one entry, e.g. a cached reply that no longer validates"""
+        with self._lock:
+            self._connect().execute('DELETE FROM responses WHERE key = ?', (key,))
+
+    def evict(self):
+        """Drop expired entries and trim to max_entries"""
+        with self._lock:
+            self._evict(self._connect())
+
+    def clear(self):
+        with self._lock:
+            self._connect().execute('DELETE FROM responses')
+
+    def __len__(self):
+        with self._lock:
+            return self._connect().execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    async def aget(self, key):
+        return await asyncio.to_thread(self.get, key)
+
+    async def aput(self, key, value):
+        await asyncio.to_thread(self.put, key, value)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def main() -> None:
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    cache = ResponseCache()
+
+    if command == 'stats':
+        print(f'{cache.path}: {len(cache)} cached responses')
+    elif command == 'evict':
+        cache.evict()
+        print(f'{cache.path}: {len(cache)} cached responses after eviction')
+    elif command == 'clear':
+        cache.clear()
+        print(f'{cache.path}: cleared')
+    else:
+        sys.exit(__doc__)
+    cache.close()
+
+
+if __name__ == '__main__':
+    main()
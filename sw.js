@@ -1,4 +1,9 @@
-const CACHE_NAME = 'ccse-2026-v4';
+const CACHE_NAME = 'ccse-2026-v5';
+
+// precache-manifest.js is written by generate_html.py next to index.html and
+// lists the app shell plus the content-hashed app.css, app.js and data.json
+// of the current build. Without it (e.g. a --single-file build) only the
+// shell is precached.
 const STATIC_ASSETS = [
   './',
   './index.html',
@@ -6,6 +11,33 @@ const STATIC_ASSETS = [
   './icons/icon-192.png',
   './icons/icon-512.png'
 ];
+try {
+  importScripts('./precache-manifest.js');
+} catch (error) {
+  console.log('[SW] No precache manifest, caching the app shell only');
+}
+const PRECACHE_ASSETS = self.PRECACHE_MANIFEST ? self.PRECACHE_MANIFEST.assets : STATIC_ASSETS;
+
+// Hashed assets never change under the same name, so a cached copy is always current
+const HASHED_ASSET = /\/(app|data)\.[0-9a-f]{10}\.(css|js|json)$/;
+
+// The page and the manifests name the hashed assets of their build, so they
+// are fetched network-first: a stale cached page could reference assets the
+// activate step has already deleted
+const NETWORK_FIRST = /\/(index\.html|precache-manifest\.js|asset-manifest\.json)?$/;
+
+function networkFirst(request) {
+  return caches.open(CACHE_NAME).then(cache => {
+    return fetch(request)
+      .then(response => {
+        if (response.ok) {
+          cache.put(request, response.clone());
+        }
+        return response;
+      })
+      .catch(() => cache.match(request));
+  });
+}
 
 // Google Fonts URLs to cache
 const FONT_URLS = [
@@ -13,20 +45,28 @@ const FONT_URLS = [
   'https://fonts.googleapis.com/css2?family=Crimson+Pro:wght@400;600;700;900&family=Literata:opsz,wght@7..72,400;7..72,600;7..72,700&display=optional'
 ];
 
-// Install event - cache static assets
+// Install event - cache the shell and whichever hashed assets aren't cached yet,
+// so a content-only update downloads just the new data file
 self.addEventListener('install', event => {
   event.waitUntil(
     caches.open(CACHE_NAME)
-      .then(cache => {
-        console.log('[SW] Caching static assets');
-        return cache.addAll(STATIC_ASSETS);
-      })
+      .then(cache => Promise.all(
+        PRECACHE_ASSETS.map(url => HASHED_ASSET.test(url)
+          ? cache.match(url).then(cached => (cached ? null : url))
+          : url)
+      ).then(urls => {
+        const missing = urls.filter(Boolean);
+        console.log('[SW] Caching', missing.length, 'assets');
+        // Bypass the HTTP cache so the shell comes from the same build as the manifest
+        return cache.addAll(missing.map(url => new Request(url, { cache: 'reload' })));
+      }))
       .then(() => self.skipWaiting())
   );
 });
 
-// Activate event - clean up old caches
+// Activate event - clean up old caches and hashed assets of earlier builds
 self.addEventListener('activate', event => {
+  const current = new Set(PRECACHE_ASSETS.map(url => new URL(url, self.location.href).href));
   event.waitUntil(
     caches.keys().then(cacheNames => {
       return Promise.all(
@@ -37,7 +77,14 @@ self.addEventListener('activate', event => {
             return caches.delete(name);
           })
       );
-    }).then(() => self.clients.claim())
+    })
+      .then(() => caches.open(CACHE_NAME))
+      .then(cache => cache.keys().then(requests => Promise.all(
+        requests
+          .filter(request => HASHED_ASSET.test(new URL(request.url).pathname) && !current.has(request.url))
+          .map(request => cache.delete(request))
+      )))
+      .then(() => self.clients.claim())
   );
 });
 
@@ -47,20 +94,13 @@ self.addEventListener('fetch', event => {
 
   // Handle Google Fonts specially - cache with network-first strategy
   if (url.hostname === 'fonts.googleapis.com' || url.hostname === 'fonts.gstatic.com') {
-    event.respondWith(
-      caches.open(CACHE_NAME).then(cache => {
-        return fetch(event.request)
-          .then(response => {
-            if (response.ok) {
-              cache.put(event.request, response.clone());
-            }
-            return response;
-          })
-          .catch(() => {
-            return cache.match(event.request);
-          });
-      })
-    );
+    event.respondWith(networkFirst(event.request));
+    return;
+  }
+
+  // The page and the manifests: network-first, cached copy when offline
+  if (url.origin === self.location.origin && (event.request.mode === 'navigate' || NETWORK_FIRST.test(url.pathname))) {
+    event.respondWith(networkFirst(event.request));
     return;
   }
 
@@ -70,6 +110,9 @@ self.addEventListener('fetch', event => {
       caches.match(event.request)
         .then(cachedResponse => {
           if (cachedResponse) {
+            if (HASHED_ASSET.test(url.pathname)) {
+              return cachedResponse;
+            }
             // Return cached version, but also update cache in background
             event.waitUntil(
               fetch(event.request)
@@ -0,0 +1,63 @@
+"""Batch mode against batch_stub_server.py must leave the live cache and outputs alone."""
+
+import asyncio
+import json
+import sys
+import threading
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+pytest.importorskip('openai')
+pytest.importorskip('aiohttp')
+pytest.importorskip('dotenv')
+
+import generate_html  # noqa: E402
+from batch_backend import BatchBackend, output_path  # noqa: E402
+from batch_stub_server import StubHandler  # noqa: E402
+from response_cache import ResponseCache, chat_key  # noqa: E402
+
+QUESTIONS = {1001: ('España es…', 'una monarquía parlamentaria.')}
+TRANSLATIONS = {1001: {'question': 'Испания — это…', 'answer': 'парламентская монархия.'}}
+
+
+@pytest.fixture
+def stub_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/v1'
+    server.shutdown()
+    server.server_close()
+
+
+def test_chat_key_separates_servers():
+    body = {'model': 'gpt-4o-mini', 'messages': [{'role': 'user', 'content': 'hola'}]}
+    assert chat_key(body) != chat_key(body, 'http://127.0.0.1:8765/v1')
+    assert output_path('explanations.json') == Path('explanations.json')
+    assert output_path('explanations.json', 'http://127.0.0.1:8765/v1').name.startswith('explanations.')
+
+
+def test_stub_run_leaves_live_cache_and_explanations_unchanged(stub_url, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(generate_html, 'questions', QUESTIONS)
+    monkeypatch.setattr(generate_html, 'translations', TRANSLATIONS)
+    cache = ResponseCache(tmp_path / '.llm_cache.sqlite')
+    monkeypatch.setattr(generate_html, 'response_cache', cache)
+    Path(generate_html.EXPLANATIONS_FILE).write_text('{}', encoding='utf-8')
+
+    backend = BatchBackend(base_url=stub_url, poll_interval=0)
+    explanations = asyncio.run(generate_html.generate_all_explanations(backend))
+
+    assert explanations['1001'].startswith('[stub]')
+    assert json.loads(Path(generate_html.EXPLANATIONS_FILE).read_text(encoding='utf-8')) == {}
+    stub_file = output_path(generate_html.EXPLANATIONS_FILE, stub_url)
+    assert json.loads(stub_file.read_text(encoding='utf-8')) == explanations
+
+    payload = generate_html.explanation_payload(*QUESTIONS[1001], *TRANSLATIONS[1001].values())
+    assert cache.get(chat_key(payload)) is None
+    assert cache.get(chat_key(payload, stub_url)) == explanations['1001']
+    cache.close()
@@ -0,0 +1,43 @@
+"""write_bundle() output is a complete, servable copy of the app."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+
+pytest.importorskip('aiohttp')
+pytest.importorskip('dotenv')
+
+import generate_html as gh  # noqa: E402
+
+PAGE = {'head': '<!DOCTYPE html><html><head>', 'body': '', 'css': 'body {}', 'js': 'void 0;', 'data': {'q': 1}}
+
+
+def precache_assets(out_dir):
+    text = (out_dir / gh.PRECACHE_MANIFEST_FILE).read_text(encoding='utf-8')
+    return json.loads(text.split('self.PRECACHE_MANIFEST = ', 1)[1].rstrip().rstrip(';'))['assets']
+
+
+def test_out_dir_has_every_precached_file_and_the_service_worker(tmp_path):
+    out_dir = tmp_path / 'site'
+    manifest = gh.write_bundle(PAGE, out_dir)
+
+    assert (out_dir / 'sw.js').read_bytes() == (REPO / 'sw.js').read_bytes()
+    for url in precache_assets(out_dir):
+        path = out_dir / (url[2:] or 'index.html')
+        assert path.is_file(), f'{url} is precached but missing from {out_dir}'
+    assert json.loads((out_dir / gh.BUILD_MANIFEST_FILE).read_text(encoding='utf-8')) == manifest
+
+
+def test_committed_build_is_current(tmp_path, monkeypatch):
+    """The repo is served as is, so the committed page must match a fresh build"""
+    monkeypatch.chdir(REPO)
+    explanations = json.loads(Path(gh.EXPLANATIONS_FILE).read_text(encoding='utf-8'))
+    fresh = gh.write_bundle(gh.generate_html(explanations), tmp_path)
+    committed = json.loads((REPO / gh.BUILD_MANIFEST_FILE).read_text(encoding='utf-8'))
+    assert committed == fresh, 'rebuild with python generate_html.py and commit the output'
+    assert (REPO / 'index.html').read_bytes() == (tmp_path / 'index.html').read_bytes()
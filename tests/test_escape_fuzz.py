@@ -0,0 +1,635 @@
+"""
+Fuzz the paths that put question text into the generated page.
+
+Random question, option, explanation and section text (quotes, backslashes,
+</script>, HTML entities, RTL and bidi marks, line and paragraph separators,
+combining accents, emoji...) is pushed through:
+
+  data      script_json() inside single_file_page(): the parsed <script>
+            block must JSON-decode back to the same data
+  markup    every page function that builds innerHTML from that text, run
+            in node with the page's own escapeHtml(): renderCard(),
+            showTranslation(), the section headers of mountEntry(),
+            showQuizResults() and reviewQuizQuestions(). Their markup is
+            parsed back with html.parser; every text and data-label must
+            come out unchanged and no element the template doesn't make
+            may appear
+  match     find_correct_label() and ccse_verify's normalize(), is_similar()
+            and bounded_levenshtein() against their contracts
+
+Each case is generated from the seed and its number, so a failure
+reproduces with the same ESCAPE_FUZZ_SEED (and ESCAPE_FUZZ_CASES for more
+cases). The markup tests need node on PATH and are skipped without it.
+
+Running this file directly times the same paths on the real bank instead:
+    python tests/test_escape_fuzz.py [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+import time
+import unicodedata
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import pytest
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+
+pytest.importorskip('aiohttp')
+pytest.importorskip('dotenv')
+
+import ccse_verify  # noqa: E402
+import generate_html as gh  # noqa: E402
+
+SEED = int(os.environ.get('ESCAPE_FUZZ_SEED', '2026'))
+CASES = int(os.environ.get('ESCAPE_FUZZ_CASES', '300'))
+
+# Pieces that have broken (or could break) one of the escaping layers
+NASTY = [
+    '"', "'", '`', '\\', '\\"', "\\'", '\\n', '\\u003c', '</script>', '</SCRIPT >', '<script>', '<!--', '-->',
+    '<b>', '</div>', '<button', 'data-label="x"', '&', '&amp;', '&lt;', '&#39;', '&#x3C;', '&amp', '${x}', '{{', '}}',
+    '\n', '\t', '  ', '\u00a0', '\u2028', '\u2029', '\u200b', '\u200e', '\u200f', '\u202e', '\u2066', '\ufeff',
+    'ñ', 'Ñ', '¿', '¡', '…', 'é', 'e\u0301', 'ß', 'İ', 'Σ', 'ё', 'Жизнь', '日本', '😀', '👩\u200d👩\u200d👧', '.', ' .', '?',
+]
+WORDS = ['la', 'Constitución', 'española', 'de', '1978', 'Catalán', 'Gallego', 'Euskera', 'son', 'gratuitos']
+LABELS = ['a', 'b', 'c']
+
+# Elements each template creates; anything else came from the data
+CARD_TAGS = {'div', 'button', 'span'}
+TRANSLATION_TAGS = {'strong', 'br', 'span', 'em'}
+SECTION_TAGS = {'h2', 'p'}
+RESULTS_TAGS = {'div', 'h1', 'h3', 'p', 'svg', 'defs', 'lineargradient', 'stop', 'circle', 'button'}
+REVIEW_TAGS = {'div', 'h3'}
+
+# Page functions under test, and what they need from the rest of the page
+PAGE_FUNCTIONS = ('renderCard', 'showTranslation', 'mountEntry', 'showQuizResults', 'reviewQuizQuestions')
+NODE_PROGRAM = '''
+const input = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const questionData = input.questionData;
+const sectionTitles = input.sectionTitles || {};
+const t = key => key;
+const highlightMatches = () => {};
+const currentLanguage = 'es';
+const studyList = { pool: { section: [], question: [] } };
+let quizMode = null;
+let elements = {};
+const element = () => ({
+    innerHTML: '', dataset: {}, classList: { add() {}, remove() {} },
+    removeAttribute() {}, scrollIntoView() {},
+});
+const document = { getElementById: id => elements[id] || (elements[id] = element()), createElement: element, body: element() };
+const window = { getComputedStyle: () => ({}) };
+globalThis.setTimeout = () => {};
+console.log = () => {};
+const markupOf = (id, fn) => { elements = {}; fn(); return elements[id].innerHTML; };
+__SOURCE__
+__BODY__
+'''
+NODE_RENDER = '''
+process.stdout.write(JSON.stringify({
+    cards: input.numbers.map(qNum => renderCard(qNum)),
+    translations: input.numbers.map(qNum => markupOf('trans' + qNum, () => showTranslation(qNum))),
+    sections: input.sections.map(section => mountEntry({ type: 'section', section }).innerHTML),
+    results: input.quizzes.map(results => markupOf('resultsPage', () => {
+        quizMode = { results };
+        showQuizResults();
+    })),
+    reviews: input.quizzes.map(results => markupOf('questionReviewContainer', () => {
+        quizMode = { results };
+        reviewQuizQuestions();
+    })),
+}));
+'''
+NODE_BENCH = '''
+const time = fn => {
+    const start = process.hrtime.bigint();
+    for (let i = 0; i < input.repeat; i++) fn();
+    return Number(process.hrtime.bigint() - start) / input.repeat;
+};
+process.stdout.write(JSON.stringify({
+    escape: time(() => input.texts.forEach(escapeHtml)),
+    render: time(() => input.numbers.forEach(renderCard)),
+    translate: time(() => input.numbers.forEach(qNum => markupOf('trans' + qNum, () => showTranslation(qNum)))),
+}));
+'''
+
+needs_node = pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+
+
+# ==========================================
+# GENERATORS
+# ==========================================
+
+def random_char(rng: random.Random) -> str:
+    """Any assigned-or-not code point except controls and surrogates"""
+    while True:
+        char = chr(rng.randrange(0x20, 0x30000))
+        if unicodedata.category(char) not in ('Cc', 'Cs'):
+            return char
+
+
+def random_text(rng: random.Random, max_pieces: int = 8) -> str:
+    pieces = []
+    for _ in range(rng.randint(0, max_pieces)):
+        kind = rng.random()
+        if kind < 0.45:
+            pieces.append(rng.choice(NASTY))
+        elif kind < 0.75:
+            pieces.append(rng.choice(WORDS))
+        else:
+            pieces.append(random_char(rng))
+        if rng.random() < 0.4:
+            pieces.append(' ')
+    return ''.join(pieces)
+
+
+def random_card(rng: random.Random) -> dict:
+    """Card data shaped like card_data()'s, with adversarial text everywhere"""
+    count = rng.choice([2, 3, 3])
+    labels = LABELS[:count] if rng.random() < 0.8 else [random_text(rng, 2) for _ in range(count)]
+    return {
+        'q': random_text(rng),
+        'options': [{'label': label, 'text': random_text(rng)} for label in labels],
+        'correct': rng.choice(labels),
+        'ruQ': random_text(rng),
+        'ruOptions': [] if rng.random() < 0.1 else [{'label': label, 'text': random_text(rng)} for label in labels],
+        'explanation': random_text(rng, 20),
+    }
+
+
+def random_quiz(rng: random.Random, cards: dict, sections: List[str]) -> dict:
+    """quizMode.results shaped like finishQuiz()'s, over some of the cards"""
+    numbers = rng.sample(list(cards), rng.randint(1, min(5, len(cards))))
+    details = []
+    for q_num in numbers:
+        card = cards[q_num]
+        answer = rng.choice([opt['label'] for opt in card['options']] + [None, random_text(rng, 1)])
+        details.append({
+            'qNum': q_num, 'userAnswer': answer, 'correctLabel': card['correct'],
+            'isCorrect': answer == card['correct'],
+        })
+    correct = sum(detail['isCorrect'] for detail in details)
+    return {
+        'correct': correct, 'total': len(details), 'percentage': round(correct / len(details) * 100),
+        'passed': rng.random() < 0.5, 'timeTaken': '12:34', 'details': details,
+        'bySection': {section: {'correct': 1, 'total': 2} for section in rng.sample(sections, rng.randint(1, 3))},
+    }
+
+
+def swap_ascii_case(rng: random.Random, text: str) -> str:
+    return ''.join(c.swapcase() if c.isascii() and rng.random() < 0.5 else c for c in text)
+
+
+def case_rng(prop: str, case: int, seed: int = SEED) -> random.Random:
+    return random.Random(f'{seed}:{prop}:{case}')
+
+
+# ==========================================
+# PARSING
+# ==========================================
+
+class MarkupTree(HTMLParser):
+    """Elements of an HTML fragment as (tag, attrs, text), in the order they close"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.open = []
+        self.elements = []
+        self.tags = set()
+        self.text = []
+
+    def handle_starttag(self, tag, attrs):
+        self.tags.add(tag)
+        self.open.append((tag, dict(attrs), []))
+
+    def handle_endtag(self, tag):
+        # Void elements never close; drop them on the way to the matching tag
+        while self.open:
+            open_tag, attrs, parts = self.open.pop()
+            text = ''.join(parts)
+            if self.open:
+                self.open[-1][2].append(text)
+            if open_tag == tag:
+                self.elements.append((tag, attrs, text))
+                return
+
+    def handle_data(self, data):
+        self.text.append(data)
+        if self.open:
+            self.open[-1][2].append(data)
+
+    def by_class(self, name: str) -> List[tuple]:
+        return [element for element in self.elements if name in element[1].get('class', '').split()]
+
+    def by_tag(self, name: str) -> List[tuple]:
+        return [element for element in self.elements if element[0] == name]
+
+
+def parse_markup(markup: str) -> MarkupTree:
+    tree = MarkupTree()
+    tree.feed(markup)
+    tree.close()
+    return tree
+
+
+def js_function(js: str, name: str) -> str:
+    """Source of one top-level-style `function name(...) {...}` in the page script"""
+    start = js.index(f'function {name}(')
+    depth = 0
+    for end in range(js.index('{', start), len(js)):
+        if js[end] == '{':
+            depth += 1
+        elif js[end] == '}':
+            depth -= 1
+            if depth == 0:
+                return js[start:end + 1]
+    raise ValueError(f'unterminated function {name}')
+
+
+def page_source(js: str) -> str:
+    """escapeHtml() and the markup builders with the constants they use, ready for node"""
+    escapes = re.search(r'const HTML_ESCAPES = .*?;\n', js).group()
+    functions = ('escapeHtml',) + PAGE_FUNCTIONS
+    return escapes + '\n'.join(js_function(js, name) for name in functions)
+
+
+def run_node(source: str, body: str, payload: dict):
+    program = NODE_PROGRAM.replace('__SOURCE__', source).replace('__BODY__', body)
+    result = subprocess.run(
+        ['node', '-e', program], input=json.dumps(payload, ensure_ascii=False),
+        capture_output=True, text=True, encoding='utf-8',
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip())
+    return json.loads(result.stdout)
+
+
+def build_page(explanations: Optional[dict] = None) -> dict:
+    """The generator's page parts, without its progress output"""
+    with contextlib.chdir(REPO), contextlib.redirect_stdout(io.StringIO()):
+        return gh.generate_html(explanations or {})
+
+
+# ==========================================
+# EXPECTATIONS
+# ==========================================
+
+def same(problems: List[str], name: str, expected: str, got: str) -> None:
+    if expected.strip() != got.strip():
+        problems.append(f'{name}: {expected!r} rendered as {got!r}')
+
+
+def extra_tags(problems: List[str], tree: MarkupTree, allowed: set) -> None:
+    if not tree.tags <= allowed:
+        problems.append(f'unexpected elements {sorted(tree.tags - allowed)}')
+
+
+def card_failures(data: dict, markup: str) -> List[str]:
+    tree = parse_markup(markup)
+    problems = []
+    extra_tags(problems, tree, CARD_TAGS)
+    for tag, attrs, text in tree.by_class('question'):
+        same(problems, 'q', data['q'], text)
+    for tag, attrs, text in tree.by_class('question-ru'):
+        same(problems, 'ruQ', data['ruQ'], text)
+    for name, cls, options in (
+        ('option', 'option', data['options']),
+        ('print-option', 'print-option', data['options']),
+        ('ru-option', 'ru-option', data['ruOptions']),
+    ):
+        rendered = tree.by_class(cls)
+        if len(rendered) != len(options):
+            problems.append(f'{len(rendered)} .{cls} for {len(options)} options')
+            continue
+        for opt, (tag, attrs, text) in zip(options, rendered):
+            same(problems, name, f"{opt['label']}) {opt['text']}", text)
+            if cls == 'option' and attrs.get('data-label') != opt['label']:
+                problems.append(f"data-label {attrs.get('data-label')!r} for {opt['label']!r}")
+    return problems
+
+
+def translation_failures(data: dict, markup: str) -> List[str]:
+    """showTranslation() shows ruQ, each Russian option and the Spanish text of the correct one"""
+    tree = parse_markup(markup)
+    problems = []
+    extra_tags(problems, tree, TRANSLATION_TAGS)
+    es_texts = {opt['label']: opt['text'] for opt in data['options']}
+    expected = 'Вопрос: ' + data['ruQ']
+    spans = []
+    if data['ruOptions']:
+        expected += 'Варианты:'
+        for opt in data['ruOptions']:
+            is_correct = opt['label'] == data['correct']
+            spans.append(opt['text'] + (' ✓' if is_correct else ''))
+            expected += f"{opt['label']}) {spans[-1]}"
+            if is_correct and es_texts.get(opt['label']):
+                spans.append(f"({es_texts[opt['label']]})")
+                expected += f' {spans[-1]}'
+    else:
+        expected += 'Перевод вариантов пока недоступен'
+    if ''.join(tree.text) != expected:
+        problems.append(f"text {expected!r} rendered as {''.join(tree.text)!r}")
+    rendered = [text for tag, attrs, text in tree.by_tag('span')]
+    if rendered != spans:
+        problems.append(f'spans {spans!r} rendered as {rendered!r}')
+    return problems
+
+
+def section_failures(titles: List[str], markup: str) -> List[str]:
+    tree = parse_markup(markup)
+    problems = []
+    extra_tags(problems, tree, SECTION_TAGS)
+    rendered = [text for tag, attrs, text in tree.by_tag('h2')] + [text for tag, attrs, text in tree.by_class('section-ru')]
+    if rendered != titles:
+        problems.append(f'titles {titles!r} rendered as {rendered!r}')
+    return problems
+
+
+def results_failures(results: dict, section_titles: dict, markup: str) -> List[str]:
+    tree = parse_markup(markup)
+    problems = []
+    extra_tags(problems, tree, RESULTS_TAGS)
+    expected = [section_titles[section][0] for section in sorted(results['bySection'])]
+    rendered = [text for tag, attrs, text in tree.by_class('performance-label')]
+    if len(rendered) != len(expected):
+        problems.append(f'{len(rendered)} .performance-label for {len(expected)} sections')
+    for title, text in zip(expected, rendered):
+        same(problems, 'section', title, text)
+    return problems
+
+
+def review_failures(results: dict, cards: dict, markup: str) -> List[str]:
+    tree = parse_markup(markup)
+    problems = []
+    extra_tags(problems, tree, REVIEW_TAGS)
+
+    def option_text(q_num, label):
+        opt = next((opt for opt in cards[q_num]['options'] if opt['label'] == label), None)
+        return f"{opt['label']}) {opt['text']}" if opt else None
+
+    questions = tree.by_class('review-question')
+    answers = [text for tag, attrs, text in tree.by_class('review-answer')]
+    expected_answers = []
+    for detail in results['details']:
+        if detail['userAnswer']:
+            expected_answers.append(f"yourAnswer {option_text(detail['qNum'], detail['userAnswer']) or 'notAnswered'}")
+        else:
+            expected_answers.append('notAnswered')
+        if not detail['isCorrect']:
+            expected_answers.append(f"correctAnswer {option_text(detail['qNum'], detail['correctLabel']) or 'N/A'}")
+    if len(questions) != len(results['details']) or len(answers) != len(expected_answers):
+        return problems + [f'{len(questions)} questions and {len(answers)} answers rendered']
+    for detail, (tag, attrs, text) in zip(results['details'], questions):
+        same(problems, 'review question', cards[detail['qNum']]['q'], text)
+    for expected, text in zip(expected_answers, answers):
+        same(problems, 'review answer', expected, text)
+    return problems
+
+
+def report(failures: List[str]) -> str:
+    shown = '\n'.join(failures[:10])
+    return f'{len(failures)} failure(s), reproduce with ESCAPE_FUZZ_SEED={SEED} ESCAPE_FUZZ_CASES={CASES}:\n{shown}'
+
+
+# ==========================================
+# PROPERTIES
+# ==========================================
+
+@pytest.fixture(scope='module')
+def page():
+    return build_page()
+
+
+@pytest.fixture(scope='module')
+def rendered(page):
+    """Random cards, section titles and quizzes, and the markup node builds from them"""
+    cards = {str(1001 + case): random_card(case_rng('card', case)) for case in range(CASES)}
+    rng = case_rng('sections', 0)
+    section_titles = {str(section): [random_text(rng), random_text(rng)] for section in range(1, 6)}
+    quizzes = [random_quiz(case_rng('quiz', case), cards, list(section_titles)) for case in range(CASES // 5)]
+    markup = run_node(page_source(page['js']), NODE_RENDER, {
+        'questionData': cards, 'numbers': list(cards), 'sectionTitles': section_titles,
+        'sections': list(section_titles), 'quizzes': quizzes,
+    })
+    return {'cards': cards, 'sectionTitles': section_titles, 'quizzes': quizzes, 'markup': markup}
+
+
+def test_data_round_trips(page):
+    """Data embedded by single_file_page() parses back to the same value"""
+    failures = []
+    for case in range(CASES):
+        rng = case_rng('data', case)
+        data = {
+            'questionData': {str(1001 + i): random_card(rng) for i in range(rng.randint(1, 3))},
+            'sectionTitles': {'1': [random_text(rng), random_text(rng)]},
+        }
+        tree = parse_markup(gh.single_file_page({**page, 'data': data}))
+        scripts = tree.by_tag('script')
+        blocks = [text for tag, attrs, text in scripts if attrs.get('id') == 'appData']
+        if len(scripts) != 3 or len(blocks) != 1:
+            failures.append(f'caso {case}: {len(scripts)} <script> elements, {len(blocks)} #appData')
+        elif json.loads(blocks[0]) != data:
+            failures.append(f'caso {case}: JSON does not round-trip')
+    assert not failures, report(failures)
+
+
+@needs_node
+def test_cards_render_their_text(rendered):
+    failures = [
+        f'{q_num}: {problem}'
+        for (q_num, data), markup in zip(rendered['cards'].items(), rendered['markup']['cards'])
+        for problem in card_failures(data, markup)
+    ]
+    assert not failures, report(failures)
+
+
+@needs_node
+def test_translations_render_their_text(rendered):
+    failures = [
+        f'{q_num}: {problem}'
+        for (q_num, data), markup in zip(rendered['cards'].items(), rendered['markup']['translations'])
+        for problem in translation_failures(data, markup)
+    ]
+    assert not failures, report(failures)
+
+
+@needs_node
+def test_section_headers_render_their_titles(rendered):
+    failures = [
+        f'sección {section}: {problem}'
+        for (section, titles), markup in zip(rendered['sectionTitles'].items(), rendered['markup']['sections'])
+        for problem in section_failures(titles, markup)
+    ]
+    assert not failures, report(failures)
+
+
+@needs_node
+def test_quiz_results_and_review_render_their_text(rendered):
+    failures = []
+    for case, results in enumerate(rendered['quizzes']):
+        failures.extend(
+            f'examen {case}: {problem}'
+            for problem in results_failures(results, rendered['sectionTitles'], rendered['markup']['results'][case])
+            + review_failures(results, rendered['cards'], rendered['markup']['reviews'][case])
+        )
+    assert not failures, report(failures)
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Plain O(len(a) * len(b)) edit distance, the reference for bounded_levenshtein"""
+    previous = list(range(len(b) + 1))
+    for i, char in enumerate(a, 1):
+        current = [i]
+        for j, other in enumerate(b, 1):
+            current.append(min(previous[j - 1] + (char != other), previous[j] + 1, current[j - 1] + 1))
+        previous = current
+    return previous[-1]
+
+
+def mutate(rng: random.Random, text: str) -> str:
+    """text with a few random insertions, deletions and substitutions"""
+    chars = list(text)
+    for _ in range(rng.randint(0, 4)):
+        pos = rng.randint(0, len(chars))
+        action = rng.random()
+        if action < 0.4 or not chars:
+            chars.insert(pos, rng.choice(NASTY + WORDS))
+        elif action < 0.7:
+            del chars[min(pos, len(chars) - 1)]
+        else:
+            chars[min(pos, len(chars) - 1)] = random_char(rng)
+    return ''.join(chars)
+
+
+def match_failures(rng: random.Random) -> List[str]:
+    """find_correct_label() tolerates case, spacing and a final dot; normalize() keeps its contract"""
+    problems = []
+
+    def expect(condition, message):
+        if not condition:
+            problems.append(message)
+
+    a = random_text(rng)
+    b = mutate(rng, a) if rng.random() < 0.7 else random_text(rng)
+    options, seen = [], set()
+    for label in LABELS:
+        text = random_text(rng, 4)
+        if gh.normalize(text) and gh.normalize(text) not in seen:
+            seen.add(gh.normalize(text))
+            options.append({'label': label, 'text': text})
+    if options:
+        target = rng.choice(options)
+        answer = ' ' * rng.randint(0, 2) + swap_ascii_case(rng, target['text']).replace(' ', '  ', 1)
+        if answer == answer.rstrip() and rng.random() < 0.5:
+            answer += '.'
+        found = gh.find_correct_label(options, answer)
+        expect(found == target['label'], f"answer {answer!r} matched {found!r}, not {target['label']!r}")
+
+    na, nb = ccse_verify.normalize(a), ccse_verify.normalize(b)
+    expect(ccse_verify.normalize(''.join(list(a))) is na, 'equal texts normalize to different objects')
+    expect(na == na.strip() and na == na.lower(), f'{na!r} is not stripped and lowercase')
+    expect(not set(na) & set('¿¡?!.,;:-'), f'{na!r} keeps punctuation')
+    expect(ccse_verify.normalize(swap_ascii_case(rng, a) + '  ') == na, f'{a!r} depends on case or spacing')
+    expect(
+        ccse_verify.is_similar(a, b) == (ccse_verify.similarity(a, b) >= 0.8),
+        f'is_similar({a!r}, {b!r}) disagrees with similarity()',
+    )
+    limit = rng.randint(0, max(len(na), len(nb)))
+    expect(
+        ccse_verify.bounded_levenshtein(na, nb, limit) == min(levenshtein(na, nb), limit + 1),
+        f'bounded_levenshtein({na!r}, {nb!r}, {limit}) is wrong',
+    )
+    return problems
+
+
+def test_matching_keeps_its_contracts():
+    failures = [
+        f'caso {case}: {problem}'
+        for case in range(CASES)
+        for problem in match_failures(case_rng('match', case))
+    ]
+    assert not failures, report(failures)
+
+
+# ==========================================
+# BENCHMARK
+# ==========================================
+
+def best_time(fn: Callable[[], object], repeat: int) -> float:
+    """Fastest of repeat runs, in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(repeat: int) -> None:
+    explanations = {}
+    explanations_file = REPO / gh.EXPLANATIONS_FILE
+    if explanations_file.exists():
+        with open(explanations_file, 'r', encoding='utf-8') as f:
+            explanations = json.load(f)
+    page = build_page(explanations)
+    cards = page['data']['questionData']
+    texts = [
+        text for card in cards.values()
+        for text in [card['q'], card['ruQ'], card['explanation']]
+        + [opt['text'] for opt in card['options'] + card['ruOptions']]
+    ]
+    chars = sum(len(text) for text in texts)
+    print(f'📊 {len(cards)} tarjetas, {len(texts)} textos, {chars} caracteres\n')
+
+    payload = gh.script_json(page['data'])
+    elapsed = best_time(lambda: gh.script_json(page['data']), repeat)
+    print(f'⏱ script_json:        {elapsed * 1e3:8.2f} ms  ({len(payload.encode()) / elapsed / 1e6:.1f} MB/s)')
+
+    def cold_normalize():
+        ccse_verify.normalize.cache_clear()
+        for text in texts:
+            ccse_verify.normalize(text)
+
+    elapsed = best_time(cold_normalize, repeat)
+    print(f'⏱ normalize (fría):   {elapsed * 1e3:8.2f} ms  ({len(texts) / elapsed:,.0f} textos/s)')
+    elapsed = best_time(lambda: [ccse_verify.normalize(text) for text in texts], repeat)
+    print(f'⏱ normalize (caché):  {elapsed * 1e3:8.2f} ms  ({len(texts) / elapsed:,.0f} textos/s)')
+
+    answers = [(card['options'], card['options'][0]['text'] + '.') for card in cards.values() if card['options']]
+    elapsed = best_time(lambda: [gh.find_correct_label(options, answer) for options, answer in answers], repeat)
+    print(f'⏱ find_correct_label: {elapsed * 1e3:8.2f} ms  ({len(answers) / elapsed:,.0f} preguntas/s)')
+
+    if shutil.which('node') is None:
+        print('⚠ node no está instalado: se omiten escapeHtml, renderCard y showTranslation')
+        return
+    timings = run_node(page_source(page['js']), NODE_BENCH, {
+        'questionData': cards, 'numbers': list(cards), 'texts': texts, 'repeat': repeat,
+    })
+    print(f"⏱ escapeHtml (node):  {timings['escape'] / 1e6:8.2f} ms  ({chars / timings['escape'] * 1e3:.1f} MB/s)")
+    print(f"⏱ renderCard (node):  {timings['render'] / 1e6:8.2f} ms  ({len(cards) / timings['render'] * 1e9:,.0f} tarjetas/s)")
+    print(f"⏱ showTranslation:    {timings['translate'] / 1e6:8.2f} ms  ({len(cards) / timings['translate'] * 1e9:,.0f} tarjetas/s)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=20, help='benchmark repetitions (the best one counts)')
+    args = parser.parse_args(argv)
+    bench(args.repeat)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""The extracted option files are only read with overrides.json applied.
+
+official_options.json, official_options_raw.json and options_translations.json
+keep known-wrong extracted entries on purpose (see overrides.py), so any
+module that opens them itself would hand out wrong answers.
+"""
+
+import ast
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from overrides import SOURCE_FIELDS, load_options, override_status, read_extracted, read_sources  # noqa: E402
+
+REPO = Path(__file__).resolve().parent.parent
+DATA_FILES = set(SOURCE_FIELDS)
+# The only module besides overrides.py that may read a data file itself:
+# extraction resumes from its own checkpoint of the extracted entries
+RAW_READERS = {('extract_official_options.py', 'RAW_OUTPUT')}
+WRITE_MODES = set('wax')
+
+
+def modules():
+    return {path.name: ast.parse(path.read_text(encoding='utf-8')) for path in sorted(REPO.glob('*.py'))}
+
+
+def path_literal(node):
+    """'name.json' for "name.json" or Path("name.json"), else None"""
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == 'Path' and node.args:
+        node = node.args[0]
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def data_file_constants(trees):
+    """{module: {name: data file}} for module-level constants, including imported ones"""
+    own = {}
+    for name, tree in trees.items():
+        own[name] = {}
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                value = path_literal(node.value)
+                if value in DATA_FILES:
+                    own[name][node.targets[0].id] = value
+    constants = {}
+    for name, tree in trees.items():
+        constants[name] = dict(own[name])
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom) and f'{node.module}.py' in own:
+                for alias in node.names:
+                    if alias.name in own[f'{node.module}.py']:
+                        constants[name][alias.asname or alias.name] = own[f'{node.module}.py'][alias.name]
+    return constants
+
+
+def raw_reads(tree, constants):
+    """(name or literal, line) of every open()/Journal()/.open()/.read_text() on a data file"""
+    def target(node):
+        if isinstance(node, ast.Name) and node.id in constants:
+            return node.id
+        value = path_literal(node)
+        return value if value in DATA_FILES else None
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        if isinstance(func, ast.Name) and func.id in ('open', 'Journal') and node.args:
+            mode = node.args[1] if len(node.args) > 1 else next(
+                (kw.value for kw in node.keywords if kw.arg == 'mode'), None)
+            mode = mode.value if isinstance(mode, ast.Constant) else 'r'
+            if func.id == 'Journal' or not WRITE_MODES & set(mode):
+                name = target(node.args[0])
+                if name:
+                    yield name, node.lineno
+        elif isinstance(func, ast.Attribute) and func.attr in ('open', 'read_text', 'read_bytes'):
+            name = target(func.value)
+            if name:
+                yield name, node.lineno
+
+
+def test_data_files_are_only_read_through_overrides():
+    trees = modules()
+    constants = data_file_constants(trees)
+    offenders = [
+        f'{module}:{line} reads {name}'
+        for module, tree in trees.items() if module != 'overrides.py'
+        for name, line in raw_reads(tree, constants[module])
+        if (module, name) not in RAW_READERS
+    ]
+    assert not offenders, 'use overrides.load_options() instead: ' + '; '.join(offenders)
+
+
+def test_raw_reads_are_detected():
+    tree = ast.parse(
+        "import json\n"
+        "from pathlib import Path\n"
+        "FILE = Path('official_options_raw.json')\n"
+        "with open(FILE) as f: json.load(f)\n"
+        "with open('options_translations.json', 'r') as f: json.load(f)\n"
+        "FILE.read_text()\n"
+        "with open(FILE, 'w') as f: pass\n"
+    )
+    constants = data_file_constants({'m.py': tree})['m.py']
+    assert sorted(line for _, line in raw_reads(tree, constants)) == [4, 5, 6]
+
+
+def test_load_options_corrects_the_extracted_entries():
+    raw_file = REPO / 'official_options_raw.json'
+    extracted = read_extracted(raw_file)
+    corrected = load_options(raw_file)
+    assert extracted['1059']['question'] == extracted['1015']['question']
+    assert corrected['1059']['question'] == '¿Qué lengua cooficial se habla en las Islas Baleares?'
+    assert corrected['1015'] == extracted['1015']
+
+
+def test_committed_files_are_the_bases_of_the_overrides(monkeypatch):
+    monkeypatch.chdir(REPO)
+    statuses = override_status(read_sources())
+    assert statuses and all(status['status'] == 'ok' for status in statuses), statuses
@@ -0,0 +1,164 @@
+"""Fixture tests for the PDF text-layer extraction in pdf_text_extract.py.
+
+The official PDF isn't in the repo, so a small synthetic PDF with the same
+layout (numbered questions, a/b/c options, a solution key page) is built
+from raw bytes and read back through pypdf.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pdf_text_extract import (  # noqa: E402
+    QUESTION_RE, extract_local, is_confident, page_lines, parse_solution_key, segment_questions,
+    solution_pages,
+)
+
+IDS = list(range(1001, 1013))
+
+QUESTION_PAGE = [
+    '1001 España es...',
+    'a) una república federal.',
+    'b) una monarquía parlamentaria.',
+    'c) una dictadura.',
+    '1002. La Constitución española fue aprobada',
+    'en el año...',
+    'a) 1975.',
+    'b) 1978.',
+    'c) 1982.',
+    '1003 ¿En qué año se celebró la Exposición Universal de Sevilla, que siguió a la de',
+    '1888 en Barcelona?',
+    'a) 1992.',
+    'b) 1929.',
+    'c) 2010.',
+]
+KEY_PAGE = [
+    'Soluciones',
+    '1001 b 1002 b 1003 a 1004 c',
+    '1005 a 1006 b 1007 c 1008 a',
+    '1009 b 1010 c 1011 a 1012 b',
+]
+
+
+def pdf_string(text):
+    data = text.encode('latin-1')
+    return b'(' + data.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)') + b')'
+
+
+def build_pdf(pages):
+    """Minimal PDF with one line of Helvetica text per entry of each page"""
+    page_ids = [3 + 2 * idx for idx in range(len(pages))]
+    font_id = 3 + 2 * len(pages)
+    objects = {
+        1: b'<< /Type /Catalog /Pages 2 0 R >>',
+        2: b'<< /Type /Pages /Kids [' + b' '.join(b'%d 0 R' % n for n in page_ids)
+           + b'] /Count %d >>' % len(pages),
+        font_id: b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>',
+    }
+    for page_id, lines in zip(page_ids, pages):
+        ops = [b'BT /F1 11 Tf 14 TL 50 780 Td']
+        ops += [pdf_string(line) + b" '" for line in lines]
+        ops.append(b'ET')
+        stream = b'\n'.join(ops)
+        objects[page_id] = (b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+                            b'/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>' % (font_id, page_id + 1))
+        objects[page_id + 1] = b'<< /Length %d >>\nstream\n' % len(stream) + stream + b'\nendstream'
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = len(out)
+        out += b'%d 0 obj\n' % obj_id + objects[obj_id] + b'\nendobj\n'
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (font_id + 1)
+    out += b''.join(b'%010d 00000 n \n' % offsets[obj_id] for obj_id in range(1, font_id + 1))
+    out += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (font_id + 1, xref)
+    return bytes(out)
+
+
+@pytest.mark.parametrize('line, expected', [
+    ('1001 España es...', ('1001', 'España es...')),
+    ('1002. La Constitución', ('1002', 'La Constitución')),
+    ('1003) ¿Quién es?', ('1003', '¿Quién es?')),
+    ('1003.¿Quién es?', None),
+    ('2010', None),
+    ('101 pregunta', None),
+    ('a) 1978.', None),
+])
+def test_question_re(line, expected):
+    match = QUESTION_RE.match(line)
+    assert (match.groups() if match else None) == expected
+
+
+def test_segment_questions_keeps_years_in_the_text():
+    records = segment_questions(QUESTION_PAGE, IDS)
+    assert sorted(records) == [1001, 1002, 1003]
+    assert records[1002]['question'] == 'La Constitución española fue aprobada en el año...'
+    assert records[1003]['question'].endswith('que siguió a la de 1888 en Barcelona?')
+    assert [opt['text'] for opt in records[1003]['options']] == ['1992.', '1929.', '2010.']
+    assert all(is_confident(record) for record in records.values())
+
+
+def test_segment_questions_ignores_numbers_far_ahead():
+    lines = ['1001 ¿Cuántas comunidades autónomas hay?', '1010 no es una pregunta', 'a) 17.', 'b) 15.', 'c) 19.']
+    records = segment_questions(lines, IDS)
+    assert list(records) == [1001]
+    assert records[1001]['question'] == '¿Cuántas comunidades autónomas hay? 1010 no es una pregunta'
+
+
+def test_is_confident():
+    options = [{'label': label, 'text': 'x'} for label in 'abc']
+    assert is_confident({'question': 'q', 'options': options})
+    assert not is_confident({'question': 'q', 'options': options[:2]})
+    assert not is_confident({'question': '', 'options': options})
+    true_false = [{'label': 'a', 'text': 'Verdadero.'}, {'label': 'b', 'text': 'Falso'}]
+    assert is_confident({'question': 'q', 'options': true_false})
+
+
+def test_parse_solution_key():
+    solutions = parse_solution_key(KEY_PAGE + ['1001 c 9999 a'], IDS)
+    assert solutions == dict(zip(IDS, 'bbacabcabcab'))
+
+
+def test_solution_pages():
+    assert solution_pages([QUESTION_PAGE, KEY_PAGE]) == [1]
+    assert solution_pages([QUESTION_PAGE, KEY_PAGE[1:]]) == []
+
+
+def test_page_lines_drops_page_numbers():
+    assert page_lines(['1001 España es...\n 3 \nPágina 4 de 10\n']) == [['1001 España es...']]
+
+
+def test_extract_local_from_synthetic_pdf(tmp_path):
+    pytest.importorskip('pypdf')
+    pdf_path = tmp_path / 'ccse.pdf'
+    pdf_path.write_bytes(build_pdf([QUESTION_PAGE, KEY_PAGE]))
+
+    records, uncertain, solutions = extract_local(pdf_path, IDS)
+
+    assert sorted(records) == ['1001', '1002', '1003']
+    assert uncertain == IDS[3:]
+    assert records['1001']['options'][1] == {'label': 'b', 'text': 'una monarquía parlamentaria.'}
+    assert records['1003']['question'].endswith('1888 en Barcelona?')
+    assert solutions == dict(zip(IDS, 'bbacabcabcab'))
+
+
+def test_final_payload_warns_when_the_key_overrides_the_answer(capsys):
+    pytest.importorskip('openai')
+    pytest.importorskip('dotenv')
+    from extract_official_options import build_final_payload
+
+    raw = {'1001': {'question': 'España es...', 'options': [
+        {'label': 'a', 'text': 'una república federal.'},
+        {'label': 'b', 'text': 'una monarquía parlamentaria.'},
+        {'label': 'c', 'text': 'una dictadura.'},
+    ]}}
+    assert build_final_payload(raw, {1001: 'b'})['1001']['correct'] == 'b'
+    assert 'clave del PDF dice' not in capsys.readouterr().out
+
+    assert build_final_payload(raw, {1001: 'a'})['1001']['correct'] == 'a'
+    out = capsys.readouterr().out
+    assert "1001: la clave del PDF dice 'a' pero el texto de la respuesta coincide con 'b'" in out
@@ -1,6 +1,12 @@
 #!/usr/bin/env python3
-"""Translate all Spanish options to Russian using OpenAI API"""
+"""Translate all Spanish options to Russian using OpenAI API
 
+Reads official_options_raw.json and writes options_translations.json as
+extracted, without the corrections in overrides.json; readers get them
+applied through overrides.load_options.
+"""
+
+import argparse
 import json
 import time
 from pathlib import Path
@@ -8,13 +14,54 @@ from pathlib import Path
 from dotenv import load_dotenv
 from openai import OpenAI
 
+from overrides import read_extracted
+from response_cache import ResponseCache, chat_key
+
 INPUT_FILE = Path('official_options_raw.json')
 OUTPUT_FILE = Path('options_translations.json')
+BATCH_REQUEST_FILE = Path('translations_batch.jsonl')
+UNTRANSLATED = '[ERROR: sin traducir]'
+GROUP_SIZE = 5  # questions translated per request
 
+GROUP_SYSTEM_PROMPT = (
+    'You are a translator. Translate Spanish to Russian accurately and concisely. '
+    'You receive a JSON array of objects with "id" and "text". Reply with ONLY a JSON array '
+    'of the same length, in the same order, with the same "id" values and the Russian '
+    'translation in "text". No comments or code fences.'
+)
 
-def translate_option(client: OpenAI, text: str) -> str:
-    """Translate single Spanish option to Russian"""
-    response = client.chat.completions.create(
+response_cache = ResponseCache()
+
+
+def cached_chat_completion(client: OpenAI, validate=None, base_url=None, **request) -> str:
+    """Run a chat completion, answering repeated requests from the response cache.
+
+    If given, validate(content) runs before caching so a malformed reply is
+    raised instead of being cached, and on every cache hit: a cached reply
+    that fails it is evicted and requested again. Pass the client's
+    base_url when it talks to another server than the OpenAI API.
+    """
+    key = chat_key(request, base_url)
+    cached = response_cache.get(key)
+    if cached is not None:
+        if validate is None:
+            return cached
+        try:
+            validate(cached)
+            return cached
+        except ValueError:
+            response_cache.delete(key)
+    response = client.chat.completions.create(**request)
+    content = response.choices[0].message.content.strip()
+    if validate is not None:
+        validate(content)
+    response_cache.put(key, content)
+    return content
+
+
+def translation_request(text: str) -> dict:
+    """Chat completion request translating a single Spanish option to Russian"""
+    return dict(
         model='gpt-4o-mini',
         messages=[
             {
@@ -25,63 +72,200 @@ def translate_option(client: OpenAI, text: str) -> str:
         ],
         temperature=0.3,
     )
-    return response.choices[0].message.content.strip()
+
+
+def translate_option(client: OpenAI, text: str, base_url=None) -> str:
+    """Translate single Spanish option to Russian"""
+    return cached_chat_completion(client, base_url=base_url, **translation_request(text))
+
+
+def group_items(group: list) -> list:
+    """Flatten [(q_num, data), ...] into [{"id": "<q_num>:<label>", "text": ...}, ...]"""
+    return [
+        {'id': f"{q_num}:{option['label']}", 'text': option['text']}
+        for q_num, data in group
+        for option in data['options']
+    ]
+
+
+def group_translation_request(items: list) -> dict:
+    """Chat completion request translating a list of options in one prompt"""
+    return dict(
+        model='gpt-4o-mini',
+        messages=[
+            {'role': 'system', 'content': GROUP_SYSTEM_PROMPT},
+            {'role': 'user', 'content': json.dumps(items, ensure_ascii=False)},
+        ],
+        temperature=0.3,
+    )
+
+
+def parse_group_translation(content: str, items: list) -> dict:
+    """Validate a grouped reply and return {id: russian text}.
+
+    Raises ValueError unless the reply is a JSON array with exactly the
+    requested ids, in order, each with non-empty text.
+    """
+    text = content.strip()
+    if text.startswith('```'):
+        text = text.strip('`')
+        if text.startswith('json'):
+            text = text[4:]
+    reply = json.loads(text)
+    if not isinstance(reply, list) or len(reply) != len(items):
+        raise ValueError(f'expected a JSON array of {len(items)} items')
+
+    translated = {}
+    for item, entry in zip(items, reply):
+        if not isinstance(entry, dict) or entry.get('id') != item['id']:
+            raise ValueError(f"expected id {item['id']}, got {entry!r}"[:120])
+        ru_text = str(entry.get('text', '')).strip()
+        if not ru_text:
+            raise ValueError(f"empty translation for {item['id']}")
+        translated[item['id']] = ru_text
+    return translated
+
+
+def assemble_translations(group: list, translated: dict) -> dict:
+    """Build {q_num: {"options": [...]}} from {id: russian text}"""
+    result = {}
+    for q_num, data in group:
+        translated_options = []
+        for option in data['options']:
+            ru_text = translated.get(f"{q_num}:{option['label']}")
+            if not ru_text:
+                print(f'⚠ Sin traducción para {q_num} opción {option["label"]}')
+            translated_options.append({'label': option['label'], 'text': ru_text or UNTRANSLATED})
+        result[q_num] = {'options': translated_options}
+    return result
+
+
+def translate_items_individually(client: OpenAI, items: list, base_url=None) -> dict:
+    """Per-option fallback for items a grouped request failed to translate"""
+    translated = {}
+    for item in items:
+        try:
+            translated[item['id']] = translate_option(client, item['text'], base_url)
+        except Exception as e:
+            print(f"\n⚠ Error traduciendo opción {item['id']}: {e}")
+    return translated
+
+
+def translate_group(client: OpenAI, group: list) -> dict:
+    """Translate all options of several questions in one request, falling back per option"""
+    items = group_items(group)
+    try:
+        content = cached_chat_completion(
+            client,
+            validate=lambda reply: parse_group_translation(reply, items),
+            **group_translation_request(items),
+        )
+        translated = parse_group_translation(content, items)
+    except Exception as e:
+        print(f'\n⚠ Traducción agrupada fallida ({e}); traduciendo opción por opción... ', end='', flush=True)
+        translated = translate_items_individually(client, items)
+    return assemble_translations(group, translated)
+
+
+def sorted_groups(official_data: dict, group_size: int) -> list:
+    """Split questions (in numeric order) into groups of group_size"""
+    ordered = sorted(official_data.items(), key=lambda x: int(x[0]))
+    return [ordered[i:i + group_size] for i in range(0, len(ordered), group_size)]
+
+
+def translate_batch(official_data: dict, group_size: int, base_url: str = None) -> dict:
+    """Translate every option as one Batch API job of grouped requests"""
+    from batch_backend import BatchBackend
+
+    groups = sorted_groups(official_data, group_size)
+    group_ids = {f'group-{idx}': group_items(group) for idx, group in enumerate(groups)}
+    requests = {custom_id: group_translation_request(items) for custom_id, items in group_ids.items()}
+
+    backend = BatchBackend(base_url=base_url)
+    results = backend.run(requests, BATCH_REQUEST_FILE, cache=response_cache,
+                          description='CCSE option translations',
+                          validate=lambda custom_id, reply: parse_group_translation(reply, group_ids[custom_id]))
+
+    translations = {}
+    for idx, group in enumerate(groups):
+        items = group_items(group)
+        try:
+            translated = parse_group_translation(results.get(f'group-{idx}') or '', items)
+        except ValueError as e:
+            print(f'⚠ Grupo {idx} inválido ({e}); traduciendo opción por opción')
+            translated = translate_items_individually(backend.client, items, base_url)
+        translations.update(assemble_translations(group, translated))
+    return translations
+
+
+def translate_live(official_data: dict, group_size: int) -> dict:
+    """Translate options group by group, saving after every group"""
+    client = OpenAI()
+    translations = {}
+    groups = sorted_groups(official_data, group_size)
+    total = len(official_data)
+
+    for idx, group in enumerate(groups, 1):
+        numbers = ', '.join(q_num for q_num, _ in group)
+        print(f'[{idx}/{len(groups)}] Preguntas {numbers}: Traduciendo opciones... ', end='', flush=True)
+
+        misses_before = response_cache.misses
+        translations.update(translate_group(client, group))
+        print(f'✓ ({len(translations)}/{total})')
+
+        # Save incrementally after every group
+        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+            json.dump(translations, f, ensure_ascii=False, indent=2)
+
+        # Small delay to avoid rate limits (not needed when answered from cache)
+        if response_cache.misses > misses_before:
+            time.sleep(0.2)
+
+    return translations
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--batch', action='store_true', help='submit all translations as one Batch API job')
+    parser.add_argument('--batch-base-url',
+                        help='API base URL for batch mode (e.g. batch_stub_server.py); '
+                             'its translations go to a separate file')
+    parser.add_argument('--group-size', type=int, default=GROUP_SIZE,
+                        help=f'questions translated per request (default {GROUP_SIZE})')
+    args = parser.parse_args()
+
     print('=' * 60)
     print('  Traducción de Opciones - CCSE 2026')
     print('=' * 60 + '\n')
 
     load_dotenv(Path.cwd().parent / 'exocortex' / '.env')
-    client = OpenAI()
 
     if not INPUT_FILE.exists():
         print(f'❌ Error: {INPUT_FILE} no encontrado')
         print('Ejecuta primero extract_official_options.py')
         return
 
-    with open(INPUT_FILE, 'r', encoding='utf-8') as f:
-        official_data = json.load(f)
+    # Translate the entries as extracted: OUTPUT_FILE is the base that the
+    # overrides' fingerprints point to, and they carry their own ru_options
+    official_data = read_extracted(INPUT_FILE)
 
     print(f'📄 Cargadas {len(official_data)} preguntas de {INPUT_FILE}')
     print(f'📊 Total de opciones a traducir: {len(official_data) * 3}\n')
 
-    translations = {}
-    total = len(official_data)
     start_time = time.time()
 
-    for idx, (q_num, data) in enumerate(
-        sorted(official_data.items(), key=lambda x: int(x[0])), 1
-    ):
-        print(f'[{idx}/{total}] Pregunta {q_num}: Traduciendo opciones... ', end='', flush=True)
-
-        translated_options = []
-        for option in data['options']:
-            try:
-                ru_text = translate_option(client, option['text'])
-                translated_options.append({'label': option['label'], 'text': ru_text})
-            except Exception as e:
-                print(f'\n⚠ Error traduciendo opción {option["label"]}: {e}')
-                translated_options.append(
-                    {'label': option['label'], 'text': '[ERROR: sin traducir]'}
-                )
-
-        translations[q_num] = {'options': translated_options}
-        print('✓')
-
-        # Save incrementally every 10 questions
-        if idx % 10 == 0:
-            with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-                json.dump(translations, f, ensure_ascii=False, indent=2)
-
-        # Small delay to avoid rate limits
-        time.sleep(0.2)
+    output_file = OUTPUT_FILE
+    if args.batch:
+        from batch_backend import output_path
+        output_file = output_path(OUTPUT_FILE, args.batch_base_url)
+        translations = translate_batch(official_data, args.group_size, args.batch_base_url)
+    else:
+        translations = translate_live(official_data, args.group_size)
 
     elapsed = time.time() - start_time
 
-    print(f'\n💾 Guardando traducciones en {OUTPUT_FILE}... ', end='', flush=True)
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+    print(f'\n💾 Guardando traducciones en {output_file}... ', end='', flush=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(translations, f, ensure_ascii=False, indent=2)
     print('✓')
 